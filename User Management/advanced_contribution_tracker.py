@@ -7,7 +7,7 @@ This script provides comprehensive tracking of GitHub contributions with enhance
 1. **Data Sources:**
    - GitHub GraphQL API for detailed contribution data
    - REST API fallback for repository-level analysis
-   - Smart caching system with 24-hour expiry
+   - Smart caching system with 24-hour expiry and ETag revalidation
 
 2. **Time Range Support:**
    - Last N days tracking (default: 30 days)
@@ -23,7 +23,7 @@ This script provides comprehensive tracking of GitHub contributions with enhance
 
 4. **Features:**
    - Real-time progress bar with user feedback
-   - File-based caching for improved performance
+   - SQLite response cache (or legacy pickle files) for improved performance
    - Comprehensive error handling with status meanings
    - Dynamic leaderboard (top 100 or all users)
    - CSV export with detailed metrics
@@ -47,22 +47,209 @@ Usage Examples:
 import os
 import json
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
 import csv
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from joblib import Memory
-import time
 import sys
 import hashlib
-import pickle
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from cache_backend import CACHE_BACKENDS, create_cache_backend
+from contribution_store import (CONTRIBUTION_STORE_FILE, MUTABLE_DAYS, ContributionStore,
+                                DailyCounts, days_between, group_date_ranges)
+from github_transport import GitHubTransport, HTTP_POOL_SIZE, HTTP_TIMEOUT
+from http_archive import RecordingTransport, ReplayTransport
+from metrics_exporter import add_metrics_arguments, start_metrics_export
+from rate_limit import RateLimitGovernor, RATE_LIMIT_MAX_RETRIES, REQUESTS_PER_HOUR
+from request_fingerprint import (CACHE_TIME_GRANULARITY, CacheStats, canonical_params, endpoint_label,
+                                 request_fingerprint)
+from run_journal import (MAX_USER_ATTEMPTS, RUN_COMPLETED, RUN_INCOMPLETE, RUN_INTERRUPTED,
+                         RUN_JOURNAL_FILE, RunJournal)
+from run_profile import (PHASE_CACHE_LOAD, PHASE_CACHE_SAVE, PHASE_CSV, PHASE_SCORING, PHASE_TRACK_ALL_USERS,
+                         RunProfiler, print_profile, profiled)
+from vectorized_scoring import score_metrics_list
 
 # Configuration Constants
 ORG_NAME = os.getenv('GITHUB_ORG', 'statisticsnorway')  # GitHub organization name from env variable
 ORG_NAME_2 = os.getenv('GITHUB_ORG_2')  # Optional second organization
-CACHE_DIR = "CACHE"            # Directory for file-based cache storage
+GITHUB_COM_API_URL = 'https://api.github.com'
+API_URL = os.getenv('GITHUB_API_URL', GITHUB_COM_API_URL).rstrip('/')  # REST base URL (e.g. github_simulator.py)
+GRAPHQL_URL = os.getenv('GITHUB_GRAPHQL_URL', f'{API_URL}/graphql')      # GraphQL endpoint
+CONFIG_FILE = os.getenv('TRACKER_CONFIG')  # Optional users/teams/scoring file instead of the repository config.json
+CACHE_DIR = "CACHE"            # Directory for cache storage
+CACHE_BACKEND = "sqlite"       # Cache backend: "sqlite" (single file) or "pickle" (legacy)
 CACHE_EXPIRY_HOURS = 24        # Cache expiry time in hours
-memory = Memory(CACHE_DIR, verbose=0)  # Legacy joblib memory (kept for compatibility)
+CACHE_REVALIDATE_DAYS = 7      # Stale REST entries with ETag/Last-Modified kept for revalidation
+DEFAULT_WORKERS = 4            # Users tracked concurrently by track_all_users
+PAGINATION_WORKERS = 4         # Pages fetched concurrently once the last page is known
+
+
+def __getattr__(name: str):
+    """Legacy joblib ``memory`` (kept for compatibility), created on first use
+    so importing the module does not create CACHE/"""
+    global memory
+    if name == 'memory':
+        memory = Memory(CACHE_DIR, verbose=0)
+        return memory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# GraphQL batching limits
+GRAPHQL_BATCH_SIZE = 20        # Users packed into one aliased GraphQL query
+GRAPHQL_MAX_BATCH_SIZE = 50    # Hard cap to stay well inside GitHub's query timeout
+GRAPHQL_NODE_LIMIT = 500000    # GitHub's maximum node count per query
+GRAPHQL_NODES_PER_USER = 150   # Upper bound of nodes requested per user selection
+
+# Query cost and remaining GraphQL points, fed to the rate-limit governor
+RATE_LIMIT_FRAGMENT = """
+        fragment RateLimitInfo on RateLimit {
+          cost
+          remaining
+          resetAt
+        }
+        """
+
+# Pull request fields read by the scoring (newest first, cursor-paginated)
+PULL_REQUEST_PAGE_FRAGMENT = """
+        fragment PullRequestPage on PullRequestConnection {
+          pageInfo {
+            hasNextPage
+            endCursor
+          }
+          nodes {
+            state
+            createdAt
+            comments {
+              totalCount
+            }
+          }
+        }
+        """
+
+# Per-day contribution events for the incremental store. Connections already
+# exhausted are skipped with @include while the others keep paging.
+DAILY_CONTRIBUTIONS_QUERY = """
+        query($username: String!, $from: DateTime!, $to: DateTime!, $prCursor: String, $reviewCursor: String,
+              $withCommits: Boolean!, $withPRs: Boolean!, $withReviews: Boolean!) {
+          rateLimit {
+            ...RateLimitInfo
+          }
+          user(login: $username) {
+            contributionsCollection(from: $from, to: $to) {
+              commitContributionsByRepository(maxRepositories: 100) @include(if: $withCommits) {
+                contributions(first: 100) {
+                  nodes {
+                    occurredAt
+                    commitCount
+                  }
+                }
+              }
+              pullRequestContributions(first: 100, after: $prCursor) @include(if: $withPRs) {
+                pageInfo {
+                  hasNextPage
+                  endCursor
+                }
+                nodes {
+                  occurredAt
+                  pullRequest {
+                    state
+                    comments {
+                      totalCount
+                    }
+                  }
+                }
+              }
+              pullRequestReviewContributions(first: 100, after: $reviewCursor) @include(if: $withReviews) {
+                pageInfo {
+                  hasNextPage
+                  endCursor
+                }
+                nodes {
+                  occurredAt
+                }
+              }
+            }
+          }
+        }
+        """ + RATE_LIMIT_FRAGMENT
+
+# Fields fetched for every tracked user (shared by single and batched queries)
+USER_CONTRIBUTIONS_FRAGMENT = """
+        fragment UserContributions on User {
+          contributionsCollection(from: $from) {
+            totalCommitContributions
+            totalPullRequestContributions
+            totalPullRequestReviewContributions
+            commitContributionsByRepository {
+              repository {
+                name
+                owner {
+                  login
+                }
+              }
+              contributions {
+                totalCount
+              }
+            }
+            pullRequestContributionsByRepository {
+              repository {
+                name
+                owner {
+                  login
+                }
+              }
+              contributions {
+                totalCount
+              }
+            }
+          }
+          pullRequests(first: 100, states: [MERGED, OPEN, CLOSED], orderBy: {field: CREATED_AT, direction: DESC}) {
+            ...PullRequestPage
+          }
+        }
+        """ + PULL_REQUEST_PAGE_FRAGMENT
+
+# Single-user contributions query and its pull request follow-up pages
+USER_CONTRIBUTIONS_QUERY = """
+        query($username: String!, $from: DateTime!) {
+          rateLimit {
+            ...RateLimitInfo
+          }
+          user(login: $username) {
+            ...UserContributions
+          }
+        }
+        """ + USER_CONTRIBUTIONS_FRAGMENT + RATE_LIMIT_FRAGMENT
+
+PULL_REQUESTS_PAGE_QUERY = """
+        query($username: String!, $cursor: String!) {
+          rateLimit {
+            ...RateLimitInfo
+          }
+          user(login: $username) {
+            pullRequests(first: 100, after: $cursor, states: [MERGED, OPEN, CLOSED], orderBy: {field: CREATED_AT, direction: DESC}) {
+              ...PullRequestPage
+            }
+          }
+        }
+        """ + PULL_REQUEST_PAGE_FRAGMENT + RATE_LIMIT_FRAGMENT
+
+# REST fallback: a repository's pull requests, newest first so paging stops at
+# the window start (the listing has no author filter)
+REPOSITORY_PULLS_PARAMS = {'state': 'all', 'sort': 'created', 'direction': 'desc'}
+
+
+class FetchError(Exception):
+    """A request that should have returned data could not be completed
+    
+    Raised for connection errors, server errors (5xx) and rate limits that
+    outlast the retries, so the user being tracked is reported as failed
+    (and retried on resume) instead of being scored from empty data. Client
+    errors such as 404 still mean "no data" and return an empty result.
+    """
 
 @dataclass
 class ContributionMetrics:
@@ -99,23 +286,259 @@ class ContributionMetrics:
     total_score: float = 0.0      # Sum of all gamification scores
     rank: int = 0                 # Position in leaderboard
 
-class AdvancedContributionTracker:
+# Leaderboard CSV columns
+RESULT_FIELDS = ['rank', 'username', 'full_name', 'total_score',
+                 'commits_count', 'commits_score',
+                 'prs_opened', 'prs_merged', 'pr_merge_rate', 'pr_score',
+                 'reviews_given', 'review_comments', 'reviews_score',
+                 'collaboration_score', 'consistency_score']
+
+# Raw counts persisted per run; scores are derived from these alone
+RAW_COUNT_FIELDS = ['username', 'full_name', 'commits_count', 'prs_opened', 'prs_merged',
+                    'reviews_given', 'review_comments']
+
+@dataclass
+class ScoringConfig:
+    """Gamification scoring parameters (overridable via the 'scoring' section of config.json)"""
+    commit_points: float = 2             # Points per commit
+    commit_cap: float = 100              # Maximum commit points
+    pr_points: float = 5                 # Points per PR opened
+    merge_rate_bonus: float = 20         # Points for a 100% merge rate
+    review_points: float = 3             # Points per review given
+    review_comment_points: float = 1     # Points per review comment
+    active_reviewer_threshold: int = 5   # Reviews above which the active reviewer bonus applies
+    active_reviewer_bonus: float = 10
+    detailed_feedback_threshold: int = 20  # Comments above which the detailed feedback bonus applies
+    detailed_feedback_bonus: float = 15
+    well_rounded_bonus: float = 10       # Bonus for opening PRs and reviewing
+    consistency_points: float = 8        # Points per active contribution type
+    
+    @classmethod
+    def from_dict(cls, values: Dict) -> 'ScoringConfig':
+        """Build a config from a dict, ignoring (and reporting) unknown keys"""
+        known = {field.name for field in fields(cls)}
+        unknown = sorted(set(values) - known)
+        if unknown:
+            print(f"Warning: Unknown scoring settings ignored: {', '.join(unknown)}")
+        return cls(**{key: value for key, value in values.items() if key in known})
+
+@dataclass
+class TrackingWindow:
+    """One leaderboard period of a multi-window (--windows) run"""
+    name: str                  # Window spec as given, e.g. "30d" or "Q"
+    start_date: datetime
+    end_date: datetime
+    period: str                # Human readable period for output
+    filename_suffix: str       # Period part of the output file names
+
+class ContributionScorer:
+    """Scoring, ranking and leaderboard output for already fetched counts.
+    
+    Needs no token, network access, cache or store, so saved counts can be
+    re-scored without touching anything on disk. AdvancedContributionTracker
+    builds on it.
+    """
+    
+    def __init__(self, scoring: ScoringConfig = None):
+        """Initialize the scorer with ``scoring``, or the config.json scoring settings"""
+        self.profiler = RunProfiler()  # Disabled unless --profile
+        self.scoring = scoring if scoring is not None else self.load_scoring_config()
+    
+    def get_config_path(self) -> str:
+        """Path of config.json (the repository root, unless TRACKER_CONFIG is set)"""
+        if CONFIG_FILE:
+            return CONFIG_FILE
+        # Get the parent directory (root of the project)
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        root_dir = os.path.dirname(script_dir)
+        return os.path.join(root_dir, 'config.json')
+    
+    def load_scoring_config(self, config_path: str = None) -> ScoringConfig:
+        """Load scoring parameters from the 'scoring' section of config.json
+        
+        Args:
+            config_path: Alternative JSON file, either with a 'scoring' section
+                or holding the scoring settings at the top level
+        """
+        if config_path is None:
+            config_path = self.get_config_path()
+            if not os.path.exists(config_path):
+                return ScoringConfig()
+        
+        with open(config_path, 'r') as f:
+            config = json.load(f)
+        return ScoringConfig.from_dict(config.get('scoring', config if 'users' not in config else {}))
+    
+    @profiled(PHASE_SCORING)
+    def calculate_gamification_scores(self, metrics: ContributionMetrics) -> ContributionMetrics:
+        """Calculate gamification scores for different contribution types"""
+        scoring = self.scoring
+        
+        # Commit scoring (quality over quantity)
+        metrics.commits_score = min(metrics.commits_count * scoring.commit_points, scoring.commit_cap)
+        
+        # PR scoring (merge rate matters)
+        if metrics.prs_opened > 0:
+            metrics.pr_merge_rate = metrics.prs_merged / metrics.prs_opened
+            metrics.pr_score = (metrics.prs_opened * scoring.pr_points) + (metrics.pr_merge_rate * scoring.merge_rate_bonus)
+        else:
+            metrics.pr_merge_rate = 0.0
+            metrics.pr_score = 0.0
+        
+        # Review scoring (helping others is valuable)
+        metrics.reviews_score = (metrics.reviews_given * scoring.review_points) + (metrics.review_comments * scoring.review_comment_points)
+        
+        # Collaboration score (cross-repository engagement bonus)
+        # Award additional points for diverse collaboration beyond basic reviews
+        collaboration_bonus = 0
+        if metrics.reviews_given > scoring.active_reviewer_threshold:  # Active reviewer bonus
+            collaboration_bonus += scoring.active_reviewer_bonus
+        if metrics.review_comments > scoring.detailed_feedback_threshold:  # Detailed feedback bonus
+            collaboration_bonus += scoring.detailed_feedback_bonus
+        if metrics.prs_opened > 0 and metrics.reviews_given > 0:  # Well-rounded contributor
+            collaboration_bonus += scoring.well_rounded_bonus
+        metrics.collaboration_score = collaboration_bonus
+        
+        # Consistency score (independent of other metrics to avoid double counting)
+        # Award points for balanced activity across different contribution types
+        activity_types = sum([
+            1 if metrics.commits_count > 0 else 0,
+            1 if metrics.prs_opened > 0 else 0,
+            1 if metrics.reviews_given > 0 else 0
+        ])
+        metrics.consistency_score = activity_types * scoring.consistency_points  # Up to 3 types
+        
+        # Total gamification score (no double counting)
+        metrics.total_score = (
+            metrics.commits_score +
+            metrics.pr_score +
+            metrics.reviews_score +
+            metrics.collaboration_score +
+            metrics.consistency_score
+        )
+        
+        return metrics
+    
+    def assign_ranks(self, metrics_list: List[ContributionMetrics]) -> List[ContributionMetrics]:
+        """Sort by total score and assign ranks (stable sort keeps config order for ties)"""
+        metrics_list.sort(key=lambda x: x.total_score, reverse=True)
+        for i, metrics in enumerate(metrics_list):
+            metrics.rank = i + 1
+        return metrics_list
+    
+    @profiled(PHASE_CSV)
+    def save_results(self, metrics_list: List[ContributionMetrics], filename: str = None):
+        """Save results to CSV file"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"advanced_contributions_{timestamp}.csv"
+        
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            self.write_results_csv(metrics_list, f)
+        
+        print(f"Results saved to {filename}")
+        return filename
+    
+    def write_results_csv(self, metrics_list: List[ContributionMetrics], f):
+        """Write the leaderboard CSV rows to an open text file"""
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        
+        for metrics in metrics_list:
+            row = asdict(metrics)
+            writer.writerow(row)
+    
+    @profiled(PHASE_CSV)
+    def save_raw_counts(self, metrics_list: List[ContributionMetrics], filename: str) -> str:
+        """Save the raw per-user counts that scores are computed from"""
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=RAW_COUNT_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            for metrics in metrics_list:
+                writer.writerow(asdict(metrics))
+        
+        print(f"Raw counts saved to {filename}")
+        return filename
+    
+    def load_raw_counts(self, filename: str) -> List[ContributionMetrics]:
+        """Load raw per-user counts from a raw counts or results CSV (no scoring)"""
+        with open(filename, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            missing = [field for field in RAW_COUNT_FIELDS if field not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"{filename} is missing columns: {', '.join(missing)}")
+            
+            return [
+                ContributionMetrics(
+                    username=row['username'],
+                    full_name=row['full_name'],
+                    commits_count=int(row['commits_count']),
+                    prs_opened=int(row['prs_opened']),
+                    prs_merged=int(row['prs_merged']),
+                    reviews_given=int(row['reviews_given']),
+                    review_comments=int(row['review_comments'])
+                )
+                for row in reader
+            ]
+    
+    @profiled(PHASE_SCORING)
+    def rescore(self, metrics_list: List[ContributionMetrics]) -> List[ContributionMetrics]:
+        """Apply the current scoring config to already fetched counts and re-rank
+        
+        Uses the vectorized scorer, which matches ``calculate_gamification_scores``
+        exactly but scores the whole list in a few array operations.
+        """
+        return score_metrics_list(metrics_list, self.scoring)
+    
+    def print_leaderboard(self, metrics_list: List[ContributionMetrics]):
+        """Print a formatted leaderboard"""
+        total_users = len(metrics_list)
+        top_n = min(100, total_users)  # Show max 100 or all users if less than 100
+        
+        print(f"\n🏆 GitHub Contribution Leaderboard (Top {top_n} of {total_users})")
+        print("=" * 100)
+        print(f"{'Rank':<4} {'Name':<30} {'Score':<8} {'Commits':<8} {'PRs':<6} {'Reviews':<8}")
+        print("-" * 100)
+        
+        for metrics in metrics_list[:top_n]:
+            # Truncate long names for display
+            display_name = metrics.full_name[:29] if len(metrics.full_name) > 29 else metrics.full_name
+            print(f"{metrics.rank:<4} {display_name:<30} {metrics.total_score:<8.1f} "
+                  f"{metrics.commits_count:<8} {metrics.prs_opened:<6} {metrics.reviews_given:<8}")
+        
+        scoring = self.scoring
+        bonuses = (scoring.active_reviewer_bonus, scoring.detailed_feedback_bonus, scoring.well_rounded_bonus)
+        print("\n📊 Scoring Breakdown:")
+        print(f"• Commits: {scoring.commit_points:g} points each (max {scoring.commit_cap:g})")
+        print(f"• PRs: {scoring.pr_points:g} points + up to {scoring.merge_rate_bonus:g} bonus for high merge rate")
+        print(f"• Reviews: {scoring.review_points:g} points each + {scoring.review_comment_points:g} per comment")
+        print(f"• Collaboration: Bonus points for active reviewing ({min(bonuses):g}-{sum(bonuses):g} points)")
+        print(f"• Consistency: {scoring.consistency_points:g} points per contribution type (max {scoring.consistency_points * 3:g})")
+
+class AdvancedContributionTracker(ContributionScorer):
     """Main class for tracking GitHub contributions with caching and gamification.
     
     This class handles:
     - GitHub API interactions (GraphQL and REST)
-    - File-based caching system
+    - Response caching through a pluggable cache backend
     - User contribution analysis
     - Gamification scoring
     - Progress tracking and error handling
     """
     
-    def __init__(self, token: str):
+    def __init__(self, token: str, pool_size: int = HTTP_POOL_SIZE, timeout=HTTP_TIMEOUT,
+                 requests_per_hour: float = REQUESTS_PER_HOUR, cache_backend: str = CACHE_BACKEND):
         """Initialize tracker with GitHub token and set up API headers.
         
         Args:
             token: GitHub personal access token with repo permissions
+            pool_size: Number of keep-alive connections kept to the GitHub API
+            timeout: Per-request timeout, seconds or a (connect, read) tuple
+            requests_per_hour: Cap on the core REST request rate for all worker threads
+            cache_backend: Name of the response cache backend ("sqlite" or "pickle")
         """
+        # Scoring parameters, applied to raw counts after fetching or on --rescore
+        super().__init__()
         self.token = token
         self.headers = {
             'Authorization': f'token {token}',
@@ -125,16 +548,36 @@ class AdvancedContributionTracker:
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json'
         }
-        self.base_url = 'https://api.github.com'
-        self.graphql_url = 'https://api.github.com/graphql'
+        self.base_url = API_URL
+        self.graphql_url = GRAPHQL_URL
+        
+        # Shared keep-alive transport for every REST, GraphQL and search call,
+        # scheduled by one rate-limit governor across all worker threads
+        self.governor = RateLimitGovernor(requests_per_hour, documented_limits=API_URL == GITHUB_COM_API_URL)
+        self.transport = GitHubTransport(pool_size=pool_size, timeout=timeout, governor=self.governor,
+                                         profiler=self.profiler)
         
         # Set up organizations to track
         self.organizations = [ORG_NAME]
         if ORG_NAME_2:
             self.organizations.append(ORG_NAME_2)
         
-        # Ensure cache directory exists
+        # Ensure cache directory exists and open the response cache
         os.makedirs(CACHE_DIR, exist_ok=True)
+        self.cache = create_cache_backend(cache_backend, CACHE_DIR, CACHE_EXPIRY_HOURS * 3600)
+        
+        # Canonical cache keys: window starts are quantized so repeated runs share entries
+        self.cache_granularity = CACHE_TIME_GRANULARITY
+        self.cache_stats = CacheStats()
+        
+        # Per-day contribution buckets used by incremental runs
+        self.contribution_store = ContributionStore(os.path.join(CACHE_DIR, CONTRIBUTION_STORE_FILE))
+        
+        # Per-user progress of tracking runs, used by --resume
+        self.journal = RunJournal(os.path.join(CACHE_DIR, RUN_JOURNAL_FILE))
+        
+        # User counts of the current track_all_users call (exported by --metrics-*)
+        self.run_summary = {'users_configured': 0, 'users_tracked': 0, 'users_failed': 0}
     
     def get_quarter_dates(self, year: int, quarter: int) -> Tuple[datetime, datetime]:
         """Calculate start and end dates for a specific quarter.
@@ -166,42 +609,77 @@ class AdvancedContributionTracker:
         
         return start, end
     
+    def get_tracking_windows(self, spec: str, now: datetime = None) -> List[TrackingWindow]:
+        """Parse a --windows spec such as "7d,30d,90d,Q" into tracking windows
+        
+        ``Nd`` is the last N days, ``Q`` the current quarter and ``Q1-2025``
+        a specific quarter. All windows share one ``now``.
+        
+        Raises:
+            ValueError: If a window is not in one of these formats
+        """
+        now = now or datetime.now()
+        windows = []
+        for name in (part.strip() for part in spec.split(',')):
+            if not name:
+                continue
+            if name.lower().endswith('d') and name[:-1].isdigit():
+                days = int(name[:-1])
+                windows.append(TrackingWindow(name, now - timedelta(days=days), now,
+                                              f"Last {days} days", f"{days}days"))
+            elif name.upper() == 'Q':
+                quarter = (now.month - 1) // 3 + 1
+                start, end = self.get_quarter_dates(now.year, quarter)
+                windows.append(TrackingWindow(name, start, min(end, now), f"Q{quarter} {now.year}",
+                                              f"Q{quarter}_{now.year}"))
+            elif name.upper().startswith('Q') and '-' in name:
+                quarter_str, year_str = name.split('-')
+                quarter, year = int(quarter_str[1:]), int(year_str)
+                start, end = self.get_quarter_dates(year, quarter)
+                windows.append(TrackingWindow(name, start, min(end, now), f"Q{quarter} {year}",
+                                              f"Q{quarter}_{year}"))
+            else:
+                raise ValueError(f"Invalid window '{name}'. Use 7d, 30d, Q or Q1-2025")
+        if not windows:
+            raise ValueError("No windows given")
+        return windows
+    
     def get_cache_key(self, *args) -> str:
         """Generate a cache key from arguments"""
         key_string = "_".join(str(arg) for arg in args)
         return hashlib.md5(key_string.encode()).hexdigest()
     
-    def get_cache_file_path(self, cache_key: str) -> str:
-        """Get the file path for a cache key"""
-        return os.path.join(CACHE_DIR, f"{cache_key}.pkl")
-    
-    def is_cache_valid(self, cache_file: str) -> bool:
-        """Check if cache file exists and is not expired"""
-        if not os.path.exists(cache_file):
-            return False
+    def canonical_request(self, kind: str, target: str, params: Optional[Dict]) -> Tuple[str, Optional[Dict]]:
+        """Cache key and the params to actually send, with window starts quantized
         
-        file_time = datetime.fromtimestamp(os.path.getmtime(cache_file))
-        expiry_time = datetime.now() - timedelta(hours=CACHE_EXPIRY_HOURS)
-        return file_time > expiry_time
+        Args:
+            kind: Request kind ("graphql", "rest" or "rest_page")
+            target: GraphQL query text or REST endpoint
+        """
+        params = canonical_params(params, self.cache_granularity)
+        return request_fingerprint(kind, target, params), params
     
-    def load_from_cache(self, cache_key: str):
-        """Load data from cache file"""
-        cache_file = self.get_cache_file_path(cache_key)
-        if self.is_cache_valid(cache_file):
-            try:
-                with open(cache_file, 'rb') as f:
-                    return pickle.load(f)
-            except Exception:
-                # If cache is corrupted, remove it
-                os.remove(cache_file)
-        return None
-    
-    def save_to_cache(self, cache_key: str, data):
-        """Save data to cache file"""
-        cache_file = self.get_cache_file_path(cache_key)
+    def load_from_cache(self, cache_key: str, endpoint: str = None):
+        """Load fresh data from the cache backend, counting the lookup under ``endpoint``"""
+        with self.profiler.phase(PHASE_CACHE_LOAD):
+            entry = self.cache.get_entry(cache_key)
+        data = entry.data if entry is not None and entry.is_fresh else None
+        if endpoint:
+            self.cache_stats.record(endpoint, 'miss' if data is None else 'hit')
+            self.profiler.record_cache(endpoint, 'hit' if data is not None else 'expired' if entry else 'miss')
+        return data
+    
+    def save_to_cache(self, cache_key: str, data, endpoint_class: str = 'default',
+                      etag: str = None, last_modified: str = None):
+        """Save data to the cache backend under an endpoint class
+        
+        ``etag``/``last_modified`` are the response validators used to
+        revalidate the entry with a conditional request once it goes stale.
+        """
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(data, f)
+            with self.profiler.phase(PHASE_CACHE_SAVE):
+                self.cache.put(cache_key, data, endpoint_class, CACHE_EXPIRY_HOURS * 3600,
+                               etag=etag, last_modified=last_modified)
         except Exception as e:
             print(f"Warning: Could not save to cache: {e}")
     
@@ -232,14 +710,11 @@ class AdvancedContributionTracker:
         # Clear line and print progress
         sys.stdout.write(f'\r[{bar}] {percentage:5.1f}% ({current:3d}/{total}) {display_name} ({username})')
         sys.stdout.flush()
-        
+    
     def load_users_config(self) -> Dict[str, str]:
         """Load user configuration from config.json"""
         try:
-            # Get the parent directory (root of the project)
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            root_dir = os.path.dirname(script_dir)
-            config_path = os.path.join(root_dir, 'config.json')
+            config_path = self.get_config_path()
             
             with open(config_path, 'r') as f:
                 config = json.load(f)
@@ -249,115 +724,233 @@ class AdvancedContributionTracker:
             return {}
     
     def make_graphql_request(self, query: str, variables: Dict = None) -> Dict:
-        """Make a GraphQL request with file-based caching"""
-        # Create cache key from query and variables
-        cache_key = self.get_cache_key("graphql", query, str(variables) if variables else "none")
+        """Make a GraphQL request with response caching"""
+        # Canonical cache key from query and variables
+        cache_key, variables = self.canonical_request('graphql', query, variables)
         
         # Try to load from cache first
-        cached_data = self.load_from_cache(cache_key)
+        cached_data = self.load_from_cache(cache_key, 'graphql')
         if cached_data is not None:
             return cached_data
         
         payload = {'query': query}
         if variables:
             payload['variables'] = variables
+        
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            try:
+                response = self.transport.post(
+                    self.graphql_url,
+                    headers=self.graphql_headers,
+                    json=payload,
+                    resource='graphql'
+                )
+            except requests.RequestException as e:
+                raise FetchError(f"GraphQL request failed: {e}") from e
             
-        response = requests.post(
-            self.graphql_url,
-            headers=self.graphql_headers,
-            json=payload
-        )
+            data, delay = self.read_graphql_response(response)
+            if delay is None:
+                break
+            if attempt == RATE_LIMIT_MAX_RETRIES:
+                raise FetchError(f"GraphQL request failed: still rate limited after {RATE_LIMIT_MAX_RETRIES} retries")
+            print(f"\n⏳ GraphQL rate limit reached, pausing {delay:.0f}s...")
+            self.governor.pause('graphql', delay)
         
         if response.status_code == 200:
-            data = response.json()
             # Save to cache
-            self.save_to_cache(cache_key, data)
+            self.save_to_cache(cache_key, data, 'graphql')
             return data
-        else:
-            error_meaning = self.get_status_code_meaning(response.status_code)
-            print(f"GraphQL request failed: {response.status_code} ({error_meaning})")
-            return {}
+        return self.read_failed_response('GraphQL', response)
+    
+    def read_graphql_response(self, response) -> Tuple[Optional[Dict], Optional[float]]:
+        """Parse a GraphQL response and pass its rate-limit data to the governor
+        
+        Shared by the sync and async request paths.
+        
+        Returns:
+            Tuple of (body of a 200 response or None, seconds to wait before
+            retrying, or None when no retry is needed)
+        """
+        data = response.json() if response.status_code == 200 else None
+        delay = self.governor.retry_delay('graphql', response)
+        if data is not None:
+            self.governor.observe_graphql((data.get('data') or {}).get('rateLimit'))
+            if any(error.get('type') == 'RATE_LIMITED' for error in data.get('errors') or []):
+                delay = self.governor.graphql_reset_delay()
+        return data, delay
+    
+    def read_rest_response(self, response, include_links: bool):
+        """Body of a 200 REST response; pages carry their Link targets as {rel: url}"""
+        data = response.json()
+        if include_links:
+            data = {
+                'items': data,
+                'links': {rel: link['url'] for rel, link in response.links.items()}
+            }
+        return data
+    
+    def read_failed_response(self, api: str, response, endpoint: str = None) -> Dict:
+        """Handle a non-200 response: FetchError on 5xx, otherwise an empty result"""
+        error_meaning = self.get_status_code_meaning(response.status_code)
+        if response.status_code >= 500:
+            target = f"{endpoint}: " if endpoint else ""
+            raise FetchError(f"{api} request failed: {target}{response.status_code} ({error_meaning})")
+        print(f"{api} request failed: {response.status_code} ({error_meaning})")
+        return {}
+    
+    def get_endpoint_class(self, endpoint: str) -> str:
+        """Classify a REST endpoint for cache bookkeeping"""
+        return 'search' if endpoint.startswith('search/') else 'rest'
     
     def make_rest_request(self, endpoint: str, params: Dict = None) -> Dict:
-        """Make a REST API request with file-based caching"""
-        # Create cache key from endpoint and params
-        cache_key = self.get_cache_key("rest", endpoint, str(params) if params else "none")
+        """Make a REST API request with response caching
+        
+        Stale entries that carry an ETag or Last-Modified validator are
+        revalidated with a conditional request; a 304 Not Modified response
+        (which GitHub does not count against the rate limit) just refreshes
+        the entry's timestamp.
+        """
+        return self._rest_request(endpoint, params, include_links=False)
+    
+    def make_rest_page_request(self, endpoint: str, params: Dict = None) -> Tuple[Any, Dict[str, str]]:
+        """Fetch one page of a REST listing along with its Link header targets
+        
+        Returns:
+            Tuple of (page body, {rel: url}) where rel is e.g. 'next' or 'last'
+        """
+        page = self._rest_request(endpoint, params, include_links=True)
+        if not page:
+            return [], {}
+        return page['items'], page['links']
+    
+    def _rest_request(self, endpoint: str, params: Optional[Dict], include_links: bool):
+        """Shared REST implementation; pages are cached together with their links"""
+        # Canonical cache key from endpoint and params
+        cache_key, params = self.canonical_request('rest_page' if include_links else 'rest', endpoint, params)
+        stats_endpoint = endpoint_label(endpoint)
+        endpoint_class = self.get_endpoint_class(endpoint)
         
         # Try to load from cache first
-        cached_data = self.load_from_cache(cache_key)
-        if cached_data is not None:
-            return cached_data
+        with self.profiler.phase(PHASE_CACHE_LOAD):
+            cached_entry = self.cache.get_entry(cache_key)
+        if cached_entry is not None and cached_entry.is_fresh:
+            self.cache_stats.record(stats_endpoint, 'hit')
+            self.profiler.record_cache(endpoint_class, 'hit')
+            return cached_entry.data
         
+        headers = self.get_conditional_headers(cached_entry)
         url = f"{self.base_url}/{endpoint}"
-        response = requests.get(url, headers=self.headers, params=params)
+        resource = 'search' if endpoint.startswith('search/') else 'core'
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            try:
+                response = self.transport.get(url, headers=headers, params=params, resource=resource)
+            except requests.RequestException as e:
+                raise FetchError(f"REST request failed: {e}") from e
+            
+            delay = self.governor.retry_delay(resource, response)
+            if delay is None:
+                break
+            if attempt == RATE_LIMIT_MAX_RETRIES:
+                raise FetchError(f"REST request failed: still rate limited after {RATE_LIMIT_MAX_RETRIES} retries")
+            print(f"\n⏳ {resource} rate limit reached, pausing {delay:.0f}s...")
+            self.governor.pause(resource, delay)
+        
+        if response.status_code == 304 and cached_entry is not None:
+            self.cache_stats.record(stats_endpoint, 'revalidated')
+            self.profiler.record_cache(endpoint_class, 'revalidated')
+            with self.profiler.phase(PHASE_CACHE_SAVE):
+                self.cache.touch(cache_key, CACHE_EXPIRY_HOURS * 3600)
+            return cached_entry.data
         
+        self.cache_stats.record(stats_endpoint, 'miss')
+        self.profiler.record_cache(endpoint_class, 'expired' if cached_entry is not None else 'miss')
         if response.status_code == 200:
-            data = response.json()
-            # Save to cache
-            self.save_to_cache(cache_key, data)
+            data = self.read_rest_response(response, include_links)
+            # Save to cache along with the validators for later revalidation
+            self.save_to_cache(cache_key, data, endpoint_class,
+                               etag=response.headers.get('ETag'),
+                               last_modified=response.headers.get('Last-Modified'))
             return data
-        elif response.status_code == 403:
-            print("Rate limit exceeded, waiting...")
-            time.sleep(60)
-            return self.make_rest_request(endpoint, params)
-        else:
-            error_meaning = self.get_status_code_meaning(response.status_code)
-            print(f"REST request failed: {response.status_code} ({error_meaning})")
-            return {}
+        return self.read_failed_response('REST', response, endpoint)
+    
+    def get_conditional_headers(self, cached_entry) -> Dict:
+        """REST headers, plus If-None-Match/If-Modified-Since for a stale cache entry"""
+        headers = self.headers
+        if cached_entry is not None and cached_entry.has_validators:
+            headers = dict(self.headers)
+            if cached_entry.etag:
+                headers['If-None-Match'] = cached_entry.etag
+            if cached_entry.last_modified:
+                headers['If-Modified-Since'] = cached_entry.last_modified
+        return headers
+    
+    def paginate_rest_request(self, endpoint: str, params: Dict = None,
+                              concurrent: bool = True) -> Iterator[Dict]:
+        """Stream every item of a paginated REST listing
+        
+        Follows ``Link: rel="next"`` headers. When the first page also
+        advertises ``rel="last"`` with a page number, the remaining pages are
+        fetched concurrently and yielded in order. Each page is cached on its
+        own, so an interrupted run resumes from the pages it already has.
+        Pass ``concurrent=False`` when the caller stops early (for example
+        on newest-first listings) to avoid fetching pages it will not read.
+        """
+        params = dict(params or {})
+        params.setdefault('per_page', 100)
+        
+        items, links = self.make_rest_page_request(endpoint, params)
+        yield from self._page_items(items)
+        
+        first_page = int(params.get('page', 1))
+        last_page = self._link_page_number(links.get('last'))
+        if concurrent and last_page and last_page > first_page:
+            with ThreadPoolExecutor(max_workers=PAGINATION_WORKERS) as executor:
+                futures = [executor.submit(self.make_rest_page_request, endpoint, {**params, 'page': page})
+                           for page in range(first_page + 1, last_page + 1)]
+                try:
+                    for future in futures:
+                        yield from self._page_items(future.result()[0])
+                finally:
+                    # Caller stopped early: drop pages that have not started
+                    for future in futures:
+                        future.cancel()
+            return
+        
+        while links.get('next'):
+            next_page = self._link_page_number(links['next'])
+            if next_page:
+                endpoint_next, params_next = endpoint, {**params, 'page': next_page}
+            else:
+                # Cursor-style link: follow it verbatim
+                endpoint_next, params_next = self._split_link(links['next'])
+            items, links = self.make_rest_page_request(endpoint_next, params_next)
+            yield from self._page_items(items)
+    
+    def _page_items(self, page) -> List[Dict]:
+        """Extract the item list from a page body (plain list or search result)"""
+        if isinstance(page, list):
+            return page
+        if isinstance(page, dict):
+            return page.get('items', [])
+        return []
+    
+    def _link_page_number(self, url: Optional[str]) -> Optional[int]:
+        """Return the ``page`` query parameter of a Link URL, if it has one"""
+        if not url:
+            return None
+        page = dict(parse_qsl(urlsplit(url).query)).get('page')
+        return int(page) if page and page.isdigit() else None
+    
+    def _split_link(self, url: str) -> Tuple[str, Dict]:
+        """Split an absolute Link URL into an endpoint and params"""
+        parts = urlsplit(url)
+        base_path = urlsplit(self.base_url).path.rstrip('/')
+        endpoint = parts.path[len(base_path):].lstrip('/') if parts.path.startswith(base_path) else parts.path.lstrip('/')
+        return endpoint, dict(parse_qsl(parts.query))
     
     def get_user_contributions_graphql(self, username: str, start_date: str) -> Dict:
         """Get comprehensive user contributions using GraphQL"""
-        query = """
-        query($username: String!, $from: DateTime!) {
-          user(login: $username) {
-            contributionsCollection(from: $from) {
-              totalCommitContributions
-              totalPullRequestContributions
-              totalPullRequestReviewContributions
-              commitContributionsByRepository {
-                repository {
-                  name
-                  owner {
-                    login
-                  }
-                }
-                contributions {
-                  totalCount
-                }
-              }
-              pullRequestContributionsByRepository {
-                repository {
-                  name
-                  owner {
-                    login
-                  }
-                }
-                contributions {
-                  totalCount
-                }
-              }
-            }
-            pullRequests(first: 100, states: [MERGED, OPEN, CLOSED], orderBy: {field: CREATED_AT, direction: DESC}) {
-              edges {
-                node {
-                  title
-                  state
-                  createdAt
-                  mergedAt
-                  additions
-                  deletions
-                  reviews {
-                    totalCount
-                  }
-                  comments {
-                    totalCount
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
+        query = USER_CONTRIBUTIONS_QUERY
         
         variables = {
             'username': username,
@@ -366,179 +959,355 @@ class AdvancedContributionTracker:
         
         return self.make_graphql_request(query, variables)
     
-    def get_user_reviews_rest(self, username: str, start_date: str) -> List[Dict]:
-        """Get detailed review information using REST API across all organizations"""
-        reviews = []
+    def get_user_pull_requests_page_graphql(self, username: str, cursor: str) -> Dict:
+        """Get the next page of a user's pull requests after ``cursor``"""
+        query = PULL_REQUESTS_PAGE_QUERY
         
-        # Search for reviews by user in each organization
-        for org_name in self.organizations:
-            search_query = f"reviewed-by:{username} org:{org_name} created:>={start_date}"
-            
-            response = self.make_rest_request(
-                'search/issues',
-                {'q': search_query, 'sort': 'created', 'order': 'desc'}
-            )
-            
-            for item in response.get('items', []):
-                if item.get('pull_request'):
-                    reviews.append({
-                        'title': item['title'],
-                        'number': item['number'],
-                        'repository': item['repository_url'].split('/')[-1],
-                        'created_at': item['created_at'],
-                        'org_name': org_name
-                    })
+        variables = {
+            'username': username,
+            'cursor': cursor
+        }
         
-        return reviews
+        return self.make_graphql_request(query, variables)
     
-    def get_repository_contributions(self, username: str, start_date: datetime) -> Dict:
+    def collect_pull_requests_in_window(self, username: str, first_page: Dict, start_date: datetime,
+                                        end_date: datetime = None) -> List[Dict]:
+        """Collect a user's pull requests created inside the window
+        
+        Starts from the first page returned with the contributions query and
+        follows the cursor only while pages still reach into the window;
+        results are ordered newest first, so paging stops as soon as a PR
+        predates ``start_date``.
+        """
+        recent_prs = []
+        page = first_page or {}
+        
+        while True:
+            prs, cursor = self.filter_pull_requests_page(page, start_date, end_date)
+            recent_prs.extend(prs)
+            if cursor is None:
+                return recent_prs
+            
+            response = self.get_user_pull_requests_page_graphql(username, cursor)
+            page = (self.read_graphql_user(response) or {}).get('pullRequests') or {}
+    
+    def read_graphql_user(self, payload: Optional[Dict]) -> Optional[Dict]:
+        """The ``user`` node of a GraphQL payload, or None when GraphQL could not answer"""
+        return ((payload or {}).get('data') or {}).get('user')
+    
+    def filter_pull_requests_page(self, page: Dict, start_date: datetime,
+                                  end_date: datetime = None) -> Tuple[List[Dict], Optional[str]]:
+        """Return a page's pull requests inside the window and the cursor to
+        continue from (None once the window start is reached or pages run out)"""
+        prs = []
+        for pr in page.get('nodes') or []:
+            pr_date = datetime.fromisoformat(pr['createdAt'].replace('Z', '+00:00')).replace(tzinfo=None)
+            if pr_date < start_date:
+                return prs, None
+            if end_date is None or pr_date <= end_date:
+                prs.append(pr)
+        
+        page_info = page.get('pageInfo') or {}
+        if not page_info.get('hasNextPage') or not page_info.get('endCursor'):
+            return prs, None
+        return prs, page_info['endCursor']
+    
+    def get_graphql_batch_size(self, requested: int = GRAPHQL_BATCH_SIZE) -> int:
+        """Clamp a requested batch size to GitHub's node and cost limits"""
+        node_cap = GRAPHQL_NODE_LIMIT // GRAPHQL_NODES_PER_USER
+        return max(1, min(requested, GRAPHQL_MAX_BATCH_SIZE, node_cap))
+    
+    def get_users_contributions_graphql_batch(self, usernames: List[str], start_date: str) -> Dict[str, Dict]:
+        """Get contributions for several users in one aliased GraphQL query
+        
+        Returns:
+            Mapping of username to a payload shaped like the single-user
+            response ({'data': {'user': ...}}). Users are omitted entirely
+            when the batch request itself failed, so callers can retry them
+            one at a time.
+        """
+        if not usernames:
+            return {}
+        
+        query, variables = self.build_users_contributions_batch_query(usernames, start_date)
+        try:
+            response = self.make_graphql_request(query, variables)
+        except FetchError as e:
+            print(f"{e} (batch of {len(usernames)} users, retrying them one at a time)")
+            return {}
+        return self.split_users_contributions_batch(usernames, response)
+    
+    def build_users_contributions_batch_query(self, usernames: List[str], start_date: str) -> Tuple[str, Dict]:
+        """Build the aliased query (user0, user1, ...) and variables for a batch"""
+        declarations = ", ".join(f"$login{i}: String!" for i in range(len(usernames)))
+        selections = "\n".join(
+            f"          user{i}: user(login: $login{i}) {{\n            ...UserContributions\n          }}"
+            for i in range(len(usernames))
+        )
+        query = f"""
+        query($from: DateTime!, {declarations}) {{
+          rateLimit {{
+            ...RateLimitInfo
+          }}
+{selections}
+        }}
+        """ + USER_CONTRIBUTIONS_FRAGMENT + RATE_LIMIT_FRAGMENT
+        
+        variables = {'from': start_date}
+        for i, username in enumerate(usernames):
+            variables[f'login{i}'] = username
+        
+        return query, variables
+    
+    def split_users_contributions_batch(self, usernames: List[str], response: Dict) -> Dict[str, Dict]:
+        """Split an aliased batch response into per-user payloads ({} if it failed)"""
+        data = response.get('data')
+        if not data:
+            return {}
+        
+        # Split the aliased response back into per-user payloads; users that
+        # GitHub could not resolve come back as null and use the REST fallback
+        return {
+            username: {'data': {'user': data.get(f'user{i}')}}
+            for i, username in enumerate(usernames)
+        }
+    
+    def prefetch_graphql_contributions(self, usernames: List[str], start_date: str,
+                                       batch_size: int = GRAPHQL_BATCH_SIZE,
+                                       workers: int = DEFAULT_WORKERS) -> Dict[str, Dict]:
+        """Fetch GraphQL contribution payloads for many users in aliased batches
+        
+        Users whose batch failed (or every user, when ``batch_size`` is 1) are
+        then queried one at a time, so the result covers every user that
+        GraphQL could answer for.
+        """
+        batches = self.get_graphql_batches(usernames, batch_size)
+        payloads = {}
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            if batches:
+                for result in executor.map(lambda batch: self.get_users_contributions_graphql_batch(batch, start_date), batches):
+                    payloads.update(result)
+            
+            remaining = [username for username in usernames if username not in payloads]
+            futures = {executor.submit(self.get_user_contributions_graphql, username, start_date): username
+                       for username in remaining}
+            for future in as_completed(futures):
+                try:
+                    payloads[futures[future]] = future.result()
+                except Exception:
+                    continue  # Left for track_user_contributions to retry and report
+        
+        return payloads
+    
+    def get_graphql_batches(self, usernames: List[str], batch_size: int) -> List[List[str]]:
+        """Split users into aliased query batches (none when batching is disabled)"""
+        batch_size = self.get_graphql_batch_size(batch_size)
+        if batch_size <= 1:
+            return []
+        return [usernames[i:i + batch_size] for i in range(0, len(usernames), batch_size)]
+    
+    def get_graphql_fallback_users(self, payloads: Dict[str, Dict]) -> List[str]:
+        """Users whose prefetched payload has no GraphQL data (REST fallback)"""
+        return [username for username, payload in payloads.items() if not self.read_graphql_user(payload)]
+    
+    def get_user_reviews_rest(self, username: str, start_date: str) -> List[Dict]:
+        """Get detailed review information using REST API across all organizations"""
+        reviews = []
+        
+        # Search for reviews by user in each organization
+        for org_name in self.organizations:
+            items = self.paginate_rest_request('search/issues',
+                                               self.get_review_search_params(username, org_name, start_date))
+            for item in items:
+                if item.get('pull_request'):
+                    reviews.append(self.read_review_item(item, org_name))
+        
+        return reviews
+    
+    def get_review_search_params(self, username: str, org_name: str, start_date: str) -> Dict:
+        """Issue search for the PRs a user reviewed in one organization since ``start_date``"""
+        return {
+            'q': f"reviewed-by:{username} org:{org_name} created:>={start_date}",
+            'sort': 'created',
+            'order': 'desc'
+        }
+    
+    def read_review_item(self, item: Dict, org_name: str) -> Dict:
+        """Review record for one pull request search result"""
+        return {
+            'title': item['title'],
+            'number': item['number'],
+            'repository': item['repository_url'].split('/')[-1],
+            'created_at': item['created_at'],
+            'org_name': org_name
+        }
+    
+    def get_organization_repositories(self, org_name: str) -> Iterator[str]:
+        """Stream names of active (non-archived, non-fork) repositories in an organization"""
+        for repo in self.paginate_rest_request(f'orgs/{org_name}/repos'):
+            if self.is_active_repository(repo):
+                yield repo['name']
+    
+    def is_active_repository(self, repo: Dict) -> bool:
+        """Archived repositories and forks are not scanned"""
+        return not (repo.get('archived') or repo.get('fork'))
+    
+    def get_repository_contributions(self, username: str, start_date: datetime) -> Dict:
         """Fallback method: iterate through repositories in all organizations to get contributions"""
-        total_commits = 0
-        total_prs = 0
-        repositories_contributed = set()
+        logins = {username.lower(): username}
+        totals = self.new_repository_totals([username])
         
         # Check contributions across all configured organizations
         for org_name in self.organizations:
-            # Get organization repositories
-            repos_response = self.make_rest_request(f'orgs/{org_name}/repos', {'per_page': 100})
-            
-            if not repos_response:
-                continue
-                
-            for repo in repos_response:
-                if repo.get('archived') or repo.get('fork'):
-                    continue
-                    
-                repo_name = repo['name']
-                
+            for repo_name in self.get_organization_repositories(org_name):
                 # Get commits by user in this repository
-                commits_response = self.make_rest_request(
+                repo_commits = sum(1 for _ in self.paginate_rest_request(
                     f'repos/{org_name}/{repo_name}/commits',
                     {
                         'author': username,
-                        'since': start_date.isoformat(),
-                        'per_page': 100
+                        'since': start_date.isoformat()
                     }
-                )
+                ))
+                repo_counts = {username: {'commits': repo_commits, 'prs': 0}}
                 
-                if commits_response:
-                    repo_commits = len(commits_response)
-                    if repo_commits > 0:
-                        total_commits += repo_commits
-                        repositories_contributed.add(f"{org_name}/{repo_name}")
+                # List the window's PRs and count the user's own
+                prs = self.paginate_rest_request(f'repos/{org_name}/{repo_name}/pulls',
+                                                 REPOSITORY_PULLS_PARAMS, concurrent=False)
+                for pr in prs:
+                    if self.predates_window(pr, start_date):
+                        break
+                    self.count_repository_login(repo_counts, logins, (pr.get('user') or {}).get('login'), 'prs')
                 
-                # Get pull requests by user in this repository
-                prs_response = self.make_rest_request(
-                    f'repos/{org_name}/{repo_name}/pulls',
-                    {
-                        'creator': username,
-                        'state': 'all',
-                        'sort': 'created',
-                        'direction': 'desc',
-                        'per_page': 100
-                    }
-                )
-                
-                if prs_response:
-                    # Filter PRs by date
-                    recent_prs = []
-                    for pr in prs_response:
-                        pr_date = datetime.fromisoformat(pr['created_at'].replace('Z', '+00:00')).replace(tzinfo=None)
-                        if pr_date >= start_date:
-                            recent_prs.append(pr)
-                    total_prs += len(recent_prs)
+                self.add_repository_counts(totals, org_name, repo_name, repo_counts)
         
-        return {
-            'total_commits': total_commits,
-            'total_prs': total_prs,
-            'repositories_count': len(repositories_contributed),
-            'repositories': list(repositories_contributed)
-        }
+        return self.summarize_repository_totals(totals)[username]
     
-    def calculate_gamification_scores(self, metrics: ContributionMetrics) -> ContributionMetrics:
-        """Calculate gamification scores for different contribution types"""
+    def get_repository_contributions_for_users(self, usernames: List[str], start_date: datetime,
+                                               workers: int = DEFAULT_WORKERS) -> Dict[str, Dict]:
+        """Repo-centric fallback: scan each repository once for all users
         
-        # Commit scoring (quality over quantity)
-        metrics.commits_score = min(metrics.commits_count * 2, 100)  # Cap at 100 points
+        Instead of querying every repository once per user, each repository's
+        commits and pull requests for the window are listed once and
+        attributed to the configured users in memory. The per-user result has
+        the same shape as ``get_repository_contributions``.
+        """
+        if not usernames:
+            return {}
+        logins = {username.lower(): username for username in usernames}
+        totals = self.new_repository_totals(usernames)
         
-        # PR scoring (merge rate matters)
-        if metrics.prs_opened > 0:
-            metrics.pr_merge_rate = metrics.prs_merged / metrics.prs_opened
-            metrics.pr_score = (metrics.prs_opened * 5) + (metrics.pr_merge_rate * 20)
+        repositories = [(org_name, repo_name)
+                        for org_name in self.organizations
+                        for repo_name in self.get_organization_repositories(org_name)]
         
-        # Review scoring (helping others is valuable)
-        metrics.reviews_score = (metrics.reviews_given * 3) + (metrics.review_comments * 1)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            scans = executor.map(lambda repo: self.scan_repository_contributions(repo[0], repo[1], logins, start_date),
+                                 repositories)
+            for (org_name, repo_name), repo_counts in zip(repositories, scans):
+                self.add_repository_counts(totals, org_name, repo_name, repo_counts)
         
-        # Collaboration score (cross-repository engagement bonus)
-        # Award additional points for diverse collaboration beyond basic reviews
-        collaboration_bonus = 0
-        if metrics.reviews_given > 5:  # Active reviewer bonus
-            collaboration_bonus += 10
-        if metrics.review_comments > 20:  # Detailed feedback bonus
-            collaboration_bonus += 15
-        if metrics.prs_opened > 0 and metrics.reviews_given > 0:  # Well-rounded contributor
-            collaboration_bonus += 10
-        metrics.collaboration_score = collaboration_bonus
+        return self.summarize_repository_totals(totals)
+    
+    def scan_repository_contributions(self, org_name: str, repo_name: str, logins: Dict[str, str],
+                                      start_date: datetime) -> Dict[str, Dict[str, int]]:
+        """Count commits and PRs per tracked user in one repository
         
-        # Consistency score (independent of other metrics to avoid double counting)
-        # Award points for balanced activity across different contribution types
-        activity_types = sum([
-            1 if metrics.commits_count > 0 else 0,
-            1 if metrics.prs_opened > 0 else 0,
-            1 if metrics.reviews_given > 0 else 0
-        ])
-        metrics.consistency_score = activity_types * 8  # Up to 24 points for all three types
+        Args:
+            logins: Mapping of lower-cased login to configured username
         
-        # Total gamification score (no double counting)
-        metrics.total_score = (
-            metrics.commits_score +
-            metrics.pr_score +
-            metrics.reviews_score +
-            metrics.collaboration_score +
-            metrics.consistency_score
+        Returns:
+            Mapping of configured username to {'commits': n, 'prs': n} for
+            users with any activity in the repository
+        """
+        counts: Dict[str, Dict[str, int]] = {}
+        
+        commits = self.paginate_rest_request(
+            f'repos/{org_name}/{repo_name}/commits',
+            {'since': start_date.isoformat()}
         )
+        for commit in commits:
+            self.count_repository_login(counts, logins, (commit.get('author') or {}).get('login'), 'commits')
         
-        return metrics
+        prs = self.paginate_rest_request(f'repos/{org_name}/{repo_name}/pulls',
+                                         REPOSITORY_PULLS_PARAMS, concurrent=False)
+        for pr in prs:
+            if self.predates_window(pr, start_date):
+                break
+            self.count_repository_login(counts, logins, (pr.get('user') or {}).get('login'), 'prs')
+        
+        return counts
     
-    def track_user_contributions(self, username: str, full_name: str, start_date: datetime = None, end_date: datetime = None, days_back: int = 30) -> ContributionMetrics:
-        """Track comprehensive contributions for a single user"""
-        if start_date is None:
-            start_date = datetime.now() - timedelta(days=days_back)
-        if end_date is None:
-            end_date = datetime.now()
+    def predates_window(self, pr: Dict, start_date: datetime) -> bool:
+        """Whether a REST pull request was created before the window start"""
+        pr_date = datetime.fromisoformat(pr['created_at'].replace('Z', '+00:00')).replace(tzinfo=None)
+        return pr_date < start_date
+    
+    def count_repository_login(self, counts: Dict[str, Dict[str, int]], logins: Dict[str, str],
+                               login: Optional[str], field: str):
+        """Count one commit or PR for the configured user behind ``login``, if any"""
+        username = logins.get((login or '').lower())
+        if username:
+            counts.setdefault(username, {'commits': 0, 'prs': 0})[field] += 1
+    
+    def new_repository_totals(self, usernames: List[str]) -> Dict[str, Dict]:
+        """Empty per-user totals for a repository scan"""
+        return {username: {'total_commits': 0, 'total_prs': 0, 'repositories': set()}
+                for username in usernames}
+    
+    def add_repository_counts(self, totals: Dict[str, Dict], org_name: str, repo_name: str,
+                              repo_counts: Dict[str, Dict[str, int]]):
+        """Add one repository's per-user counts to the scan totals"""
+        for username, counts in repo_counts.items():
+            user_totals = totals[username]
+            user_totals['total_commits'] += counts['commits']
+            user_totals['total_prs'] += counts['prs']
+            if counts['commits'] > 0:
+                user_totals['repositories'].add(f"{org_name}/{repo_name}")
+    
+    def summarize_repository_totals(self, totals: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Per-user REST fallback results from the scan totals"""
+        return {
+            username: {
+                'total_commits': user_totals['total_commits'],
+                'total_prs': user_totals['total_prs'],
+                'repositories_count': len(user_totals['repositories']),
+                'repositories': list(user_totals['repositories'])
+            }
+            for username, user_totals in totals.items()
+        }
+    
+    def track_user_contributions(self, username: str, full_name: str, start_date: datetime = None, end_date: datetime = None, days_back: int = 30,
+                                 graphql_data: Dict = None, rest_data: Dict = None) -> ContributionMetrics:
+        """Track comprehensive contributions for a single user
         
+        ``graphql_data`` may carry a payload already fetched by a batched
+        query, and ``rest_data`` a result from the repo-centric fallback;
+        otherwise the user is queried on their own.
+        """
+        start_date, end_date = self.resolve_window(start_date, end_date, days_back)
         start_date_str = start_date.isoformat()
         
         metrics = ContributionMetrics(username=username, full_name=full_name)
         
         # Try GraphQL first
-        graphql_data = self.get_user_contributions_graphql(username, start_date_str)
+        if graphql_data is None:
+            graphql_data = self.get_user_contributions_graphql(username, start_date_str)
         
-        if graphql_data.get('data', {}).get('user'):
-            user_data = graphql_data['data']['user']
-            contributions = user_data.get('contributionsCollection', {})
-            
-            # Extract basic metrics
-            metrics.commits_count = contributions.get('totalCommitContributions', 0)
-            metrics.prs_opened = contributions.get('totalPullRequestContributions', 0)
-            metrics.reviews_given = contributions.get('totalPullRequestReviewContributions', 0)
+        user_data = self.read_graphql_user(graphql_data)
+        if user_data:
+            self.add_graphql_contributions(metrics, user_data)
             
-            # Extract detailed PR information
-            prs = user_data.get('pullRequests', {}).get('edges', [])
-            recent_prs = []
-            for pr in prs:
-                pr_date = datetime.fromisoformat(pr['node']['createdAt'].replace('Z', '+00:00')).replace(tzinfo=None)
-                if pr_date >= start_date:
-                    recent_prs.append(pr['node'])
-            
-            metrics.prs_merged = len([pr for pr in recent_prs if pr['state'] == 'MERGED'])
-            metrics.review_comments = sum(pr.get('comments', {}).get('totalCount', 0) for pr in recent_prs)
+            # Extract detailed PR information, paging back to the window start
+            recent_prs = self.collect_pull_requests_in_window(
+                username, user_data.get('pullRequests'), start_date, end_date)
+            self.add_pull_request_details(metrics, recent_prs)
         
         else:
             # Fallback to REST API repository iteration
-            rest_data = self.get_repository_contributions(username, start_date)
-            metrics.commits_count = rest_data.get('total_commits', 0)
-            metrics.prs_opened = rest_data.get('total_prs', 0)
+            if rest_data is None:
+                rest_data = self.get_repository_contributions(username, start_date)
+            self.add_repository_contributions(metrics, rest_data)
         
         # Get additional review data from REST API
         reviews = self.get_user_reviews_rest(username, start_date_str.split('T')[0])
@@ -550,96 +1319,606 @@ class AdvancedContributionTracker:
         
         return metrics
     
-    def track_all_users(self, start_date: datetime = None, end_date: datetime = None, days_back: int = 30) -> List[ContributionMetrics]:
-        """Track contributions for all users in config"""
-        users = self.load_users_config()
-        all_metrics = []
-        total_users = len(users)
-        current_user = 0
+    def resolve_window(self, start_date: Optional[datetime], end_date: Optional[datetime],
+                       days_back: int) -> Tuple[datetime, datetime]:
+        """Fill in an open window: start ``days_back`` days ago, end now"""
+        if start_date is None:
+            start_date = datetime.now() - timedelta(days=days_back)
+        if end_date is None:
+            end_date = datetime.now()
+        return start_date, end_date
+    
+    def add_graphql_contributions(self, metrics: ContributionMetrics, user_data: Dict):
+        """Set commit, PR and review totals from a contributions query's user node"""
+        contributions = user_data.get('contributionsCollection', {})
+        metrics.commits_count = contributions.get('totalCommitContributions', 0)
+        metrics.prs_opened = contributions.get('totalPullRequestContributions', 0)
+        metrics.reviews_given = contributions.get('totalPullRequestReviewContributions', 0)
+    
+    def add_pull_request_details(self, metrics: ContributionMetrics, recent_prs: List[Dict]):
+        """Set merged PRs and review comments from the PRs inside the window"""
+        metrics.prs_merged = len([pr for pr in recent_prs if pr['state'] == 'MERGED'])
+        metrics.review_comments = sum(pr.get('comments', {}).get('totalCount', 0) for pr in recent_prs)
+    
+    def add_repository_contributions(self, metrics: ContributionMetrics, rest_data: Dict):
+        """Set commit and PR totals from a REST repository scan result"""
+        metrics.commits_count = rest_data.get('total_commits', 0)
+        metrics.prs_opened = rest_data.get('total_prs', 0)
+    
+    def fetch_daily_contributions(self, username: str, first_day: date, last_day: date) -> Optional[Dict[date, DailyCounts]]:
+        """Fetch per-day contribution counts for [first_day, last_day] (UTC)
         
-        # Determine date range for display
-        if start_date and end_date:
-            date_info = f"from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-        else:
-            date_info = f"last {days_back} days"
+        Returns:
+            Buckets keyed by day (days without activity are absent), or None
+            when GraphQL could not answer for this user
+        """
+        buckets: Dict[date, DailyCounts] = {}
+        variables = self.get_daily_contributions_variables(username, first_day, last_day)
         
-        print(f"\n🚀 Starting to track {total_users} users ({date_info})...")
+        while variables['withCommits'] or variables['withPRs'] or variables['withReviews']:
+            response = self.make_graphql_request(DAILY_CONTRIBUTIONS_QUERY, dict(variables))
+            user_data = self.read_graphql_user(response)
+            if not user_data:
+                return None
+            self.add_daily_contributions_page(user_data.get('contributionsCollection') or {}, variables, buckets)
         
-        for username, full_name in users.items():
-            current_user += 1
+        return buckets
+    
+    def get_daily_contributions_variables(self, username: str, first_day: date, last_day: date) -> Dict:
+        """Initial variables for DAILY_CONTRIBUTIONS_QUERY over whole UTC days"""
+        return {
+            'username': username,
+            'from': datetime.combine(first_day, dt_time.min).isoformat() + 'Z',
+            'to': datetime.combine(last_day, dt_time.max.replace(microsecond=0)).isoformat() + 'Z',
+            'prCursor': None,
+            'reviewCursor': None,
+            'withCommits': True,
+            'withPRs': True,
+            'withReviews': True
+        }
+    
+    def add_daily_contributions_page(self, collection: Dict, variables: Dict, buckets: Dict[date, DailyCounts]):
+        """Add one DAILY_CONTRIBUTIONS_QUERY page to ``buckets`` and advance ``variables``"""
+        def bucket(occurred_at: str) -> DailyCounts:
+            day = datetime.fromisoformat(occurred_at.replace('Z', '+00:00')).date()
+            return buckets.setdefault(day, DailyCounts())
+        
+        if variables['withCommits']:
+            for repository in collection.get('commitContributionsByRepository') or []:
+                for node in (repository.get('contributions') or {}).get('nodes') or []:
+                    bucket(node['occurredAt']).commits += node.get('commitCount', 0)
+            variables['withCommits'] = False
+        
+        if variables['withPRs']:
+            connection = collection.get('pullRequestContributions') or {}
+            for node in connection.get('nodes') or []:
+                counts = bucket(node['occurredAt'])
+                pull_request = node.get('pullRequest') or {}
+                counts.prs_opened += 1
+                if pull_request.get('state') == 'MERGED':
+                    counts.prs_merged += 1
+                counts.review_comments += (pull_request.get('comments') or {}).get('totalCount', 0)
+            page_info = connection.get('pageInfo') or {}
+            variables['withPRs'] = bool(page_info.get('hasNextPage'))
+            variables['prCursor'] = page_info.get('endCursor')
+        
+        if variables['withReviews']:
+            connection = collection.get('pullRequestReviewContributions') or {}
+            for node in connection.get('nodes') or []:
+                bucket(node['occurredAt']).reviews += 1
+            page_info = connection.get('pageInfo') or {}
+            variables['withReviews'] = bool(page_info.get('hasNextPage'))
+            variables['reviewCursor'] = page_info.get('endCursor')
+    
+    def track_user_contributions_incremental(self, username: str, full_name: str, start_date: datetime = None,
+                                             end_date: datetime = None, days_back: int = 30) -> ContributionMetrics:
+        """Track a user from the per-day store, fetching only missing or mutable days
+        
+        The window is widened to whole UTC days. Users GraphQL cannot answer
+        for go through the regular ``track_user_contributions`` path.
+        """
+        start_date, end_date = self.resolve_window(start_date, end_date, days_back)
+        first_day, last_day = start_date.date(), end_date.date()
+        
+        if not self.sync_daily_contributions(username, first_day, last_day):
+            return self.track_user_contributions(username, full_name, start_date, end_date, days_back)
+        
+        store = self.contribution_store
+        metrics = self.metrics_from_daily_counts(username, full_name, store.sum_range(username, first_day, last_day))
+        
+        # Same REST review fallback as the full path, only needed without GraphQL reviews
+        if not metrics.reviews_given:
+            metrics.reviews_given = len(self.get_user_reviews_rest(username, first_day.isoformat()))
+        
+        return self.calculate_gamification_scores(metrics)
+    
+    def sync_daily_contributions(self, username: str, first_day: date, last_day: date) -> bool:
+        """Fetch the missing or mutable days of [first_day, last_day] into the per-day store
+        
+        Returns:
+            False when GraphQL could not answer for this user
+        """
+        store = self.contribution_store
+        for range_start, range_end in group_date_ranges(store.missing_days(username, first_day, last_day)):
+            buckets = self.fetch_daily_contributions(username, range_start, range_end)
+            if buckets is None:
+                return False
+            store.save_days(username, days_between(range_start, range_end), buckets)
+        return True
+    
+    def track_user_windows(self, username: str, full_name: str,
+                           windows: List[TrackingWindow]) -> Dict[str, ContributionMetrics]:
+        """Track a user for several windows from one fetch of the widest window
+        
+        Per-day buckets are synced once for the union of all windows and each
+        window is summed from them. Users GraphQL cannot answer for are
+        tracked per window through ``track_user_contributions``.
+        
+        Returns:
+            Scored metrics keyed by window name
+        """
+        first_day = min(window.start_date for window in windows).date()
+        last_day = max(window.end_date for window in windows).date()
+        
+        if not self.sync_daily_contributions(username, first_day, last_day):
+            return {window.name: self.track_user_contributions(username, full_name, window.start_date, window.end_date)
+                    for window in windows}
+        
+        store = self.contribution_store
+        reviews = None
+        window_metrics = {}
+        for window in windows:
+            window_first, window_last = window.start_date.date(), window.end_date.date()
+            metrics = self.metrics_from_daily_counts(username, full_name,
+                                                     store.sum_range(username, window_first, window_last))
+            
+            # REST review fallback: one search from the widest start, counted per window
+            if not metrics.reviews_given:
+                if reviews is None:
+                    reviews = self.get_user_reviews_rest(username, first_day.isoformat())
+                metrics.reviews_given = len([review for review in reviews
+                                             if window_first.isoformat() <= review['created_at'][:10]
+                                             <= window_last.isoformat()])
+            
+            window_metrics[window.name] = self.calculate_gamification_scores(metrics)
+        return window_metrics
+    
+    def metrics_from_daily_counts(self, username: str, full_name: str, totals: DailyCounts) -> ContributionMetrics:
+        """Unscored metrics for a user from summed per-day counts"""
+        metrics = ContributionMetrics(username=username, full_name=full_name)
+        metrics.commits_count = totals.commits
+        metrics.prs_opened = totals.prs_opened
+        metrics.prs_merged = totals.prs_merged
+        metrics.reviews_given = totals.reviews
+        metrics.review_comments = totals.review_comments
+        return metrics
+    
+    @profiled(PHASE_TRACK_ALL_USERS)
+    def track_all_users(self, start_date: datetime = None, end_date: datetime = None, days_back: int = 30,
+                        workers: int = DEFAULT_WORKERS, batch_size: int = GRAPHQL_BATCH_SIZE,
+                        incremental: bool = False, run_id: str = None) -> List[ContributionMetrics]:
+        """Track contributions for all users in config using a bounded worker pool
+        
+        Users are tracked concurrently; request pacing comes from the shared
+        rate-limit budget rather than a fixed per-user sleep. Results are kept
+        in config order before ranking so ties rank the same way on every run.
+        GraphQL data is prefetched in aliased batches of ``batch_size`` users,
+        and users GraphQL cannot answer for share one repository scan. With
+        ``incremental`` each user is built from the per-day store instead.
+        
+        With ``run_id`` every finished or failed user is written to the run
+        journal, and users the run already completed are restored from it
+        instead of being tracked again.
+        """
+        user_items = list(self.load_users_config().items())
+        total_users = len(user_items)
+        completed = 0
+        
+        # Resolve the window once so every worker uses the same start date
+        start_date, date_info = self.describe_window(start_date, end_date, days_back)
+        
+        results: List[Optional[ContributionMetrics]] = [None] * total_users
+        pending = self.load_run_progress(run_id, user_items, results)
+        self.start_run_summary(total_users, len(pending))
+        
+        print(f"\n🚀 Starting to track {len(pending)} users ({date_info}) with {workers} workers...")
+        
+        graphql_payloads = {}
+        rest_payloads = {}
+        if not incremental and pending:
+            graphql_payloads = self.prefetch_graphql_contributions(
+                [user_items[index][0] for index in pending], start_date.isoformat(), batch_size, workers)
             
+            # Users without GraphQL data fall back to a single repo-centric REST scan
+            fallback_users = self.get_graphql_fallback_users(graphql_payloads)
+            if fallback_users:
+                print(f"↪️  GraphQL unavailable for {len(fallback_users)} users, scanning repositories once...")
+                try:
+                    rest_payloads = self.get_repository_contributions_for_users(fallback_users, start_date, workers)
+                except FetchError as e:
+                    # Each of these users scans on its own and fails on its own
+                    print(f"{e} (shared repository scan, falling back to per-user scans)")
+        
+        def track(username: str, full_name: str) -> ContributionMetrics:
+            if incremental:
+                return self.track_user_contributions_incremental(username, full_name, start_date, end_date, days_back)
+            return self.track_user_contributions(username, full_name, start_date, end_date, days_back,
+                                                 graphql_payloads.get(username), rest_payloads.get(username))
+        
+        failed = 0
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {
+                executor.submit(track, *user_items[index]): index
+                for index in pending
+            }
+            
+            # Progress is reported from this thread only, in completion order
             try:
-                self.print_progress_bar(current_user, total_users, username, full_name)
-                metrics = self.track_user_contributions(username, full_name, start_date, end_date, days_back)
-                all_metrics.append(metrics)
-                time.sleep(0.5)  # Rate limiting
-            except Exception as e:
-                # Clear progress line before printing error, then restore it
-                sys.stdout.write('\r' + ' ' * 80 + '\r')
-                sys.stdout.flush()
-                error_msg = f"❌ Error tracking {full_name} ({username}): {e}"
-                print(error_msg)
-                continue
+                for future in as_completed(futures):
+                    index = futures[future]
+                    username, full_name = user_items[index]
+                    completed += 1
+                    
+                    try:
+                        results[index] = future.result()
+                        self.record_user_result(run_id, username, metrics=results[index])
+                        self.report_user_result(completed, len(pending), username, full_name)
+                    except Exception as e:
+                        self.record_user_result(run_id, username, error=e)
+                        self.report_user_result(completed, len(pending), username, full_name, error=e)
+                        failed += 1
+                        continue
+            except KeyboardInterrupt:
+                # Drop queued users; only the ones already running are waited for
+                for future in futures:
+                    future.cancel()
+                self.finish_run(run_id, RUN_INTERRUPTED)
+                raise
+        
+        return self.finish_tracking(run_id, results, failed)
+    
+    def describe_window(self, start_date: Optional[datetime], end_date: Optional[datetime],
+                        days_back: int) -> Tuple[datetime, str]:
+        """Resolve a run's start date and describe its window for display"""
+        if start_date is None:
+            start_date = datetime.now() - timedelta(days=days_back)
+        if end_date:
+            return start_date, f"from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+        return start_date, f"last {days_back} days"
+    
+    def start_run_summary(self, total_users: int, pending_users: int):
+        """Reset the per-run user counts (restored users count as tracked)"""
+        self.run_summary = {'users_configured': total_users, 'users_tracked': total_users - pending_users,
+                            'users_failed': 0}
+    
+    def report_user_result(self, completed: int, total: int, username: str, full_name: str,
+                           error: Exception = None):
+        """Count one finished user and show progress, or the error it failed with"""
+        if error is None:
+            self.run_summary['users_tracked'] += 1
+            self.print_progress_bar(completed, total, username, full_name)
+            return
+        
+        # Clear progress line before printing error, then restore it
+        sys.stdout.write('\r' + ' ' * 80 + '\r')
+        sys.stdout.flush()
+        print(f"❌ Error tracking {full_name} ({username}): {error}")
+        self.run_summary['users_failed'] += 1
+    
+    def finish_tracking(self, run_id: Optional[str], results: List[Optional[ContributionMetrics]],
+                        failed: int) -> List[ContributionMetrics]:
+        """Close a tracking pass: record the run status and rank the tracked users"""
+        all_metrics = [metrics for metrics in results if metrics is not None]
         
         # Clear progress bar and add completion message
         sys.stdout.write('\r' + ' ' * 80 + '\r')
         sys.stdout.flush()
         print(f"✅ Completed tracking {len(all_metrics)} users\n")
+        # Users skipped after too many failed attempts leave the run incomplete too
+        self.finish_run(run_id, RUN_INCOMPLETE if failed or len(all_metrics) < len(results) else RUN_COMPLETED)
         
-        # Sort by total score and assign ranks
-        all_metrics.sort(key=lambda x: x.total_score, reverse=True)
-        for i, metrics in enumerate(all_metrics):
-            metrics.rank = i + 1
+        return self.assign_ranks(all_metrics)
+    
+    def load_run_progress(self, run_id: Optional[str], user_items: List[Tuple[str, str]],
+                          results: List[Optional[ContributionMetrics]]) -> List[int]:
+        """Restore users a run already completed into ``results``
+        
+        Restored counts are scored again with the current scoring settings.
+        Users that failed ``MAX_USER_ATTEMPTS`` times are left out.
+        
+        Returns:
+            Indexes into ``user_items`` of the users still to track
+        """
+        if not run_id:
+            return list(range(len(user_items)))
         
-        return all_metrics
+        done = self.journal.completed_metrics(run_id)
+        exhausted = self.journal.exhausted_users(run_id)
+        pending = []
+        for index, (username, full_name) in enumerate(user_items):
+            if username in done:
+                metrics = ContributionMetrics(**done[username])
+                metrics.full_name = full_name
+                results[index] = self.calculate_gamification_scores(metrics)
+            elif username in exhausted:
+                print(f"⏭️  Skipping {full_name} ({username}) after {MAX_USER_ATTEMPTS} failed attempts: {exhausted[username]}")
+            else:
+                pending.append(index)
+        
+        if done:
+            print(f"♻️  Run {run_id}: {len(done)} users restored from the journal, {len(pending)} still to track")
+        return pending
     
-    def save_results(self, metrics_list: List[ContributionMetrics], filename: str = None):
-        """Save results to CSV file"""
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"advanced_contributions_{timestamp}.csv"
+    def record_user_result(self, run_id: Optional[str], username: str,
+                           metrics: ContributionMetrics = None, error: Exception = None):
+        """Write one user's outcome to the run journal (no-op without a run id)"""
+        if not run_id:
+            return
+        if error is None:
+            self.journal.record_success(run_id, username, asdict(metrics))
+        else:
+            self.journal.record_failure(run_id, username, f"{type(error).__name__}: {error}")
+    
+    def finish_run(self, run_id: Optional[str], status: str):
+        """Record a run's final status and say how to pick it up again"""
+        if not run_id:
+            return
+        self.journal.set_status(run_id, status)
+        if status == RUN_INTERRUPTED:
+            print(f"\n⏸️  Run {run_id} interrupted; continue it with --resume {run_id}")
+        elif status == RUN_INCOMPLETE:
+            print(f"⚠️  Some users failed; retry them with --resume {run_id}")
+    
+    @profiled(PHASE_TRACK_ALL_USERS)
+    def track_all_users_windows(self, windows: List[TrackingWindow],
+                                workers: int = DEFAULT_WORKERS) -> Dict[str, List[ContributionMetrics]]:
+        """Track all users for several windows in one pass
         
-        fieldnames = [
-            'rank', 'username', 'full_name', 'total_score',
-            'commits_count', 'commits_score',
-            'prs_opened', 'prs_merged', 'pr_merge_rate', 'pr_score',
-            'reviews_given', 'review_comments', 'reviews_score',
-            'collaboration_score', 'consistency_score'
-        ]
+        Each user's per-day counts are fetched once for the widest window
+        (only days missing from the per-day store) and bucketed into every
+        window, so overlapping windows never refetch the same data.
         
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+        Returns:
+            Ranked metrics per window name, in the order of ``windows``
+        """
+        users = self.load_users_config()
+        total_users = len(users)
+        completed = 0
+        
+        window_names = ', '.join(window.name for window in windows)
+        print(f"\n🚀 Starting to track {total_users} users ({window_names}) with {workers} workers...")
+        
+        user_items = list(users.items())
+        results: List[Optional[Dict[str, ContributionMetrics]]] = [None] * total_users
+        self.run_summary = {'users_configured': total_users, 'users_tracked': 0, 'users_failed': 0}
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {
+                executor.submit(self.track_user_windows, username, full_name, windows): index
+                for index, (username, full_name) in enumerate(user_items)
+            }
             
-            for metrics in metrics_list:
-                row = asdict(metrics)
-                writer.writerow(row)
+            # Progress is reported from this thread only, in completion order
+            for future in as_completed(futures):
+                index = futures[future]
+                username, full_name = user_items[index]
+                completed += 1
+                
+                try:
+                    results[index] = future.result()
+                    self.run_summary['users_tracked'] += 1
+                    self.print_progress_bar(completed, total_users, username, full_name)
+                except Exception as e:
+                    sys.stdout.write('\r' + ' ' * 80 + '\r')
+                    sys.stdout.flush()
+                    print(f"❌ Error tracking {full_name} ({username}): {e}")
+                    self.run_summary['users_failed'] += 1
         
-        print(f"Results saved to {filename}")
-        return filename
-    
-    def print_leaderboard(self, metrics_list: List[ContributionMetrics]):
-        """Print a formatted leaderboard"""
-        total_users = len(metrics_list)
-        top_n = min(100, total_users)  # Show max 100 or all users if less than 100
+        tracked = [window_metrics for window_metrics in results if window_metrics is not None]
         
-        print(f"\n🏆 GitHub Contribution Leaderboard (Top {top_n} of {total_users})")
-        print("=" * 100)
-        print(f"{'Rank':<4} {'Name':<30} {'Score':<8} {'Commits':<8} {'PRs':<6} {'Reviews':<8}")
-        print("-" * 100)
+        sys.stdout.write('\r' + ' ' * 80 + '\r')
+        sys.stdout.flush()
+        print(f"✅ Completed tracking {len(tracked)} users for {len(windows)} windows\n")
         
-        for metrics in metrics_list[:top_n]:
-            # Truncate long names for display
-            display_name = metrics.full_name[:29] if len(metrics.full_name) > 29 else metrics.full_name
-            print(f"{metrics.rank:<4} {display_name:<30} {metrics.total_score:<8.1f} "
-                  f"{metrics.commits_count:<8} {metrics.prs_opened:<6} {metrics.reviews_given:<8}")
+        return {window.name: self.assign_ranks([window_metrics[window.name] for window_metrics in tracked])
+                for window in windows}
+    
+    def print_cache_report(self):
+        """Print cache hit rates per endpoint for this run"""
+        rows = self.cache_stats.report()
+        if not rows:
+            return
+        print(f"\n🗄 Cache hit rate by endpoint (time bounds quantized to {self.cache_granularity}s):")
+        print(f"{'Endpoint':<36} {'Hits':<8} {'304s':<8} {'Misses':<8} {'Hit rate':<8}")
+        print("-" * 72)
+        for endpoint, hits, revalidated, misses, hit_rate in rows:
+            print(f"{endpoint:<36} {hits:<8} {revalidated:<8} {misses:<8} {hit_rate:<8.1%}")
+    
+    def record_http(self, path: str, metadata: Dict = None):
+        """Send all further API calls through a transport that archives them to ``path``"""
+        self.transport.close()
+        self.transport = RecordingTransport(path, pool_size=self.transport.pool_size,
+                                            timeout=self.transport.timeout, governor=self.governor,
+                                            profiler=self.profiler, metadata=metadata)
+    
+    def replay_http(self, path: str, preserve_timing: bool = False):
+        """Answer all further API calls from the archive at ``path`` instead of the network"""
+        self.transport.close()
+        self.transport = ReplayTransport(path, preserve_timing=preserve_timing, profiler=self.profiler)
+    
+    def print_http_archive_report(self):
+        """Print request and byte totals of a --record or --replay run and close the archive"""
+        transport = self.transport
+        if isinstance(transport, RecordingTransport):
+            print(f"📼 Recorded {transport.stats.requests} requests "
+                  f"({transport.stats.bytes / 1024:.0f} KB) to {transport.path}")
+        elif isinstance(transport, ReplayTransport):
+            print(f"📼 Replayed {transport.stats.requests} requests "
+                  f"({transport.stats.bytes / 1024:.0f} KB) from {transport.path}, "
+                  f"{transport.misses} not in the archive")
+        transport.close()
+    
+    def save_profile(self, filename: str):
+        """Write the --profile JSON for this run and print its summary"""
+        profile = self.profiler.save(filename, self.governor)
+        print_profile(profile)
+        print(f"⏱️  Profile saved to {filename}")
+
+def rescore_saved_counts(counts_file: str, scoring_config: str = None):
+    """Score and rank counts saved by an earlier run, without network access
+    
+    Only a ContributionScorer is built, so no cache, store or journal is opened.
+    """
+    scorer = ContributionScorer()
+    if scoring_config:
+        scorer.scoring = scorer.load_scoring_config(scoring_config)
+    
+    try:
+        metrics_list = scorer.rescore(scorer.load_raw_counts(counts_file))
+    except (OSError, ValueError) as e:
+        print(f"Error: Could not load counts from {counts_file}: {e}")
+        return
+    
+    if not metrics_list:
+        print(f"❌ No users found in {counts_file}")
+        return
+    
+    scorer.print_leaderboard(metrics_list)
+    
+    base_name = os.path.splitext(os.path.basename(counts_file))[0]
+    if base_name.endswith('_raw'):
+        base_name = base_name[:-len('_raw')]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    scorer.save_results(metrics_list, f"{base_name}_rescored_{timestamp}.csv")
+
+def track_windows(tracker: AdvancedContributionTracker, windows: List[TrackingWindow], workers: int) -> bool:
+    """Track every window in one pass and save one leaderboard per window
+    
+    Returns:
+        True if at least one leaderboard was saved
+    """
+    for window in windows:
+        print(f"Tracking period {window.name}: {window.period} "
+              f"({window.start_date.strftime('%Y-%m-%d')} to {window.end_date.strftime('%Y-%m-%d')})")
+    
+    window_results = tracker.track_all_users_windows(windows, workers)
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    saved = []
+    for window in windows:
+        metrics_list = window_results[window.name]
+        if not metrics_list:
+            print(f"❌ No contribution data found for {window.period}.")
+            continue
+        print(f"\n📅 {window.period}")
+        tracker.print_leaderboard(metrics_list)
+        filename = f"advanced_contributions_{window.filename_suffix}_{timestamp}.csv"
+        tracker.save_results(metrics_list, filename)
+        tracker.save_raw_counts(metrics_list, filename.replace('.csv', '_raw.csv'))
+        saved.append(filename)
+    
+    if saved:
+        print(f"\n✅ Tracking complete! Results saved to {', '.join(saved)}")
+        tracker.print_cache_report()
+    else:
+        print("❌ No contribution data found. Check your configuration and token permissions.")
+    return bool(saved)
+
+def start_or_resume_run(tracker: AdvancedContributionTracker, args) -> Optional[Dict]:
+    """Resolve the tracking window from the arguments and start a journaled run
+    
+    With ``--resume`` the window, output suffix and incremental mode come from
+    the journal instead, so the resumed run covers exactly the same period.
+    
+    Returns:
+        Run parameters with ``run_id`` and parsed ``start_date``/``end_date``,
+        or None after printing an error
+    """
+    if args.resume:
+        parameters = tracker.journal.get_parameters(args.resume)
+        if parameters is None:
+            print(f"Error: Unknown run id {args.resume} (use --list-runs to see recent runs)")
+            return None
+        run_id = args.resume
+        print(f"♻️  Resuming run {run_id}")
+    else:
+        # Handle quarter tracking
+        if args.quarter:
+            try:
+                if '-' in args.quarter:
+                    quarter_str, year_str = args.quarter.split('-')
+                    quarter = int(quarter_str[1])  # Extract number from Q1, Q2, etc.
+                    year = int(year_str)
+                else:
+                    quarter = int(args.quarter[1])  # Extract number from Q1, Q2, etc.
+                    year = args.year if args.year else datetime.now().year
+                
+                start_date, end_date = tracker.get_quarter_dates(year, quarter)
+            except (ValueError, IndexError):
+                print("Error: Invalid quarter format. Use Q1-2025, Q2-2024, etc.")
+                return None
+            period = f"Q{quarter} {year} ({start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')})"
+            filename_suffix = f"Q{quarter}_{year}"
+        else:
+            # Fixed now, so a resumed run keeps the original window
+            start_date = datetime.now() - timedelta(days=args.days)
+            end_date = None
+            period = f"Last {args.days} days"
+            filename_suffix = f"{args.days}days"
         
-        print("\n📊 Scoring Breakdown:")
-        print("• Commits: 2 points each (max 100)")
-        print("• PRs: 5 points + up to 20 bonus for high merge rate")
-        print("• Reviews: 3 points each + 1 per comment")
-        print("• Collaboration: Bonus points for active reviewing (10-35 points)")
-        print("• Consistency: 8 points per contribution type (max 24)")
+        parameters = {
+            'period': period,
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat() if end_date else None,
+            'days_back': args.days,
+            'incremental': args.incremental,
+            'filename_suffix': filename_suffix
+        }
+        run_id = tracker.journal.start_run(parameters)
+    
+    print(f"Tracking period: {parameters['period']}")
+    print(f"📝 Run journal: {run_id} (resume with --resume {run_id})\n")
+    
+    parameters = dict(parameters, run_id=run_id)
+    parameters['start_date'] = datetime.fromisoformat(parameters['start_date'])
+    if parameters['end_date']:
+        parameters['end_date'] = datetime.fromisoformat(parameters['end_date'])
+    return parameters
+
+def add_http_archive_arguments(parser):
+    """Add --record, --replay and --replay-timing to a tracker's argument parser"""
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument('--record', type=str, metavar='ARCHIVE', help='Archive every API exchange to a .jsonl.gz file for later --replay')
+    archive.add_argument('--replay', type=str, metavar='ARCHIVE', help='Answer API calls from a recorded archive instead of GitHub (run from a scratch directory, or with --clear-cache, to replay every request)')
+    parser.add_argument('--replay-timing', action='store_true', help='With --replay, keep each response\'s recorded latency')
+
+def setup_http_archive(tracker: AdvancedContributionTracker, args) -> bool:
+    """Switch the tracker to recording or replaying; False after printing an error"""
+    if args.record:
+        tracker.record_http(args.record, metadata={'argv': sys.argv[1:], 'api_url': tracker.base_url,
+                                                   'organizations': tracker.organizations})
+        print(f"📼 Recording API traffic to {args.record}")
+    elif args.replay:
+        try:
+            tracker.replay_http(args.replay, preserve_timing=args.replay_timing)
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not load {args.replay}: {e}")
+            return False
+        print(f"📼 Replaying {tracker.transport.recorded} recorded exchanges from {args.replay}")
+    return True
+
+def print_runs(journal: RunJournal):
+    """Print recent journaled runs with their progress"""
+    runs = journal.list_runs()
+    if not runs:
+        print("No runs recorded yet")
+        return
+    print(f"{'Run ID':<22} {'Started':<17} {'Status':<12} {'Done':<6} {'Failed':<6} Period")
+    print("-" * 90)
+    for run in runs:
+        started = datetime.fromtimestamp(run['created_at']).strftime('%Y-%m-%d %H:%M')
+        period = (journal.get_parameters(run['run_id']) or {}).get('period', '')
+        print(f"{run['run_id']:<22} {started:<17} {run['status']:<12} {run['done']:<6} {run['failed']:<6} {period}")
 
 def main():
     """Main execution function"""
@@ -650,57 +1929,92 @@ def main():
     parser.add_argument('--quarter', type=str, help='Track by quarter (format: Q1-2025, Q2-2024, etc.)')
     parser.add_argument('--year', type=int, help='Year for quarter tracking (default: current year)')
     parser.add_argument('--clear-cache', action='store_true', help='Clear cache before running')
+    parser.add_argument('--cache-backend', choices=CACHE_BACKENDS, default=CACHE_BACKEND, help=f'Response cache backend (default: {CACHE_BACKEND})')
+    parser.add_argument('--pool-size', type=int, default=HTTP_POOL_SIZE, help=f'Keep-alive HTTP connections to GitHub (default: {HTTP_POOL_SIZE})')
+    parser.add_argument('--timeout', type=float, default=HTTP_TIMEOUT[1], help=f'Per-request read timeout in seconds (default: {HTTP_TIMEOUT[1]:.0f})')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help=f'Users tracked concurrently (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--requests-per-hour', type=float, default=REQUESTS_PER_HOUR, help=f'Cap on the core REST request rate (default: {REQUESTS_PER_HOUR})')
+    parser.add_argument('--graphql-batch-size', type=int, default=GRAPHQL_BATCH_SIZE, help=f'Users per aliased GraphQL query, 1 disables batching (default: {GRAPHQL_BATCH_SIZE})')
+    parser.add_argument('--incremental', action='store_true', help='Build results from the per-day store, fetching only new days')
+    parser.add_argument('--mutable-days', type=int, default=MUTABLE_DAYS, help=f'Recent days refetched on every incremental run (default: {MUTABLE_DAYS})')
+    parser.add_argument('--cache-granularity', type=int, default=CACHE_TIME_GRANULARITY, help=f'Seconds window starts are rounded down to, so repeated runs share cache entries (default: {CACHE_TIME_GRANULARITY})')
+    parser.add_argument('--scoring-config', type=str, help='JSON file with scoring settings (default: "scoring" section of config.json)')
+    parser.add_argument('--rescore', type=str, metavar='CSV', help='Re-score a saved raw counts (or results) CSV without any API calls')
+    parser.add_argument('--resume', type=str, metavar='RUN_ID', help='Finish an interrupted run, tracking only users it has not completed')
+    parser.add_argument('--list-runs', action='store_true', help='List recent runs from the run journal and exit')
+    parser.add_argument('--windows', type=str, metavar='SPEC', help='Several leaderboards from one fetch, e.g. 7d,30d,90d,Q (uses the per-day store)')
+    parser.add_argument('--profile', action='store_true', help='Time each phase (network, cache, scoring, CSV) and write a run_profile_[timestamp].json summary')
+    add_http_archive_arguments(parser)
+    add_metrics_arguments(parser)
     
     args = parser.parse_args()
     
+    # Re-scoring works offline from a previous run's counts
+    if args.rescore:
+        rescore_saved_counts(args.rescore, args.scoring_config)
+        return
+    
+    if args.list_runs:
+        print_runs(RunJournal(os.path.join(CACHE_DIR, RUN_JOURNAL_FILE)))
+        return
+    
     token = os.getenv('GITHUB_TOKEN')
-    if not token:
+    if not token and not args.replay:
         print("Error: GITHUB_TOKEN environment variable not set")
         return
     
-    tracker = AdvancedContributionTracker(token)
+    tracker = AdvancedContributionTracker(token or '', pool_size=max(args.pool_size, args.workers),
+                                          timeout=(HTTP_TIMEOUT[0], args.timeout),
+                                          requests_per_hour=args.requests_per_hour,
+                                          cache_backend=args.cache_backend)
+    tracker.contribution_store.mutable_days = args.mutable_days
+    tracker.cache_granularity = args.cache_granularity
+    if args.profile:
+        tracker.profiler.enable()
+    run_metrics = start_metrics_export(tracker, args, 'advanced')
+    if args.scoring_config:
+        tracker.scoring = tracker.load_scoring_config(args.scoring_config)
+    if not setup_http_archive(tracker, args):
+        return
     
-    # Clear cache if requested
+    # Clear cache if requested, otherwise drop expired entries
     if args.clear_cache:
-        import shutil
-        if os.path.exists(CACHE_DIR):
-            shutil.rmtree(CACHE_DIR)
-            print("🗑️ Cache cleared")
-        os.makedirs(CACHE_DIR, exist_ok=True)
+        tracker.cache.clear()
+        print("🗑️ Cache cleared")
+    else:
+        tracker.cache.purge_expired(keep_validated_for=CACHE_REVALIDATE_DAYS * 86400)
     
     print("🚀 Starting Advanced GitHub Contribution Tracking...")
     organizations_str = ', '.join(tracker.organizations)
     print(f"Organizations: {organizations_str}")
     
-    start_date = None
-    end_date = None
-    
-    # Handle quarter tracking
-    if args.quarter:
+    # Multi-window mode: one fetch of the widest window, one CSV per window
+    if args.windows:
         try:
-            if '-' in args.quarter:
-                quarter_str, year_str = args.quarter.split('-')
-                quarter = int(quarter_str[1])  # Extract number from Q1, Q2, etc.
-                year = int(year_str)
-            else:
-                quarter = int(args.quarter[1])  # Extract number from Q1, Q2, etc.
-                year = args.year if args.year else datetime.now().year
-            
-            start_date, end_date = tracker.get_quarter_dates(year, quarter)
-            print(f"Tracking period: Q{quarter} {year} ({start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')})\n")
-            
-            # Track all users for the quarter
-            metrics_list = tracker.track_all_users(start_date=start_date, end_date=end_date)
-            filename_suffix = f"Q{quarter}_{year}"
-            
-        except (ValueError, IndexError):
-            print("Error: Invalid quarter format. Use Q1-2025, Q2-2024, etc.")
+            windows = tracker.get_tracking_windows(args.windows)
+        except ValueError as e:
+            print(f"Error: {e}")
             return
-    else:
-        print(f"Tracking period: Last {args.days} days\n")
-        # Track all users for specified days
-        metrics_list = tracker.track_all_users(days_back=args.days)
-        filename_suffix = f"{args.days}days"
+        saved = track_windows(tracker, windows, args.workers)
+        tracker.print_http_archive_report()
+        if run_metrics and saved:
+            run_metrics.finish(success=True)
+        if args.profile:
+            tracker.save_profile(f"run_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        return
+    
+    run = start_or_resume_run(tracker, args)
+    if run is None:
+        return
+    
+    try:
+        metrics_list = tracker.track_all_users(start_date=run['start_date'], end_date=run['end_date'],
+                                               days_back=run['days_back'], workers=args.workers,
+                                               batch_size=args.graphql_batch_size,
+                                               incremental=run['incremental'], run_id=run['run_id'])
+    except KeyboardInterrupt:
+        return
+    filename_suffix = run['filename_suffix']
     
     if metrics_list:
         # Print leaderboard
@@ -710,13 +2024,20 @@ def main():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"advanced_contributions_{filename_suffix}_{timestamp}.csv"
         tracker.save_results(metrics_list, filename)
+        tracker.save_raw_counts(metrics_list, filename.replace('.csv', '_raw.csv'))
         print(f"\n✅ Tracking complete! Results saved to {filename}")
         
         # Show cache info
-        cache_files = len([f for f in os.listdir(CACHE_DIR) if f.endswith('.pkl')]) if os.path.exists(CACHE_DIR) else 0
-        print(f"🗄 Cache: {cache_files} files (expires after {CACHE_EXPIRY_HOURS}h)")
+        cache_entries = tracker.cache.count()
+        print(f"🗄 Cache: {sum(cache_entries.values())} entries (expires after {CACHE_EXPIRY_HOURS}h)")
+        tracker.print_cache_report()
+        if run_metrics:
+            run_metrics.finish(success=True)
     else:
         print("❌ No contribution data found. Check your configuration and token permissions.")
+    tracker.print_http_archive_report()
+    if args.profile:
+        tracker.save_profile(f"run_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
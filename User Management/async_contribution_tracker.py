@@ -0,0 +1,800 @@
+#!/usr/bin/env python3
+"""
+Asyncio GitHub Contribution Tracker
+
+Async counterpart of ``AdvancedContributionTracker`` and
+``TeamContributionTracker`` for embedding in asyncio applications (such as an
+aiohttp-based portal) without tying up a thread per run:
+
+1. **Async API:**
+   - ``make_rest_request_async``, ``make_graphql_request_async``,
+     ``track_user_contributions_async`` and ``track_all_users_async`` (and the
+     other ``*_async`` methods) are coroutines; the inherited sync methods
+     keep their sync behaviour
+   - One ``aiohttp.ClientSession`` per tracker, opened with ``async with``
+   - A configurable limit on in-flight API requests (``concurrency``)
+
+2. **Shared With The Sync Trackers:**
+   - Queries, cache keys and the response cache (runs share cached data)
+   - Response parsing, repository-scan aggregation, scoring, ranking,
+     leaderboards and CSV output (the sync trackers' helpers)
+   - Rate-limit governor
+   - Blocking cache and store calls run in the default executor; rate-limit
+     waits are ``asyncio.sleep`` calls and hold no thread
+
+Usage Examples:
+    async with AsyncContributionTracker(token, concurrency=20) as tracker:
+        metrics = await tracker.track_all_users_async(days_back=30)
+        tracker.save_results(metrics)
+
+    python async_contribution_tracker.py                    # Last 30 days
+    python async_contribution_tracker.py --quarter Q1-2025  # Q1 2025
+    python async_contribution_tracker.py --teams            # Also rank teams
+"""
+
+import asyncio
+import json
+import os
+from datetime import date, datetime
+from functools import partial
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from advanced_contribution_tracker import (AdvancedContributionTracker, ContributionMetrics,
+                                           CACHE_BACKEND, CACHE_DIR, CACHE_EXPIRY_HOURS, CACHE_REVALIDATE_DAYS,
+                                           DAILY_CONTRIBUTIONS_QUERY, GRAPHQL_BATCH_SIZE, FetchError,
+                                           PULL_REQUESTS_PAGE_QUERY, REPOSITORY_PULLS_PARAMS,
+                                           USER_CONTRIBUTIONS_QUERY, print_runs, start_or_resume_run)
+from cache_backend import CACHE_BACKENDS
+from contribution_store import MUTABLE_DAYS, DailyCounts, days_between, group_date_ranges
+from github_transport import HTTP_CONNECT_RETRIES, HTTP_TIMEOUT
+from rate_limit import RATE_LIMIT_MAX_RETRIES, REQUESTS_PER_HOUR
+from request_fingerprint import CACHE_TIME_GRANULARITY, endpoint_label
+from run_journal import RUN_INTERRUPTED, RUN_JOURNAL_FILE, RunJournal
+from team_contribution_tracker import (TEAM_DISCOVERY, TEAM_DISCOVERY_MODES, TEAM_DISCOVERY_QUERY,
+                                       TEAM_MEMBERS_QUERY, TeamContributionTracker, TeamRegistry)
+
+# Async Defaults
+DEFAULT_CONCURRENCY = 10       # In-flight API requests per tracker
+
+
+class AsyncResponse:
+    """Fully read HTTP response exposing what the tracker and governor use"""
+
+    def __init__(self, status_code: int, headers, body: bytes, links: Dict[str, Dict[str, str]]):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.links = links  # {rel: {'url': url}}, as on a requests response
+
+    @property
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class AsyncContributionTracker(AdvancedContributionTracker):
+    """Asyncio version of the contribution tracker.
+
+    Network-bound methods have ``*_async`` coroutine counterparts; response
+    parsing, aggregation, scoring, ranking, CSV and leaderboard output are
+    the sync tracker's helpers, called from both. The inherited sync methods
+    keep working on the tracker's own sync transport.
+    """
+
+    def __init__(self, token: str, concurrency: int = DEFAULT_CONCURRENCY, timeout=HTTP_TIMEOUT,
+                 requests_per_hour: float = REQUESTS_PER_HOUR, cache_backend: str = CACHE_BACKEND):
+        """Initialize the tracker; the HTTP session opens on first use.
+
+        Args:
+            token: GitHub personal access token with repo permissions
+            concurrency: Maximum number of API requests in flight at once
+            timeout: Per-request timeout, seconds or a (connect, read) tuple
+            requests_per_hour: Cap on the core REST request rate
+            cache_backend: Name of the response cache backend ("sqlite" or "pickle")
+        """
+        super().__init__(token, pool_size=concurrency, timeout=timeout,
+                         requests_per_hour=requests_per_hour, cache_backend=cache_backend)
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> 'AsyncContributionTracker':
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        """Open the HTTP session inside the running event loop"""
+        if self.session is not None:
+            return
+        connect, read = self.timeout if isinstance(self.timeout, tuple) else (self.timeout, self.timeout)
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+            timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read),
+            headers={'User-Agent': 'ACES-contribution-tracker'}
+        )
+
+    async def close(self):
+        """Close the HTTP session and its pooled connections"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        self.transport.close()
+
+    async def run_blocking(self, func, *args, **kwargs):
+        """Run a blocking call (cache or store access) in the default executor"""
+        return await asyncio.get_running_loop().run_in_executor(None, partial(func, *args, **kwargs))
+
+    async def send_request(self, method: str, url: str, resource: str, **kwargs) -> AsyncResponse:
+        """Send one request within the concurrency limit and rate-limit budget
+
+        Connection failures are retried with backoff, like the sync transport;
+        HTTP status handling stays with the caller.
+        """
+        await self.open()
+        if kwargs.get('params'):
+            kwargs['params'] = {key: str(value) for key, value in kwargs['params'].items()}
+
+        # Wait for quota before taking an in-flight slot
+        delay = self.governor.reserve(resource)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        async with self.semaphore:
+            for attempt in range(HTTP_CONNECT_RETRIES + 1):
+                try:
+                    async with self.session.request(method, url, **kwargs) as response:
+                        body = await response.read()
+                        links = {str(rel): {'url': str(link['url'])} for rel, link in response.links.items()}
+                        result = AsyncResponse(response.status, response.headers, body, links)
+                    break
+                except aiohttp.ClientConnectionError:
+                    if attempt == HTTP_CONNECT_RETRIES:
+                        raise
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+
+        self.governor.observe_response(resource, result)
+        return result
+
+    async def make_graphql_request_async(self, query: str, variables: Dict = None) -> Dict:
+        """Make a GraphQL request with response caching"""
+        cache_key, variables = self.canonical_request('graphql', query, variables)
+
+        cached_data = await self.run_blocking(self.load_from_cache, cache_key, 'graphql')
+        if cached_data is not None:
+            return cached_data
+
+        payload = {'query': query}
+        if variables:
+            payload['variables'] = variables
+
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            try:
+                response = await self.send_request('POST', self.graphql_url, 'graphql',
+                                                   headers=self.graphql_headers, json=payload)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise FetchError(f"GraphQL request failed: {e}") from e
+
+            data, delay = self.read_graphql_response(response)
+            if delay is None:
+                break
+            if attempt == RATE_LIMIT_MAX_RETRIES:
+                raise FetchError(f"GraphQL request failed: still rate limited after {RATE_LIMIT_MAX_RETRIES} retries")
+            print(f"\n⏳ GraphQL rate limit reached, pausing {delay:.0f}s...")
+            self.governor.pause('graphql', delay)
+
+        if response.status_code == 200:
+            await self.run_blocking(self.save_to_cache, cache_key, data, 'graphql')
+            return data
+        return self.read_failed_response('GraphQL', response)
+
+    async def make_rest_request_async(self, endpoint: str, params: Dict = None) -> Dict:
+        """Make a REST API request with response caching and revalidation"""
+        return await self._rest_request_async(endpoint, params, include_links=False)
+
+    async def make_rest_page_request_async(self, endpoint: str, params: Dict = None) -> Tuple[List, Dict[str, str]]:
+        """Fetch one page of a REST listing along with its Link header targets"""
+        page = await self._rest_request_async(endpoint, params, include_links=True)
+        if not page:
+            return [], {}
+        return page['items'], page['links']
+
+    async def _rest_request_async(self, endpoint: str, params: Optional[Dict], include_links: bool):
+        """Shared REST implementation; cache keys match the sync tracker"""
+        cache_key, params = self.canonical_request('rest_page' if include_links else 'rest', endpoint, params)
+        stats_endpoint = endpoint_label(endpoint)
+
+        cached_entry = await self.run_blocking(self.cache.get_entry, cache_key)
+        if cached_entry is not None and cached_entry.is_fresh:
+            self.cache_stats.record(stats_endpoint, 'hit')
+            return cached_entry.data
+
+        headers = self.get_conditional_headers(cached_entry)
+        url = f"{self.base_url}/{endpoint}"
+        resource = 'search' if endpoint.startswith('search/') else 'core'
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            try:
+                response = await self.send_request('GET', url, resource, headers=headers, params=params)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise FetchError(f"REST request failed: {e}") from e
+
+            delay = self.governor.retry_delay(resource, response)
+            if delay is None:
+                break
+            if attempt == RATE_LIMIT_MAX_RETRIES:
+                raise FetchError(f"REST request failed: still rate limited after {RATE_LIMIT_MAX_RETRIES} retries")
+            print(f"\n⏳ {resource} rate limit reached, pausing {delay:.0f}s...")
+            self.governor.pause(resource, delay)
+
+        if response.status_code == 304 and cached_entry is not None:
+            self.cache_stats.record(stats_endpoint, 'revalidated')
+            await self.run_blocking(self.cache.touch, cache_key, CACHE_EXPIRY_HOURS * 3600)
+            return cached_entry.data
+
+        self.cache_stats.record(stats_endpoint, 'miss')
+        if response.status_code == 200:
+            data = self.read_rest_response(response, include_links)
+            await self.run_blocking(self.save_to_cache, cache_key, data, self.get_endpoint_class(endpoint),
+                                    etag=response.headers.get('ETag'),
+                                    last_modified=response.headers.get('Last-Modified'))
+            return data
+        return self.read_failed_response('REST', response, endpoint)
+
+    async def paginate_rest_request_async(self, endpoint: str, params: Dict = None,
+                                          concurrent: bool = True) -> AsyncIterator[Dict]:
+        """Stream every item of a paginated REST listing
+
+        Same paging rules as the sync tracker: once ``rel="last"`` is known
+        the remaining pages are requested together (bounded by the tracker's
+        concurrency limit) and yielded in order.
+        """
+        params = dict(params or {})
+        params.setdefault('per_page', 100)
+
+        items, links = await self.make_rest_page_request_async(endpoint, params)
+        for item in self._page_items(items):
+            yield item
+
+        first_page = int(params.get('page', 1))
+        last_page = self._link_page_number(links.get('last'))
+        if concurrent and last_page and last_page > first_page:
+            tasks = [asyncio.ensure_future(self.make_rest_page_request_async(endpoint, {**params, 'page': page}))
+                     for page in range(first_page + 1, last_page + 1)]
+            try:
+                for task in tasks:
+                    for item in self._page_items((await task)[0]):
+                        yield item
+            finally:
+                # Caller stopped early: drop pages that are still pending
+                for task in tasks:
+                    task.cancel()
+            return
+
+        while links.get('next'):
+            next_page = self._link_page_number(links['next'])
+            if next_page:
+                endpoint_next, params_next = endpoint, {**params, 'page': next_page}
+            else:
+                endpoint_next, params_next = self._split_link(links['next'])
+            items, links = await self.make_rest_page_request_async(endpoint_next, params_next)
+            for item in self._page_items(items):
+                yield item
+
+    async def get_user_contributions_graphql_async(self, username: str, start_date: str) -> Dict:
+        """Get comprehensive user contributions using GraphQL"""
+        return await self.make_graphql_request_async(USER_CONTRIBUTIONS_QUERY,
+                                                     {'username': username, 'from': start_date})
+
+    async def get_user_pull_requests_page_graphql_async(self, username: str, cursor: str) -> Dict:
+        """Get the next page of a user's pull requests after ``cursor``"""
+        return await self.make_graphql_request_async(PULL_REQUESTS_PAGE_QUERY,
+                                                     {'username': username, 'cursor': cursor})
+
+    async def collect_pull_requests_in_window_async(self, username: str, first_page: Dict, start_date: datetime,
+                                                    end_date: datetime = None) -> List[Dict]:
+        """Collect a user's pull requests created inside the window"""
+        recent_prs = []
+        page = first_page or {}
+
+        while True:
+            prs, cursor = self.filter_pull_requests_page(page, start_date, end_date)
+            recent_prs.extend(prs)
+            if cursor is None:
+                return recent_prs
+
+            response = await self.get_user_pull_requests_page_graphql_async(username, cursor)
+            page = (self.read_graphql_user(response) or {}).get('pullRequests') or {}
+
+    async def get_users_contributions_graphql_batch_async(self, usernames: List[str],
+                                                          start_date: str) -> Dict[str, Dict]:
+        """Get contributions for several users in one aliased GraphQL query"""
+        if not usernames:
+            return {}
+
+        query, variables = self.build_users_contributions_batch_query(usernames, start_date)
+        try:
+            response = await self.make_graphql_request_async(query, variables)
+        except FetchError as e:
+            print(f"{e} (batch of {len(usernames)} users, retrying them one at a time)")
+            return {}
+        return self.split_users_contributions_batch(usernames, response)
+
+    async def prefetch_graphql_contributions_async(self, usernames: List[str], start_date: str,
+                                                   batch_size: int = GRAPHQL_BATCH_SIZE) -> Dict[str, Dict]:
+        """Fetch GraphQL contribution payloads in aliased batches, then singly for the rest"""
+        payloads = {}
+        batches = self.get_graphql_batches(usernames, batch_size)
+        for result in await asyncio.gather(*(self.get_users_contributions_graphql_batch_async(batch, start_date)
+                                             for batch in batches)):
+            payloads.update(result)
+
+        remaining = [username for username in usernames if username not in payloads]
+        results = await asyncio.gather(*(self.get_user_contributions_graphql_async(username, start_date)
+                                         for username in remaining), return_exceptions=True)
+        for username, result in zip(remaining, results):
+            if not isinstance(result, BaseException):
+                payloads[username] = result  # Failures are retried and reported per user
+
+        return payloads
+
+    async def get_user_reviews_rest_async(self, username: str, start_date: str) -> List[Dict]:
+        """Get detailed review information using REST API across all organizations"""
+        reviews = []
+
+        for org_name in self.organizations:
+            items = self.paginate_rest_request_async('search/issues',
+                                                     self.get_review_search_params(username, org_name, start_date))
+            async for item in items:
+                if item.get('pull_request'):
+                    reviews.append(self.read_review_item(item, org_name))
+
+        return reviews
+
+    async def get_organization_repositories_async(self, org_name: str) -> AsyncIterator[str]:
+        """Stream names of active (non-archived, non-fork) repositories in an organization"""
+        async for repo in self.paginate_rest_request_async(f'orgs/{org_name}/repos'):
+            if self.is_active_repository(repo):
+                yield repo['name']
+
+    async def get_repository_contributions_async(self, username: str, start_date: datetime) -> Dict:
+        """Fallback method: iterate through repositories in all organizations to get contributions"""
+        logins = {username.lower(): username}
+        totals = self.new_repository_totals([username])
+
+        for org_name in self.organizations:
+            async for repo_name in self.get_organization_repositories_async(org_name):
+                commits = self.paginate_rest_request_async(
+                    f'repos/{org_name}/{repo_name}/commits',
+                    {'author': username, 'since': start_date.isoformat()}
+                )
+                repo_counts = {username: {'commits': len([commit async for commit in commits]), 'prs': 0}}
+
+                prs = self.paginate_rest_request_async(f'repos/{org_name}/{repo_name}/pulls',
+                                                       REPOSITORY_PULLS_PARAMS, concurrent=False)
+                async for pr in prs:
+                    if self.predates_window(pr, start_date):
+                        break
+                    self.count_repository_login(repo_counts, logins, (pr.get('user') or {}).get('login'), 'prs')
+                await prs.aclose()
+
+                self.add_repository_counts(totals, org_name, repo_name, repo_counts)
+
+        return self.summarize_repository_totals(totals)[username]
+
+    async def get_repository_contributions_for_users_async(self, usernames: List[str],
+                                                           start_date: datetime) -> Dict[str, Dict]:
+        """Repo-centric fallback: scan each repository once for all users"""
+        if not usernames:
+            return {}
+        logins = {username.lower(): username for username in usernames}
+        totals = self.new_repository_totals(usernames)
+
+        repositories = [(org_name, repo_name)
+                        for org_name in self.organizations
+                        async for repo_name in self.get_organization_repositories_async(org_name)]
+
+        scans = await asyncio.gather(*(self.scan_repository_contributions_async(org_name, repo_name, logins, start_date)
+                                       for org_name, repo_name in repositories))
+        for (org_name, repo_name), repo_counts in zip(repositories, scans):
+            self.add_repository_counts(totals, org_name, repo_name, repo_counts)
+
+        return self.summarize_repository_totals(totals)
+
+    async def scan_repository_contributions_async(self, org_name: str, repo_name: str, logins: Dict[str, str],
+                                                  start_date: datetime) -> Dict[str, Dict[str, int]]:
+        """Count commits and PRs per tracked user in one repository"""
+        counts: Dict[str, Dict[str, int]] = {}
+
+        commits = self.paginate_rest_request_async(
+            f'repos/{org_name}/{repo_name}/commits',
+            {'since': start_date.isoformat()}
+        )
+        async for commit in commits:
+            self.count_repository_login(counts, logins, (commit.get('author') or {}).get('login'), 'commits')
+
+        prs = self.paginate_rest_request_async(f'repos/{org_name}/{repo_name}/pulls',
+                                               REPOSITORY_PULLS_PARAMS, concurrent=False)
+        async for pr in prs:
+            if self.predates_window(pr, start_date):
+                break
+            self.count_repository_login(counts, logins, (pr.get('user') or {}).get('login'), 'prs')
+        await prs.aclose()
+
+        return counts
+
+    async def track_user_contributions_async(self, username: str, full_name: str, start_date: datetime = None,
+                                             end_date: datetime = None, days_back: int = 30,
+                                             graphql_data: Dict = None, rest_data: Dict = None) -> ContributionMetrics:
+        """Track comprehensive contributions for a single user"""
+        start_date, end_date = self.resolve_window(start_date, end_date, days_back)
+        start_date_str = start_date.isoformat()
+
+        metrics = ContributionMetrics(username=username, full_name=full_name)
+
+        if graphql_data is None:
+            graphql_data = await self.get_user_contributions_graphql_async(username, start_date_str)
+
+        user_data = self.read_graphql_user(graphql_data)
+        if user_data:
+            self.add_graphql_contributions(metrics, user_data)
+            recent_prs = await self.collect_pull_requests_in_window_async(
+                username, user_data.get('pullRequests'), start_date, end_date)
+            self.add_pull_request_details(metrics, recent_prs)
+
+        else:
+            if rest_data is None:
+                rest_data = await self.get_repository_contributions_async(username, start_date)
+            self.add_repository_contributions(metrics, rest_data)
+
+        reviews = await self.get_user_reviews_rest_async(username, start_date_str.split('T')[0])
+        if not metrics.reviews_given:
+            metrics.reviews_given = len(reviews)
+
+        return self.calculate_gamification_scores(metrics)
+
+    async def fetch_daily_contributions_async(self, username: str, first_day: date,
+                                              last_day: date) -> Optional[Dict[date, DailyCounts]]:
+        """Fetch per-day contribution counts for [first_day, last_day] (UTC)"""
+        buckets: Dict[date, DailyCounts] = {}
+        variables = self.get_daily_contributions_variables(username, first_day, last_day)
+
+        while variables['withCommits'] or variables['withPRs'] or variables['withReviews']:
+            response = await self.make_graphql_request_async(DAILY_CONTRIBUTIONS_QUERY, dict(variables))
+            user_data = self.read_graphql_user(response)
+            if not user_data:
+                return None
+            self.add_daily_contributions_page(user_data.get('contributionsCollection') or {}, variables, buckets)
+
+        return buckets
+
+    async def sync_daily_contributions_async(self, username: str, first_day: date, last_day: date) -> bool:
+        """Fetch the missing or mutable days of [first_day, last_day] into the per-day store"""
+        store = self.contribution_store
+        missing_days = await self.run_blocking(store.missing_days, username, first_day, last_day)
+        for range_start, range_end in group_date_ranges(missing_days):
+            buckets = await self.fetch_daily_contributions_async(username, range_start, range_end)
+            if buckets is None:
+                return False
+            await self.run_blocking(store.save_days, username, days_between(range_start, range_end), buckets)
+        return True
+
+    async def track_user_contributions_incremental_async(self, username: str, full_name: str,
+                                                         start_date: datetime = None, end_date: datetime = None,
+                                                         days_back: int = 30) -> ContributionMetrics:
+        """Track a user from the per-day store, fetching only missing or mutable days"""
+        start_date, end_date = self.resolve_window(start_date, end_date, days_back)
+        first_day, last_day = start_date.date(), end_date.date()
+
+        if not await self.sync_daily_contributions_async(username, first_day, last_day):
+            return await self.track_user_contributions_async(username, full_name, start_date, end_date, days_back)
+
+        totals = await self.run_blocking(self.contribution_store.sum_range, username, first_day, last_day)
+        metrics = self.metrics_from_daily_counts(username, full_name, totals)
+
+        if not metrics.reviews_given:
+            metrics.reviews_given = len(await self.get_user_reviews_rest_async(username, first_day.isoformat()))
+
+        return self.calculate_gamification_scores(metrics)
+
+    async def track_all_users_async(self, start_date: datetime = None, end_date: datetime = None,
+                                    days_back: int = 30, batch_size: int = GRAPHQL_BATCH_SIZE,
+                                    incremental: bool = False, run_id: str = None) -> List[ContributionMetrics]:
+        """Track contributions for all users in config as concurrent tasks
+
+        All users run as tasks of one ``gather``-style group; the number of
+        requests actually in flight is bounded by ``concurrency``. Results,
+        ranking and run journaling match the sync tracker.
+        """
+        user_items = list(self.load_users_config().items())
+        total_users = len(user_items)
+        completed = 0
+
+        start_date, date_info = self.describe_window(start_date, end_date, days_back)
+
+        results: List[Optional[ContributionMetrics]] = [None] * total_users
+        pending = await self.run_blocking(self.load_run_progress, run_id, user_items, results)
+        self.start_run_summary(total_users, len(pending))
+
+        print(f"\n🚀 Starting to track {len(pending)} users ({date_info}) with {self.concurrency} concurrent requests...")
+
+        graphql_payloads = {}
+        rest_payloads = {}
+        if not incremental and pending:
+            graphql_payloads = await self.prefetch_graphql_contributions_async(
+                [user_items[index][0] for index in pending], start_date.isoformat(), batch_size)
+
+            fallback_users = self.get_graphql_fallback_users(graphql_payloads)
+            if fallback_users:
+                print(f"↪️  GraphQL unavailable for {len(fallback_users)} users, scanning repositories once...")
+                try:
+                    rest_payloads = await self.get_repository_contributions_for_users_async(fallback_users, start_date)
+                except FetchError as e:
+                    # Each of these users scans on its own and fails on its own
+                    print(f"{e} (shared repository scan, falling back to per-user scans)")
+
+        async def track(index: int, username: str, full_name: str):
+            try:
+                if incremental:
+                    metrics = await self.track_user_contributions_incremental_async(
+                        username, full_name, start_date, end_date, days_back)
+                else:
+                    metrics = await self.track_user_contributions_async(
+                        username, full_name, start_date, end_date, days_back,
+                        graphql_payloads.get(username), rest_payloads.get(username))
+                return index, metrics, None
+            except Exception as e:
+                return index, None, e
+
+        failed = 0
+        tasks = [asyncio.ensure_future(track(index, *user_items[index])) for index in pending]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                index, metrics, error = await next_result
+                username, full_name = user_items[index]
+                completed += 1
+                await self.run_blocking(self.record_user_result, run_id, username, metrics, error)
+                self.report_user_result(completed, len(pending), username, full_name, error)
+                if error is None:
+                    results[index] = metrics
+                else:
+                    failed += 1
+        except asyncio.CancelledError:
+            self.finish_run(run_id, RUN_INTERRUPTED)
+            raise
+        finally:
+            # Cancelled from outside: do not leave user tasks running
+            for task in tasks:
+                task.cancel()
+
+        return self.finish_tracking(run_id, results, failed)
+
+
+class AsyncTeamContributionTracker(AsyncContributionTracker, TeamContributionTracker):
+    """Asyncio version of the team tracker; aggregation and output are inherited"""
+
+    async def get_configured_teams_async(self) -> List[Dict]:
+        """Look up every configured team in every organization concurrently"""
+        teams = await asyncio.gather(*(self.get_team_async(*lookup) for lookup in self.get_team_lookups()))
+        return [team for team in teams if team]
+
+    async def get_team_async(self, org_name: str, team_slug: str, display_name: str) -> Dict:
+        """Get one team's info ({} when it does not exist in ``org_name``)"""
+        cache_key = self.get_cache_key("team_info", org_name, team_slug)
+        cached_team = await self.run_blocking(self.load_from_cache, cache_key, 'team_info')
+        if cached_team is not None:
+            return self.label_team(cached_team, org_name, display_name)
+
+        try:
+            team_response = await self.make_rest_request_async(f'orgs/{org_name}/teams/{team_slug}')
+        except FetchError as e:
+            # Not cached: the team may well exist, so the next run asks again
+            print(f"  ⚠️  Warning: Could not look up team '{team_slug}' in {org_name}: {e}")
+            return {}
+
+        team = self.read_team_response(org_name, team_slug, display_name, team_response)
+        await self.run_blocking(self.save_to_cache, cache_key, team, 'team_info')
+        return team
+
+    async def get_team_members_async(self, org_name: str, team_slug: str) -> List[str]:
+        """Get members of a specific team in a specific organization"""
+        cache_key = self.get_cache_key("team_members", org_name, team_slug)
+        cached_members = await self.run_blocking(self.load_from_cache, cache_key, 'team_members')
+        if cached_members is not None:
+            return cached_members
+
+        members = [member['login'] async for member in
+                   self.paginate_rest_request_async(f'orgs/{org_name}/teams/{team_slug}/members')]
+
+        await self.run_blocking(self.save_to_cache, cache_key, members, 'team_members')
+        return members
+
+    async def discover_teams_async(self, mode: str = TEAM_DISCOVERY, refresh: bool = False) -> TeamRegistry:
+        """Resolve configured teams and their members once per run (``refresh`` to redo it)"""
+        if self.team_registry is not None and not refresh:
+            return self.team_registry
+
+        if mode == 'graphql':
+            self.team_registry = await self.discover_teams_graphql_async()
+            return self.team_registry
+
+        teams = await self.get_configured_teams_async()
+        memberships = await asyncio.gather(*(self.get_team_members_async(team['org_name'], team['slug'])
+                                             for team in teams), return_exceptions=True)
+
+        members = {(team['org_name'], team['slug']): logins
+                   for team, logins in self.pair_team_members(teams, memberships)}
+        self.team_registry = TeamRegistry(teams=teams, members=members)
+        return self.team_registry
+
+    async def discover_teams_graphql_async(self) -> TeamRegistry:
+        """Build the team registry from one paginated GraphQL listing per organization"""
+        configured_teams = self.load_teams_config()
+        if not configured_teams:
+            print("No teams configured in config.json. Please add a 'teams' section.")
+            return TeamRegistry(teams=[], members={})
+
+        print(f"Loading teams via GraphQL from organizations: {', '.join(self.organizations)}")
+        org_results = await asyncio.gather(*(self.get_org_teams_graphql_async(org_name, configured_teams)
+                                             for org_name in self.organizations))
+
+        registry = TeamRegistry(teams=[], members={})
+        for org_name, org_teams in zip(self.organizations, org_results):
+            if org_teams is None:
+                print(f"  ↪️  GraphQL team listing unavailable for {org_name}, using REST lookups")
+                found = await asyncio.gather(*(self.get_team_async(org_name, team_slug, display_name)
+                                               for team_slug, display_name in configured_teams.items()))
+                found = [team for team in found if team]
+                memberships = await asyncio.gather(*(self.get_team_members_async(org_name, team['slug'])
+                                                     for team in found), return_exceptions=True)
+                org_teams = {team['slug']: (team, logins) for team, logins in self.pair_team_members(found, memberships)}
+            else:
+                self.report_org_teams(org_name, org_teams, configured_teams)
+            self.add_org_teams(registry, org_name, org_teams, configured_teams)
+
+        return registry
+
+    async def get_org_teams_graphql_async(self, org_name: str,
+                                          configured_teams: Dict[str, str]) -> Optional[Dict[str, Tuple[Dict, List[str]]]]:
+        """List an organization's configured teams with their members via GraphQL (None on failure)"""
+        found = {}
+        cursor = None
+        while True:
+            try:
+                response = await self.make_graphql_request_async(TEAM_DISCOVERY_QUERY,
+                                                                 {'org': org_name, 'cursor': cursor})
+            except FetchError:
+                return None
+            connection = ((response.get('data') or {}).get('organization') or {}).get('teams')
+            if connection is None:
+                return None
+
+            for team, logins, members_cursor in self.read_team_discovery_page(org_name, connection, configured_teams):
+                while members_cursor:
+                    try:
+                        page = await self.make_graphql_request_async(
+                            TEAM_MEMBERS_QUERY, {'org': org_name, 'slug': team['slug'], 'cursor': members_cursor})
+                    except FetchError:
+                        return None
+                    more_logins, members_cursor = self.read_team_members_page(page)
+                    logins.extend(more_logins)
+                found[team['slug']] = (team, logins)
+
+            page_info = connection.get('pageInfo') or {}
+            if len(found) == len(configured_teams) or not page_info.get('hasNextPage'):
+                return found
+            cursor = page_info.get('endCursor')
+
+    async def map_users_to_teams_async(self, users: Dict[str, str],
+                                       registry: TeamRegistry = None) -> Dict[str, List[Dict]]:
+        """Map each user to their configured team memberships"""
+        print(f"\n🔍 Discovering team memberships for {len(users)} users...")
+
+        if registry is None:
+            registry = await self.discover_teams_async()
+        return self.read_user_teams(users, registry)
+
+
+async def run(args):
+    """Run one tracking pass with parsed command line arguments"""
+    token = os.getenv('GITHUB_TOKEN')
+    if not token:
+        print("Error: GITHUB_TOKEN environment variable not set")
+        return
+
+    tracker_class = AsyncTeamContributionTracker if args.teams else AsyncContributionTracker
+    async with tracker_class(token, concurrency=args.concurrency,
+                             timeout=(HTTP_TIMEOUT[0], args.timeout),
+                             requests_per_hour=args.requests_per_hour,
+                             cache_backend=args.cache_backend) as tracker:
+        tracker.contribution_store.mutable_days = args.mutable_days
+        tracker.cache_granularity = args.cache_granularity
+
+        if args.clear_cache:
+            tracker.cache.clear()
+            print("🗑️ Cache cleared")
+        else:
+            tracker.cache.purge_expired(keep_validated_for=CACHE_REVALIDATE_DAYS * 86400)
+
+        print("🚀 Starting Async GitHub Contribution Tracking...")
+        print(f"Organizations: {', '.join(tracker.organizations)}")
+
+        run = start_or_resume_run(tracker, args)
+        if run is None:
+            return
+        filename_suffix = run['filename_suffix']
+
+        metrics_list = await tracker.track_all_users_async(start_date=run['start_date'], end_date=run['end_date'],
+                                                           days_back=run['days_back'],
+                                                           batch_size=args.graphql_batch_size,
+                                                           incremental=run['incremental'], run_id=run['run_id'])
+        if not metrics_list:
+            print("❌ No contribution data found. Check your configuration and token permissions.")
+            return
+
+        tracker.print_leaderboard(metrics_list)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"advanced_contributions_{filename_suffix}_{timestamp}.csv"
+        tracker.save_results(metrics_list, filename)
+        tracker.save_raw_counts(metrics_list, filename.replace('.csv', '_raw.csv'))
+
+        if args.teams:
+            registry = await tracker.discover_teams_async(args.team_discovery)
+            user_teams = await tracker.map_users_to_teams_async(tracker.load_users_config(), registry)
+            team_metrics = tracker.create_team_metrics(registry.teams, user_teams, metrics_list)
+            if team_metrics:
+                tracker.print_team_leaderboard(team_metrics)
+                tracker.print_team_details(team_metrics, args.top_teams)
+                tracker.save_team_results(team_metrics, f"team_contributions_{filename_suffix}_{timestamp}.csv")
+            else:
+                print("❌ No team data found. Users may not be in any teams or teams may be private.")
+
+        print(f"\n✅ Tracking complete! Results saved to {filename}")
+        cache_entries = tracker.cache.count()
+        print(f"🗄 Cache: {sum(cache_entries.values())} entries (expires after {CACHE_EXPIRY_HOURS}h)")
+        tracker.print_cache_report()
+
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Async GitHub Contribution Tracker')
+    parser.add_argument('--days', type=int, default=30, help='Number of days to track (default: 30)')
+    parser.add_argument('--quarter', type=str, help='Track by quarter (format: Q1-2025, Q2-2024, etc.)')
+    parser.add_argument('--year', type=int, help='Year for quarter tracking (default: current year)')
+    parser.add_argument('--clear-cache', action='store_true', help='Clear cache before running')
+    parser.add_argument('--cache-backend', choices=CACHE_BACKENDS, default=CACHE_BACKEND, help=f'Response cache backend (default: {CACHE_BACKEND})')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help=f'API requests in flight at once (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--timeout', type=float, default=HTTP_TIMEOUT[1], help=f'Per-request read timeout in seconds (default: {HTTP_TIMEOUT[1]:.0f})')
+    parser.add_argument('--requests-per-hour', type=float, default=REQUESTS_PER_HOUR, help=f'Cap on the core REST request rate (default: {REQUESTS_PER_HOUR})')
+    parser.add_argument('--graphql-batch-size', type=int, default=GRAPHQL_BATCH_SIZE, help=f'Users per aliased GraphQL query, 1 disables batching (default: {GRAPHQL_BATCH_SIZE})')
+    parser.add_argument('--incremental', action='store_true', help='Build results from the per-day store, fetching only new days')
+    parser.add_argument('--mutable-days', type=int, default=MUTABLE_DAYS, help=f'Recent days refetched on every incremental run (default: {MUTABLE_DAYS})')
+    parser.add_argument('--cache-granularity', type=int, default=CACHE_TIME_GRANULARITY, help=f'Seconds window starts are rounded down to, so repeated runs share cache entries (default: {CACHE_TIME_GRANULARITY})')
+    parser.add_argument('--teams', action='store_true', help='Also aggregate and save team results')
+    parser.add_argument('--top-teams', type=int, default=5, help='Number of top teams to show details (default: 5)')
+    parser.add_argument('--team-discovery', choices=TEAM_DISCOVERY_MODES, default=TEAM_DISCOVERY, help=f'How teams and members are loaded (default: {TEAM_DISCOVERY})')
+    parser.add_argument('--resume', type=str, metavar='RUN_ID', help='Finish an interrupted run, tracking only users it has not completed')
+    parser.add_argument('--list-runs', action='store_true', help='List recent runs from the run journal and exit')
+
+    args = parser.parse_args()
+    if args.list_runs:
+        print_runs(RunJournal(os.path.join(CACHE_DIR, RUN_JOURNAL_FILE)))
+        return
+
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
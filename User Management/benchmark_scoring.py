@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Scoring Benchmark: per-object scalar scoring vs vectorized NumPy scoring
+
+Generates synthetic contribution counts and scores them two ways:
+
+1. **Before:** ``calculate_gamification_scores`` per ContributionMetrics, then
+   a sort of the dataclass list to assign ranks
+2. **After:** ``score_arrays`` on count columns (scores + stable argsort rank)
+
+Every score column and every rank is compared between the two, so the
+benchmark doubles as an equivalence check.
+
+Usage Examples:
+    python benchmark_scoring.py                          # 1k, 100k and 1M users
+    python benchmark_scoring.py --sizes 1000 10000       # custom sizes
+    python benchmark_scoring.py --seed 7                 # different synthetic data
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from advanced_contribution_tracker import ContributionMetrics, ContributionScorer, ScoringConfig
+from vectorized_scoring import COUNT_COLUMNS, SCORE_COLUMNS, score_arrays
+
+
+def synthetic_counts(users: int, seed: int) -> dict:
+    """Count columns shaped roughly like a real organization (many idle users)"""
+    rng = np.random.default_rng(seed)
+    active = rng.random(users) < 0.7
+    prs_opened = rng.poisson(4, users) * active
+    return {
+        'commits_count': rng.poisson(25, users) * active,
+        'prs_opened': prs_opened,
+        'prs_merged': rng.binomial(prs_opened, 0.8),
+        'reviews_given': rng.poisson(6, users) * (rng.random(users) < 0.6),
+        'review_comments': rng.poisson(12, users) * (rng.random(users) < 0.5)
+    }
+
+
+def run_scalar(counts: dict, scoring: ScoringConfig) -> tuple:
+    """Score dataclass objects one by one and rank them; returns (seconds, metrics in input order)"""
+    # A scorer on its own: no tracker (cache, session) is needed
+    scorer = ContributionScorer(scoring)
+    metrics_list = [
+        ContributionMetrics(username=f'user{i}', full_name=f'User {i}',
+                            **{column: int(counts[column][i]) for column in COUNT_COLUMNS})
+        for i in range(len(counts['commits_count']))
+    ]
+    start = time.perf_counter()
+    for metrics in metrics_list:
+        scorer.calculate_gamification_scores(metrics)
+    scorer.assign_ranks(list(metrics_list))
+    return time.perf_counter() - start, metrics_list
+
+
+def run_vectorized(counts: dict, scoring: ScoringConfig) -> tuple:
+    """Score count columns in one pass; returns (seconds, score arrays)"""
+    start = time.perf_counter()
+    scores = score_arrays(*(counts[column] for column in COUNT_COLUMNS), scoring)
+    return time.perf_counter() - start, scores
+
+
+def identical(metrics_list: list, scores: dict) -> bool:
+    """True when every score column and rank matches exactly"""
+    for column in SCORE_COLUMNS:
+        scalar = np.array([getattr(metrics, column) for metrics in metrics_list])
+        if not np.array_equal(scalar, scores[column]):
+            return False
+    return True
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Benchmark scalar vs vectorized gamification scoring')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 1000000], help='User counts to benchmark (default: 1000 100000 1000000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for synthetic data (default: 42)')
+    args = parser.parse_args()
+
+    scoring = ScoringConfig()
+    print(f"🚀 Benchmarking scoring for {', '.join(f'{size:,}' for size in args.sizes)} users\n")
+    print(f"{'Users':<12} {'Scalar (s)':<12} {'Vectorized (s)':<16} {'Speedup':<10} {'Identical':<10}")
+    print("-" * 64)
+
+    for size in args.sizes:
+        counts = synthetic_counts(size, args.seed)
+        scalar_seconds, metrics_list = run_scalar(counts, scoring)
+        vector_seconds, scores = run_vectorized(counts, scoring)
+        speedup = scalar_seconds / vector_seconds if vector_seconds else float('inf')
+        print(f"{size:<12,} {scalar_seconds:<12.4f} {vector_seconds:<16.4f} {speedup:<10.1f} "
+              f"{'yes' if identical(metrics_list, scores) else 'NO':<10}")
+
+
+if __name__ == "__main__":
+    main()
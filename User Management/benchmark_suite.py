@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite: requests, bytes and wall time per tracked user
+
+Runs the two per-user entry points for a sample of users:
+
+- ``track_user_contributions``: GraphQL contributions, PR pages and the
+  REST review search
+- ``get_repository_contributions``: the REST fallback iterating every
+  repository's commits and pull requests
+
+1. **Record:** against an in-process ``github_simulator.py`` (default) or,
+   with ``--live``, the GitHub API configured for the trackers; every
+   exchange goes to an archive (``http_archive.py``)
+2. **Replay:** the archive is served back without any network access, so
+   request counts are exact and wall time measures the trackers alone
+3. **Compare:** ``--baseline`` checks a saved report; more requests per user,
+   requests missing from the archive, or bytes / replay time above
+   ``--tolerance`` count as regressions and exit with status 1 (replay
+   times are only compared between runs with the same ``--replay-timing``)
+
+Usage Examples:
+    python benchmark_suite.py                                        # 20 of 200 simulated users
+    python benchmark_suite.py --save-baseline bench_baseline.json
+    python benchmark_suite.py --baseline bench_baseline.json         # after a change
+    python benchmark_suite.py --live --sample 20 --record bench.jsonl.gz   # real GitHub, needs GITHUB_TOKEN
+    python benchmark_suite.py --replay bench.jsonl.gz --baseline bench_baseline.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from advanced_contribution_tracker import AdvancedContributionTracker
+from github_simulator import GitHubSimulator, SimulatorConfig
+from rate_limit import UNMETERED_PER_HOUR, RateLimitGovernor
+
+# Replay time differences below this are timer noise, not regressions
+TIME_NOISE_SECONDS = 0.1
+
+# Entry points measured per user: (tracker, username, full name, window start)
+ENTRY_POINTS: Dict[str, Callable] = {
+    'track_user_contributions':
+        lambda tracker, username, full_name, start: tracker.track_user_contributions(
+            username, full_name, start_date=start),
+    'get_repository_contributions':
+        lambda tracker, username, full_name, start: tracker.get_repository_contributions(username, start),
+}
+
+
+@contextmanager
+def scratch_directory():
+    """Run inside an empty temporary directory, so every pass starts with an empty CACHE"""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='aces-bench-') as directory:
+        os.chdir(directory)
+        try:
+            yield directory
+        finally:
+            os.chdir(previous)
+
+
+def run_entry_points(transport, trackers: Dict[str, AdvancedContributionTracker],
+                     users: List[Tuple[str, str]], days: int) -> Dict[str, Dict]:
+    """Call every entry point for every user and measure the traffic of each"""
+    start = datetime.now() - timedelta(days=days)
+    results = {}
+    for name, entry_point in ENTRY_POINTS.items():
+        tracker = trackers[name]
+        transport.stats.reset()
+        misses_before = getattr(transport, 'misses', 0)
+        started = time.perf_counter()
+        for username, full_name in users:
+            entry_point(tracker, username, full_name, start)
+        results[name] = {
+            'users': len(users),
+            'requests': transport.stats.requests,
+            'bytes': transport.stats.bytes,
+            'seconds': time.perf_counter() - started,
+            'misses': getattr(transport, 'misses', 0) - misses_before
+        }
+    return results
+
+
+def make_trackers(token: str, api_url: Optional[str], graphql_url: Optional[str],
+                  organizations: Optional[List[str]]) -> Dict[str, AdvancedContributionTracker]:
+    """One tracker per entry point, each with its own cache in a scratch directory"""
+    trackers = {}
+    for name in ENTRY_POINTS:
+        os.makedirs(name)
+        os.chdir(name)
+        tracker = AdvancedContributionTracker(token)
+        os.chdir('..')
+        if api_url:
+            tracker.base_url = api_url
+            tracker.graphql_url = graphql_url or f"{api_url}/graphql"
+        if organizations:
+            tracker.organizations = organizations
+        trackers[name] = tracker
+    return trackers
+
+
+def record(archive: str, users: List[Tuple[str, str]], days: int, token: str,
+           api_url: str = None, graphql_url: str = None, organizations: List[str] = None,
+           unmetered: bool = False) -> Dict[str, Dict]:
+    """Record both entry points to ``archive`` and return their traffic"""
+    with scratch_directory():
+        trackers = make_trackers(token, api_url, graphql_url, organizations)
+        first = next(iter(trackers.values()))
+        if unmetered:
+            first.governor = RateLimitGovernor(UNMETERED_PER_HOUR, documented_limits=False)
+        first.record_http(archive, metadata={
+            'users': users, 'days': days, 'api_url': first.base_url,
+            'graphql_url': first.graphql_url, 'organizations': first.organizations
+        })
+        for tracker in trackers.values():
+            tracker.governor = first.governor
+            tracker.transport = first.transport
+        results = run_entry_points(first.transport, trackers, users, days)
+        first.transport.close()
+    return results
+
+
+def replay(archive: str, preserve_timing: bool = False) -> Dict[str, Dict]:
+    """Replay both entry points from ``archive`` and return their traffic"""
+    with scratch_directory():
+        trackers = make_trackers('replay', None, None, None)
+        first = next(iter(trackers.values()))
+        first.replay_http(archive, preserve_timing=preserve_timing)
+        metadata = first.transport.metadata
+        for tracker in trackers.values():
+            tracker.transport = first.transport
+            tracker.base_url = metadata['api_url']
+            tracker.graphql_url = metadata['graphql_url']
+            tracker.organizations = metadata['organizations']
+        users = [tuple(user) for user in metadata['users']]
+        return run_entry_points(first.transport, trackers, users, metadata['days'])
+
+
+def find_regressions(report: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """Describe every way ``report`` is worse than ``baseline``"""
+    regressions = []
+    for name, current in report.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current['requests_per_user'] > previous['requests_per_user']:
+            regressions.append(f"{name}: {current['requests_per_user']:.2f} requests/user "
+                               f"(baseline {previous['requests_per_user']:.2f})")
+        if current['misses']:
+            regressions.append(f"{name}: {current['misses']} requests not in the archive")
+        if current['bytes_per_user'] > previous['bytes_per_user'] * (1 + tolerance):
+            regressions.append(f"{name}: {current['bytes_per_user']:,.0f} bytes/user "
+                               f"(baseline {previous['bytes_per_user']:,.0f})")
+        same_timing = current['preserve_timing'] == previous.get('preserve_timing', False)
+        if same_timing and current['replay_seconds'] > max(previous['replay_seconds'] * (1 + tolerance),
+                                           previous['replay_seconds'] + TIME_NOISE_SECONDS):
+            regressions.append(f"{name}: {current['replay_seconds']:.3f}s replay "
+                               f"(baseline {previous['replay_seconds']:.3f}s)")
+    return regressions
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Record/replay benchmark of the per-user tracking entry points')
+    parser.add_argument('--users', type=int, default=200, help='Simulated users (default: 200)')
+    parser.add_argument('--repos', type=int, default=100, help='Simulated repositories (default: 100)')
+    parser.add_argument('--sample', type=int, default=20, help='Users measured (default: 20)')
+    parser.add_argument('--days', type=int, default=90, help='Tracking window in days (default: 90)')
+    parser.add_argument('--seed', type=int, default=42, help='Simulator random seed (default: 42)')
+    parser.add_argument('--live', action='store_true', help='Record against GITHUB_API_URL (default: api.github.com) and config.json users instead of the simulator')
+    parser.add_argument('--record', type=str, metavar='ARCHIVE', help='Keep the recording at this path (default: temporary)')
+    parser.add_argument('--replay', type=str, metavar='ARCHIVE', help='Only replay an existing recording')
+    parser.add_argument('--replay-timing', action='store_true', help='Keep recorded latencies during replay')
+    parser.add_argument('--baseline', type=str, metavar='JSON', help='Compare against a saved report; exit 1 on regression')
+    parser.add_argument('--save-baseline', type=str, metavar='JSON', help='Save this report as a baseline')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed increase in bytes and replay time (default: 0.2)')
+    args = parser.parse_args()
+
+    # Tracking runs in a scratch directory, so resolve every user path first
+    for name in ('record', 'replay', 'baseline', 'save_baseline'):
+        if getattr(args, name):
+            setattr(args, name, os.path.abspath(getattr(args, name)))
+
+    recorded = {}
+    archive = args.replay or args.record or os.path.join(tempfile.gettempdir(), f'aces-bench-{os.getpid()}.jsonl.gz')
+    if not args.replay:
+        if args.live:
+            token = os.getenv('GITHUB_TOKEN')
+            if not token:
+                print("Error: GITHUB_TOKEN environment variable not set")
+                return
+            with scratch_directory():
+                configured = AdvancedContributionTracker(token).load_users_config()
+            users = list(configured.items())[:args.sample]
+            print(f"🚀 Recording {len(users)} configured users against the GitHub API...")
+            recorded = record(archive, users, args.days, token)
+        else:
+            simulator = GitHubSimulator(SimulatorConfig(users=args.users, repos=args.repos, seed=args.seed),
+                                        port=0).start()
+            users = list(simulator.data.users_config()['users'].items())[:args.sample]
+            print(f"🚀 Recording {len(users)} of {args.users} simulated users ({args.repos} repositories)...")
+            recorded = record(archive, users, args.days, 'sim', api_url=simulator.url,
+                              organizations=simulator.config.orgs, unmetered=True)
+            simulator.stop()
+
+    print(f"📼 Replaying {archive}...\n")
+    try:
+        replayed = replay(archive, preserve_timing=args.replay_timing)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: Could not replay {archive}: {e}")
+        sys.exit(1)
+    finally:
+        if not args.replay and not args.record:
+            os.remove(archive)
+
+    report = {}
+    for name, result in replayed.items():
+        users = max(result['users'], 1)
+        report[name] = {
+            'users': result['users'],
+            'requests': result['requests'],
+            'requests_per_user': result['requests'] / users,
+            'bytes': result['bytes'],
+            'bytes_per_user': result['bytes'] / users,
+            'record_seconds': recorded.get(name, {}).get('seconds'),
+            'replay_seconds': result['seconds'],
+            'preserve_timing': args.replay_timing,
+            'misses': result['misses']
+        }
+
+    print(f"{'Entry point':<30} {'Users':<7} {'Requests':<10} {'Req/user':<10} {'KB':<10} "
+          f"{'Record s':<10} {'Replay s':<10} {'Misses':<7}")
+    print("-" * 98)
+    for name, row in report.items():
+        record_seconds = f"{row['record_seconds']:.3f}" if row['record_seconds'] is not None else '-'
+        print(f"{name:<30} {row['users']:<7} {row['requests']:<10} {row['requests_per_user']:<10.2f} "
+              f"{row['bytes'] / 1024:<10.1f} {record_seconds:<10} {row['replay_seconds']:<10.3f} {row['misses']:<7}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"   • {regression}")
+            sys.exit(1)
+        print(f"\n✅ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Team Aggregation Benchmark: nested membership scan vs team index
+
+Builds a synthetic organization (default: 500 teams, 20k users, each user
+in 1-3 teams) and aggregates team metrics two ways:
+
+1. **Before:** the original nested loop, scanning every user's teams for
+   every team (teams × users × memberships)
+2. **After:** ``TeamContributionTracker.create_team_metrics``, driven by a
+   (org, team) → members index built once
+
+Both results are compared field by field, including member order and ranks.
+
+Usage Examples:
+    python benchmark_team_metrics.py                          # 500 teams, 20k users
+    python benchmark_team_metrics.py --teams 2000 --users 50000
+"""
+
+import argparse
+import random
+import time
+from dataclasses import asdict
+from typing import Dict, List
+
+from advanced_contribution_tracker import ContributionMetrics
+from team_contribution_tracker import TeamContributionTracker, TeamMetrics
+
+
+def nested_team_metrics(teams: List[Dict], user_teams: Dict[str, List[Dict]],
+                        user_metrics: List[ContributionMetrics]) -> List[TeamMetrics]:
+    """Original create_team_metrics implementation, kept as the baseline"""
+    metrics_by_user = {m.username: m for m in user_metrics}
+    team_metrics_list = []
+
+    for team in teams:
+        team_slug = team['slug']
+        org_name = team['org_name']
+
+        team_members = []
+        for username, user_team_list in user_teams.items():
+            for user_team in user_team_list:
+                if (user_team['slug'] == team_slug and
+                        user_team.get('org_name') == org_name and
+                        username in metrics_by_user):
+                    team_members.append(metrics_by_user[username])
+                    break
+
+        if not team_members:
+            continue
+
+        team_metrics = TeamMetrics(
+            team_name=team.get('display_name', team['name']),
+            team_slug=team_slug,
+            team_description=team.get('description', ''),
+            member_count=len(team_members),
+            members=team_members
+        )
+        for member in team_members:
+            team_metrics.total_team_score += member.total_score
+            team_metrics.total_commits += member.commits_count
+            team_metrics.total_prs_opened += member.prs_opened
+            team_metrics.total_prs_merged += member.prs_merged
+            team_metrics.total_reviews_given += member.reviews_given
+            team_metrics.total_review_comments += member.review_comments
+        team_metrics.average_team_score = team_metrics.total_team_score / team_metrics.member_count
+        team_metrics_list.append(team_metrics)
+
+    team_metrics_list.sort(key=lambda x: x.total_team_score, reverse=True)
+    for i, team_metrics in enumerate(team_metrics_list):
+        team_metrics.team_rank = i + 1
+    return team_metrics_list
+
+
+def synthetic_org(team_count: int, user_count: int, seed: int):
+    """Return (teams, user_teams, user_metrics) for a synthetic organization"""
+    rng = random.Random(seed)
+    orgs = ['org-a', 'org-b']
+    teams = [{'slug': f'team-{i}', 'name': f'Team {i}', 'display_name': f'Team {i}',
+              'description': '', 'org_name': orgs[i % len(orgs)]}
+             for i in range(team_count)]
+
+    user_teams = {}
+    user_metrics = []
+    for i in range(user_count):
+        username = f'user{i}'
+        memberships = rng.sample(teams, rng.randint(1, 3))
+        user_teams[username] = [{'name': team['display_name'], 'slug': team['slug'],
+                                 'description': '', 'org_name': team['org_name']}
+                                for team in memberships]
+        user_metrics.append(ContributionMetrics(
+            username=username, full_name=f'User {i}',
+            commits_count=rng.randint(0, 60), prs_opened=rng.randint(0, 10), prs_merged=rng.randint(0, 8),
+            reviews_given=rng.randint(0, 20), review_comments=rng.randint(0, 30),
+            total_score=rng.uniform(0, 300)
+        ))
+    return teams, user_teams, user_metrics
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Benchmark nested vs index-based team aggregation')
+    parser.add_argument('--teams', type=int, default=500, help='Number of teams (default: 500)')
+    parser.add_argument('--users', type=int, default=20000, help='Number of users (default: 20000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    teams, user_teams, user_metrics = synthetic_org(args.teams, args.users, args.seed)
+    memberships = sum(len(team_list) for team_list in user_teams.values())
+    print(f"🚀 Aggregating {args.teams} teams, {args.users:,} users, {memberships:,} memberships\n")
+
+    # Aggregation only reads its arguments, so skip the API/cache setup in __init__
+    tracker = TeamContributionTracker.__new__(TeamContributionTracker)
+
+    start = time.perf_counter()
+    before = nested_team_metrics(teams, user_teams, user_metrics)
+    before_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    after = tracker.create_team_metrics(teams, user_teams, user_metrics)
+    after_seconds = time.perf_counter() - start
+
+    identical = [asdict(team) for team in before] == [asdict(team) for team in after]
+
+    print(f"{'Case':<24} {'Seconds':<10} {'Teams':<8}")
+    print("-" * 44)
+    print(f"{'Nested scan (before)':<24} {before_seconds:<10.3f} {len(before):<8}")
+    print(f"{'Team index (after)':<24} {after_seconds:<10.3f} {len(after):<8}")
+    speedup = before_seconds / after_seconds if after_seconds else float('inf')
+    print(f"\n📊 Speedup: {speedup:.1f}x, identical results: {'yes' if identical else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Transport Benchmark: per-call requests vs pooled keep-alive session
+
+Starts a local stub server that mimics a small GitHub JSON response and
+counts how many TCP connections (handshakes) it accepts. The same number of
+requests is then sent two ways:
+
+1. **Before:** module-level ``requests.get`` (new connection per call)
+2. **After:** the shared ``GitHubTransport`` session (pooled keep-alive)
+
+Usage Examples:
+    python benchmark_transport.py                    # 500 requests
+    python benchmark_transport.py --requests 2000    # 2000 requests
+    python benchmark_transport.py --latency 5        # add 5ms server latency
+"""
+
+import argparse
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from github_transport import GitHubTransport
+
+# Response body resembling a page of /orgs/{org}/repos
+STUB_BODY = json.dumps([
+    {'name': f'repo-{i}', 'archived': False, 'fork': False, 'owner': {'login': 'stub-org'}}
+    for i in range(50)
+]).encode()
+
+
+class StubGitHubServer(ThreadingHTTPServer):
+    """Local HTTP/1.1 server that counts accepted connections"""
+
+    daemon_threads = True
+
+    def __init__(self, latency_ms: float = 0.0):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.latency = latency_ms / 1000.0
+        self.connections = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self.lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    def reset(self):
+        with self.lock:
+            self.connections = 0
+            self.requests = 0
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves the stub JSON body, gzip-encoded when the client asks for it"""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        body = STUB_BODY
+        gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+        if gzipped:
+            body = gzip.compress(body)
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_case(server: StubGitHubServer, label: str, get, url: str, count: int) -> dict:
+    """Send ``count`` GET requests through ``get`` and collect stats"""
+    server.reset()
+    start = time.perf_counter()
+    for i in range(count):
+        response = get(url, params={'per_page': 100, 'page': i})
+        response.json()
+    elapsed = time.perf_counter() - start
+    return {
+        'case': label,
+        'requests': server.requests,
+        'handshakes': server.connections,
+        'seconds': elapsed,
+        'req_per_sec': count / elapsed if elapsed else 0.0
+    }
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Benchmark pooled vs per-call HTTP transport')
+    parser.add_argument('--requests', type=int, default=500, help='Requests per case (default: 500)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Server latency per request in ms (default: 0)')
+    args = parser.parse_args()
+
+    server = StubGitHubServer(latency_ms=args.latency)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/orgs/stub-org/repos"
+
+    print(f"🚀 Benchmarking {args.requests} requests against {url}\n")
+
+    results = [run_case(server, 'requests.get (before)', requests.get, url, args.requests)]
+
+    transport = GitHubTransport()
+    results.append(run_case(server, 'GitHubTransport (after)', transport.get, url, args.requests))
+    transport.close()
+
+    server.shutdown()
+
+    print(f"{'Case':<26} {'Requests':<10} {'Handshakes':<12} {'Seconds':<10} {'Req/s':<10}")
+    print("-" * 70)
+    for result in results:
+        print(f"{result['case']:<26} {result['requests']:<10} {result['handshakes']:<12} "
+              f"{result['seconds']:<10.3f} {result['req_per_sec']:<10.1f}")
+
+    before, after = results
+    if after['seconds']:
+        print(f"\n📊 Speedup: {before['seconds'] / after['seconds']:.2f}x, "
+              f"handshakes {before['handshakes']} → {after['handshakes']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Response cache backends for the GitHub contribution trackers.
+
+The trackers store every API response under a request fingerprint (see
+``request_fingerprint.py``; team lookups use md5 keys). This module
+provides the storage behind those keys:
+
+1. **CacheBackend:** the interface the trackers program against
+   - Get/put by key
+   - Expiry by TTL, purge of expired entries
+   - Entry counts per endpoint class ("graphql", "rest", "team_members", ...)
+   - ETag/Last-Modified validators so stale entries can be revalidated
+
+2. **SQLiteCache (default):** one WAL-mode SQLite file
+   - Columns for key, endpoint class, fetched-at, TTL, validators and compressed payload
+   - Indexed expiry so freshness checks and purges never scan the table
+   - Safe for concurrent worker threads and for several tracker processes
+
+3. **PickleDirectoryCache:** the original one-``.pkl``-per-key directory
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+# Cache Defaults
+DEFAULT_TTL_SECONDS = 24 * 3600        # Entries are fresh for 24 hours
+SQLITE_CACHE_FILE = "cache.sqlite3"    # File name inside the cache directory
+SQLITE_BUSY_TIMEOUT_MS = 30000         # How long writers wait for a lock
+
+
+@dataclass
+class CacheEntry:
+    """A cached payload together with its bookkeeping columns"""
+    key: str
+    data: Any
+    endpoint_class: str
+    fetched_at: float
+    ttl: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.fetched_at + self.ttl > time.time()
+
+
+class CacheBackend(ABC):
+    """Interface shared by all cache backends"""
+
+    @abstractmethod
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for ``key`` whether fresh or stale, or None"""
+
+    @abstractmethod
+    def put(self, key: str, data: Any, endpoint_class: str = 'default',
+            ttl: float = DEFAULT_TTL_SECONDS, etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        """Store ``data`` under ``key``, replacing any existing entry"""
+
+    @abstractmethod
+    def touch(self, key: str, ttl: Optional[float] = None):
+        """Mark ``key`` as freshly fetched (after a 304 Not Modified)"""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Remove ``key`` if present"""
+
+    @abstractmethod
+    def purge_expired(self, keep_validated_for: float = 0) -> int:
+        """Delete expired entries and return how many were removed
+
+        Entries carrying validators are kept for an extra ``keep_validated_for``
+        seconds so they can still be revalidated with a conditional request.
+        """
+
+    @abstractmethod
+    def count(self) -> Dict[str, int]:
+        """Return the number of stored entries per endpoint class"""
+
+    @abstractmethod
+    def clear(self):
+        """Remove every entry"""
+
+    def close(self):
+        """Release any open resources"""
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached payload for ``key`` if it is still fresh"""
+        entry = self.get_entry(key)
+        if entry is not None and entry.is_fresh:
+            return entry.data
+        return None
+
+
+class SQLiteCache(CacheBackend):
+    """Single-file SQLite cache in WAL mode with compressed pickle payloads"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            key TEXT PRIMARY KEY,
+            endpoint_class TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            ttl REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            payload BLOB NOT NULL,
+            etag TEXT,
+            last_modified TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_cache_expires_at ON cache_entries (expires_at);
+        CREATE INDEX IF NOT EXISTS idx_cache_endpoint_class ON cache_entries (endpoint_class);
+    """
+    COLUMNS = 'key, endpoint_class, fetched_at, ttl, payload, etag, last_modified'
+
+    def __init__(self, path: str):
+        """Open (or create) the cache database at ``path``"""
+        self.path = path
+        self.local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._connection()
+        conn.executescript(self.SCHEMA)
+        self._migrate(conn)
+
+    def _migrate(self, conn: sqlite3.Connection):
+        """Add validator columns to caches created before they existed"""
+        columns = {row[1] for row in conn.execute('PRAGMA table_info(cache_entries)')}
+        for column in ('etag', 'last_modified'):
+            if column not in columns:
+                try:
+                    conn.execute(f'ALTER TABLE cache_entries ADD COLUMN {column} TEXT')
+                except sqlite3.OperationalError:
+                    pass  # Another process migrated first
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000.0,
+                                   isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}')
+            self.local.conn = conn
+        return conn
+
+    @staticmethod
+    def _encode(data: Any) -> bytes:
+        return zlib.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @staticmethod
+    def _decode(payload: bytes) -> Any:
+        return pickle.loads(zlib.decompress(payload))
+
+    def _row_to_entry(self, row) -> Optional[CacheEntry]:
+        key, endpoint_class, fetched_at, ttl, payload, etag, last_modified = row
+        try:
+            data = self._decode(payload)
+        except Exception:
+            # Corrupted payload: drop it so it gets refetched
+            self.delete(key)
+            return None
+        return CacheEntry(key, data, endpoint_class, fetched_at, ttl, etag, last_modified)
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        row = self._connection().execute(
+            f'SELECT {self.COLUMNS} FROM cache_entries WHERE key = ?',
+            (key,)
+        ).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    def get(self, key: str) -> Optional[Any]:
+        row = self._connection().execute(
+            f'SELECT {self.COLUMNS} FROM cache_entries '
+            'WHERE key = ? AND expires_at > ?',
+            (key, time.time())
+        ).fetchone()
+        entry = self._row_to_entry(row) if row else None
+        return entry.data if entry else None
+
+    def put(self, key: str, data: Any, endpoint_class: str = 'default',
+            ttl: float = DEFAULT_TTL_SECONDS, etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        self._write([(key, data, etag, last_modified)], endpoint_class, ttl)
+
+    def _write(self, items: List[Tuple[str, Any, Optional[str], Optional[str]]],
+               endpoint_class: str, ttl: float):
+        now = time.time()
+        rows = [(key, endpoint_class, now, ttl, now + ttl, sqlite3.Binary(self._encode(data)),
+                 etag, last_modified)
+                for key, data, etag, last_modified in items]
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(
+                'INSERT OR REPLACE INTO cache_entries '
+                '(key, endpoint_class, fetched_at, ttl, expires_at, payload, etag, last_modified) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def touch(self, key: str, ttl: Optional[float] = None):
+        now = time.time()
+        self._connection().execute(
+            'UPDATE cache_entries SET fetched_at = ?, ttl = COALESCE(?, ttl), '
+            'expires_at = ? + COALESCE(?, ttl) WHERE key = ?',
+            (now, ttl, now, ttl, key)
+        )
+
+    def delete(self, key: str):
+        self._connection().execute('DELETE FROM cache_entries WHERE key = ?', (key,))
+
+    def purge_expired(self, keep_validated_for: float = 0) -> int:
+        now = time.time()
+        cursor = self._connection().execute(
+            'DELETE FROM cache_entries WHERE expires_at <= ? AND '
+            '(expires_at <= ? OR (etag IS NULL AND last_modified IS NULL))',
+            (now, now - keep_validated_for)
+        )
+        return cursor.rowcount
+
+    def count(self) -> Dict[str, int]:
+        rows = self._connection().execute(
+            'SELECT endpoint_class, COUNT(*) FROM cache_entries GROUP BY endpoint_class'
+        ).fetchall()
+        return dict(rows)
+
+    def clear(self):
+        self._connection().execute('DELETE FROM cache_entries')
+
+    def close(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+
+
+@dataclass
+class PickledPayload:
+    """Contents of a pickle cache file: the payload and the TTL it was stored with"""
+    data: Any
+    ttl: float
+
+
+class PickleDirectoryCache(CacheBackend):
+    """Legacy cache: one pickle file per key in a flat directory.
+
+    Freshness comes from file modification times plus the TTL stored with
+    each payload (files written before TTLs were stored use the backend's
+    ``ttl``). Endpoint classes and validators are not recorded, so ``count``
+    reports everything under ``'all'`` and stale entries are always
+    refetched in full.
+    """
+
+    def __init__(self, directory: str, ttl: float = DEFAULT_TTL_SECONDS):
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def get_cache_file_path(self, key: str) -> str:
+        """Get the file path for a cache key"""
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        cache_file = self.get_cache_file_path(key)
+        try:
+            fetched_at = os.path.getmtime(cache_file)
+            with open(cache_file, 'rb') as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # If cache is corrupted, remove it
+            self.delete(key)
+            return None
+        if isinstance(data, PickledPayload):
+            return CacheEntry(key, data.data, 'all', fetched_at, data.ttl)
+        return CacheEntry(key, data, 'all', fetched_at, self.ttl)
+
+    def put(self, key: str, data: Any, endpoint_class: str = 'default',
+            ttl: float = DEFAULT_TTL_SECONDS, etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        cache_file = self.get_cache_file_path(key)
+        # Write to a per-thread temp file and rename so concurrent workers
+        # never read a partially written pickle
+        temp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_file, 'wb') as f:
+            pickle.dump(PickledPayload(data, ttl), f)
+        os.replace(temp_file, cache_file)
+
+    def touch(self, key: str, ttl: Optional[float] = None):
+        if ttl is not None:
+            entry = self.get_entry(key)
+            if entry is not None and entry.ttl != ttl:
+                self.put(key, entry.data, ttl=ttl)
+                return
+        try:
+            os.utime(self.get_cache_file_path(key))
+        except OSError:
+            pass
+
+    def delete(self, key: str):
+        try:
+            os.remove(self.get_cache_file_path(key))
+        except OSError:
+            pass
+
+    def _files(self) -> List[str]:
+        return [f for f in os.listdir(self.directory) if f.endswith('.pkl')]
+
+    def purge_expired(self, keep_validated_for: float = 0) -> int:
+        # Only files older than the backend TTL are opened to read their own
+        # TTL; shorter-lived entries are stale at once but removed from then on
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for name in self._files():
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.getmtime(path) > cutoff:
+                    continue
+            except OSError:
+                continue
+            entry = self.get_entry(name[:-len('.pkl')])
+            if entry is not None and not entry.is_fresh:
+                self.delete(entry.key)
+                removed += 1
+        return removed
+
+    def count(self) -> Dict[str, int]:
+        return {'all': len(self._files())}
+
+    def clear(self):
+        for name in self._files():
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue
+
+
+CACHE_BACKENDS = ('sqlite', 'pickle')
+
+
+def create_cache_backend(name: str, directory: str, ttl: float = DEFAULT_TTL_SECONDS) -> CacheBackend:
+    """Build the cache backend called ``name`` rooted at ``directory``"""
+    if name == 'sqlite':
+        return SQLiteCache(os.path.join(directory, SQLITE_CACHE_FILE))
+    if name == 'pickle':
+        return PickleDirectoryCache(directory, ttl)
+    raise ValueError(f"Unknown cache backend '{name}'. Choose from: {', '.join(CACHE_BACKENDS)}")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Incremental per-day contribution store for the GitHub contribution trackers.
+
+Keeps one row per (user, UTC day) with that day's contribution counts so a
+run only fetches days it has never seen, plus the last few days that can
+still change. Any ``--days N`` or ``--quarter`` window is then answered by
+summing buckets, which takes refresh cost from O(window) to O(new days).
+
+Counted per day:
+   - commits: commits authored (by commit day)
+   - prs_opened / prs_merged / review_comments: PRs opened that day, how
+     many of them are merged, and the comments they received
+   - reviews: pull request reviews submitted that day
+
+PR state and comment counts keep changing after a PR is opened, so days
+inside the mutable window (default 7 days) are always refetched.
+
+Webhook deliveries (``webhook_ingest.py``) add to the same buckets between
+crawls. Each counted fact (a commit sha, a review id, ...) is recorded so a
+redelivered event is never counted twice, and a day that only webhooks have
+touched still counts as unfetched, so the next crawl replaces it with
+authoritative counts.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Store Defaults
+CONTRIBUTION_STORE_FILE = "contributions.sqlite3"   # File name inside the cache directory
+MUTABLE_DAYS = 7                                    # Recent days that are always refetched
+MAX_FETCH_RANGE_DAYS = 90                           # Longest range fetched in one query series
+
+
+@dataclass
+class DailyCounts:
+    """Contribution counts for one user on one day"""
+    commits: int = 0
+    prs_opened: int = 0
+    prs_merged: int = 0
+    reviews: int = 0
+    review_comments: int = 0
+
+    def add(self, other: 'DailyCounts'):
+        for field in fields(self):
+            setattr(self, field.name, getattr(self, field.name) + getattr(other, field.name))
+
+
+COUNT_COLUMNS = [field.name for field in fields(DailyCounts)]
+
+
+@dataclass
+class ContributionFact:
+    """One counted contribution from a webhook delivery"""
+    key: str             # Unique per contribution, e.g. "commit:<sha>" or "review:<id>"
+    username: str
+    day: date            # UTC day of the bucket it counts towards
+    counts: DailyCounts
+
+
+def days_between(first: date, last: date) -> List[date]:
+    """Every day of [first, last], in order"""
+    return [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+
+def group_date_ranges(days: Iterable[date], max_length: int = MAX_FETCH_RANGE_DAYS) -> List[Tuple[date, date]]:
+    """Group days into contiguous (first, last) ranges of at most ``max_length`` days"""
+    ranges = []
+    for day in sorted(days):
+        if ranges and day == ranges[-1][1] + timedelta(days=1) and (day - ranges[-1][0]).days < max_length:
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
+
+
+class ContributionStore:
+    """SQLite table of per-user, per-day contribution counts"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS daily_contributions (
+            username TEXT NOT NULL,
+            day TEXT NOT NULL,
+            commits INTEGER NOT NULL DEFAULT 0,
+            prs_opened INTEGER NOT NULL DEFAULT 0,
+            prs_merged INTEGER NOT NULL DEFAULT 0,
+            reviews INTEGER NOT NULL DEFAULT 0,
+            review_comments INTEGER NOT NULL DEFAULT 0,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (username, day)
+        );
+        CREATE TABLE IF NOT EXISTS webhook_facts (
+            fact TEXT PRIMARY KEY,
+            username TEXT NOT NULL,
+            day TEXT NOT NULL,
+            received_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: str, mutable_days: int = MUTABLE_DAYS):
+        """Open (or create) the store at ``path``
+
+        Args:
+            mutable_days: Days before today whose counts are refetched every run
+        """
+        self.path = path
+        self.mutable_days = mutable_days
+        self.local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection().executescript(self.SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.local.conn = conn
+        return conn
+
+    def missing_days(self, username: str, start: date, end: date, today: date = None) -> List[date]:
+        """Days in [start, end] that were never fetched or are still mutable
+
+        Days are UTC days, like the buckets, so ``today`` defaults to the UTC date.
+        """
+        today = today or datetime.now(timezone.utc).date()
+        mutable_from = today - timedelta(days=self.mutable_days)
+        rows = self._connection().execute(
+            'SELECT day FROM daily_contributions WHERE username = ? AND day BETWEEN ? AND ? AND fetched_at > 0',
+            (username, start.isoformat(), end.isoformat())
+        ).fetchall()
+        stored = {row[0] for row in rows}
+
+        missing = []
+        day = start
+        while day <= end:
+            if day.isoformat() not in stored or day >= mutable_from:
+                missing.append(day)
+            day += timedelta(days=1)
+        return missing
+
+    def save_days(self, username: str, days: Iterable[date], buckets: Dict[date, DailyCounts]):
+        """Record counts for every fetched day (days without activity store zeros)"""
+        now = time.time()
+        rows = []
+        for day in days:
+            counts = buckets.get(day, DailyCounts())
+            rows.append((username, day.isoformat(), *[getattr(counts, column) for column in COUNT_COLUMNS], now))
+        if not rows:
+            return
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(
+                f'INSERT OR REPLACE INTO daily_contributions (username, day, {", ".join(COUNT_COLUMNS)}, fetched_at) '
+                f'VALUES (?, ?, {", ".join("?" * len(COUNT_COLUMNS))}, ?)',
+                rows
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def add_facts(self, facts: Iterable[ContributionFact]) -> List[ContributionFact]:
+        """Add webhook facts to the day buckets, each fact key only once
+
+        Returns:
+            The facts that were new and have been counted
+        """
+        now = time.time()
+        applied = []
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for fact in facts:
+                inserted = conn.execute(
+                    'INSERT OR IGNORE INTO webhook_facts (fact, username, day, received_at) VALUES (?, ?, ?, ?)',
+                    (fact.key, fact.username, fact.day.isoformat(), now)
+                ).rowcount
+                if not inserted:
+                    continue
+                # New rows get fetched_at 0 so a crawl still fetches the whole day
+                conn.execute(
+                    f'INSERT INTO daily_contributions (username, day, {", ".join(COUNT_COLUMNS)}, fetched_at) '
+                    f'VALUES (?, ?, {", ".join("?" * len(COUNT_COLUMNS))}, 0) '
+                    f'ON CONFLICT (username, day) DO UPDATE SET '
+                    f'{", ".join(f"{column} = {column} + excluded.{column}" for column in COUNT_COLUMNS)}',
+                    (fact.username, fact.day.isoformat(), *[getattr(fact.counts, column) for column in COUNT_COLUMNS])
+                )
+                applied.append(fact)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return applied
+
+    def known_facts(self, keys: Iterable[str]) -> Set[str]:
+        """The fact keys among ``keys`` that have already been counted"""
+        keys = list(keys)
+        if not keys:
+            return set()
+        rows = self._connection().execute(
+            f'SELECT fact FROM webhook_facts WHERE fact IN ({", ".join("?" * len(keys))})', keys
+        ).fetchall()
+        return {row[0] for row in rows}
+
+    def load_days(self, username: str, start: date, end: date) -> Dict[date, DailyCounts]:
+        """Return stored buckets for [start, end] keyed by day"""
+        rows = self._connection().execute(
+            f'SELECT day, {", ".join(COUNT_COLUMNS)} FROM daily_contributions '
+            'WHERE username = ? AND day BETWEEN ? AND ?',
+            (username, start.isoformat(), end.isoformat())
+        ).fetchall()
+        return {date.fromisoformat(row[0]): DailyCounts(*row[1:]) for row in rows}
+
+    def sum_range(self, username: str, start: date, end: date) -> DailyCounts:
+        """Sum stored buckets over [start, end]"""
+        row = self._connection().execute(
+            f'SELECT {", ".join(f"COALESCE(SUM({column}), 0)" for column in COUNT_COLUMNS)} '
+            'FROM daily_contributions WHERE username = ? AND day BETWEEN ? AND ?',
+            (username, start.isoformat(), end.isoformat())
+        ).fetchone()
+        return DailyCounts(*row)
@@ -0,0 +1,726 @@
+#!/usr/bin/env python3
+"""
+Local GitHub API Simulator for offline benchmarking and load tests
+
+Serves a deterministic synthetic organization over HTTP so both trackers can
+run end to end without touching real GitHub quota:
+
+1. **Data:** orgs, repositories, teams with members, users with commits,
+   pull requests (with state and comment counts) and reviews spread over
+   ``--history-days``; the same ``--seed`` always gives the same data
+2. **REST endpoints used by the trackers:**
+   - ``orgs/{org}/repos``, ``orgs/{org}/teams/{slug}``, ``orgs/{org}/teams/{slug}/members``
+   - ``repos/{org}/{repo}/commits`` (author, since), ``repos/{org}/{repo}/pulls``
+   - ``search/issues`` (``reviewed-by:``, ``org:``, ``created:>=``)
+   - Link-header pagination, ETag / ``If-None-Match`` → 304
+3. **GraphQL:** every query the trackers send (single and aliased
+   contributions, pull request pages, per-day contributions, team
+   discovery and member pages), including ``rateLimit``
+4. **Behaviour:** configurable latency, ``X-RateLimit-*`` headers with
+   enforced per-resource budgets, and injected 502s or secondary rate
+   limits (403 + ``Retry-After``)
+
+Scales to 10k users / 5k repositories (~10s to generate, a few hundred MB).
+Point the trackers at it with ``GITHUB_API_URL`` and use the config file it
+writes with ``TRACKER_CONFIG``. Away from api.github.com the trackers pace
+search and GraphQL only by the simulator's headers; raise
+``--requests-per-hour`` to lift the client-side core cap as well.
+
+Usage Examples:
+    python github_simulator.py --write-config sim_config.json           # 200 users, 100 repos on :8765
+    python github_simulator.py --users 10000 --repos 5000 --latency-ms 40 --write-config sim_config.json
+    python github_simulator.py --error-rate 0.02 --throttle-rate 0.01   # flaky network
+
+    # In another shell (run from a scratch directory to keep its CACHE separate):
+    export GITHUB_API_URL=http://127.0.0.1:8765 GITHUB_TOKEN=sim GITHUB_ORG=sim-org
+    export TRACKER_CONFIG=sim_config.json
+    time python advanced_contribution_tracker.py --days 90 --requests-per-hour 1000000
+    time python team_contribution_tracker.py --days 90 --requests-per-hour 1000000
+"""
+
+import argparse
+import base64
+import bisect
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Simulator Defaults
+DEFAULT_PORT = 8765
+DEFAULT_ORG = "sim-org"
+CONNECTION_PAGE_SIZE = 100     # GraphQL connection page size (the trackers ask for 100)
+REST_MAX_PER_PAGE = 100
+
+# Per-resource budgets: (requests or points per window, window seconds)
+RATE_LIMIT_WINDOWS = {'core': 3600, 'search': 60, 'graphql': 3600}
+
+# Pull request states and their weights
+PR_STATES = [('MERGED', 0.6), ('OPEN', 0.3), ('CLOSED', 0.1)]
+
+
+@dataclass
+class SimulatorConfig:
+    """Size, shape and behaviour of the simulated GitHub"""
+    users: int = 200
+    repos: int = 100
+    teams: int = 0                      # 0 = one team per 25 users
+    orgs: List[str] = field(default_factory=lambda: [DEFAULT_ORG])
+    history_days: int = 400             # Events are spread over this many days before now
+    commits_per_user: float = 40        # Mean; actual counts are exponentially distributed
+    prs_per_user: float = 6
+    reviews_per_user: float = 10
+    seed: int = 42
+    latency_ms: float = 0.0             # Mean added latency per request
+    jitter_ms: float = 0.0              # Standard deviation of the added latency
+    error_rate: float = 0.0             # Fraction of requests answered with 502
+    throttle_rate: float = 0.0          # Fraction answered with a secondary rate limit (403 + Retry-After)
+    core_limit: int = 1_000_000         # REST requests per hour
+    search_limit: int = 100_000         # Search requests per minute
+    graphql_limit: int = 1_000_000      # GraphQL points per hour
+
+
+@dataclass
+class PullRequest:
+    """One synthetic pull request"""
+    repo: int                  # Index into SyntheticGitHub.repos
+    number: int
+    author: str
+    created: int               # Epoch seconds
+    state: str                 # MERGED, OPEN or CLOSED
+    comments: int
+
+
+def iso(timestamp: float) -> str:
+    """Epoch seconds as GitHub's ISO 8601 UTC format"""
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(timestamp))
+
+
+def parse_time(value: str) -> float:
+    """ISO 8601 timestamp or date (naive values are UTC) as epoch seconds"""
+    moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.b64encode(f"cursor:{offset}".encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    if not cursor:
+        return 0
+    return int(base64.b64decode(cursor).decode().split(':')[1])
+
+
+def connection(nodes: List, cursor: Optional[str] = None, first: int = CONNECTION_PAGE_SIZE) -> Dict:
+    """One page of a GraphQL connection with pageInfo"""
+    offset = decode_cursor(cursor)
+    page = nodes[offset:offset + first]
+    end = offset + len(page)
+    return {
+        'pageInfo': {'hasNextPage': end < len(nodes), 'endCursor': encode_cursor(end) if page else cursor},
+        'nodes': page
+    }
+
+
+class SyntheticGitHub:
+    """Deterministic synthetic organization data with per-user and per-repo indexes"""
+
+    def __init__(self, config: SimulatorConfig, now: float = None):
+        self.config = config
+        self.now = int(now or time.time())
+        rng = random.Random(config.seed)
+        orgs = config.orgs
+
+        self.logins = [f"sim-user-{i:05d}" for i in range(config.users)]
+        self.full_names = {login: f"Sim User {i}" for i, login in enumerate(self.logins)}
+        self.login_index = {login.lower(): login for login in self.logins}
+
+        # Repositories: (org, name, archived, fork); every 20th is archived, every 25th a fork
+        self.repos = [(orgs[i % len(orgs)], f"repo-{i:05d}", i % 20 == 19, i % 25 == 24)
+                      for i in range(config.repos)]
+        self.repo_index = {(org, name): i for i, (org, name, _, _) in enumerate(self.repos)}
+        self.org_repos: Dict[str, List[int]] = defaultdict(list)
+        for i, (org, _, _, _) in enumerate(self.repos):
+            self.org_repos[org].append(i)
+        active_repos = [i for i, (_, _, archived, fork) in enumerate(self.repos) if not archived and not fork]
+
+        # Teams: each user joins 1-2 teams
+        team_count = config.teams or max(1, config.users // 25)
+        self.teams: Dict[str, List[Dict]] = defaultdict(list)
+        self.team_members: Dict[Tuple[str, str], List[str]] = {}
+        team_keys = []
+        for i in range(team_count):
+            org = orgs[i % len(orgs)]
+            team = {'id': i + 1, 'slug': f"team-{i:04d}", 'name': f"Team {i}",
+                    'description': f"Synthetic team {i}", 'privacy': 'closed'}
+            self.teams[org].append(team)
+            self.team_members[(org, team['slug'])] = []
+            team_keys.append((org, team['slug']))
+        for login in self.logins:
+            for key in rng.sample(team_keys, min(len(team_keys), rng.randint(1, 2))):
+                self.team_members[key].append(login)
+
+        # Contribution events, generated per user against 1-4 home repositories
+        span = config.history_days * 86400
+        self.commits_by_user: Dict[str, List[Tuple[int, int]]] = {}
+        self.commits_by_repo: Dict[int, List[Tuple[int, str]]] = defaultdict(list)
+        self.prs_by_user: Dict[str, List[PullRequest]] = {}
+        self.prs_by_repo: Dict[int, List[PullRequest]] = defaultdict(list)
+        pr_numbers: Dict[int, int] = defaultdict(int)
+        all_prs: List[PullRequest] = []
+        states, weights = zip(*PR_STATES)
+
+        for login in self.logins:
+            home = rng.sample(active_repos, min(len(active_repos), rng.randint(1, 4))) if active_repos else []
+            commits = []
+            prs = []
+            if home:
+                for _ in range(int(rng.expovariate(1 / config.commits_per_user)) if config.commits_per_user else 0):
+                    commits.append((self.now - int(rng.uniform(0, span)), rng.choice(home)))
+                for _ in range(int(rng.expovariate(1 / config.prs_per_user)) if config.prs_per_user else 0):
+                    repo = rng.choice(home)
+                    pr_numbers[repo] += 1
+                    prs.append(PullRequest(repo, pr_numbers[repo], login, self.now - int(rng.uniform(0, span)),
+                                           rng.choices(states, weights)[0], rng.randint(0, 8)))
+            commits.sort()
+            prs.sort(key=lambda pr: pr.created)
+            self.commits_by_user[login] = commits
+            self.prs_by_user[login] = prs
+            for timestamp, repo in commits:
+                self.commits_by_repo[repo].append((timestamp, login))
+            for pr in prs:
+                self.prs_by_repo[pr.repo].append(pr)
+            all_prs.extend(prs)
+
+        # Reviews land on other users' pull requests, up to three days after they open
+        self.reviews_by_user: Dict[str, List[Tuple[int, PullRequest]]] = {}
+        for login in self.logins:
+            reviews = []
+            if all_prs:
+                for _ in range(int(rng.expovariate(1 / config.reviews_per_user)) if config.reviews_per_user else 0):
+                    pr = rng.choice(all_prs)
+                    if pr.author != login:
+                        reviews.append((min(self.now, pr.created + int(rng.uniform(0, 3 * 86400))), pr))
+            reviews.sort(key=lambda review: review[0])
+            self.reviews_by_user[login] = reviews
+
+        # Newest first, as the REST listings return them
+        for events in self.commits_by_repo.values():
+            events.sort(reverse=True)
+        for prs in self.prs_by_repo.values():
+            prs.sort(key=lambda pr: pr.created, reverse=True)
+
+    def users_config(self) -> Dict:
+        """config.json content (users and teams) matching this data"""
+        return {
+            'users': dict(self.full_names),
+            'teams': {team['slug']: team['name'] for teams in self.teams.values() for team in teams}
+        }
+
+    def find_user(self, login: Optional[str]) -> Optional[str]:
+        return self.login_index.get((login or '').lower())
+
+    def window(self, events: List[Tuple], start: float, end: float) -> List[Tuple]:
+        """Events (timestamp first) with start <= timestamp <= end from a list sorted by time"""
+        keys = [event[0] for event in events]
+        return events[bisect.bisect_left(keys, start):bisect.bisect_right(keys, end)]
+
+    def prs_in_window(self, login: str, start: float, end: float) -> List[PullRequest]:
+        prs = self.prs_by_user[login]
+        keys = [pr.created for pr in prs]
+        return prs[bisect.bisect_left(keys, start):bisect.bisect_right(keys, end)]
+
+    def pr_node(self, pr: PullRequest) -> Dict:
+        return {'state': pr.state, 'createdAt': iso(pr.created), 'comments': {'totalCount': pr.comments}}
+
+    def repository_node(self, repo: int) -> Dict:
+        org, name, _, _ = self.repos[repo]
+        return {'name': name, 'owner': {'login': org}}
+
+    # GraphQL resolvers
+
+    def user_contributions(self, login: str, start: float) -> Dict:
+        """``...UserContributions`` fragment for one user"""
+        commits = self.window(self.commits_by_user[login], start, self.now)
+        prs = self.prs_in_window(login, start, self.now)
+        reviews = self.window(self.reviews_by_user[login], start, self.now)
+
+        commit_repos: Dict[int, int] = defaultdict(int)
+        for _, repo in commits:
+            commit_repos[repo] += 1
+        pr_repos: Dict[int, int] = defaultdict(int)
+        for pr in prs:
+            pr_repos[pr.repo] += 1
+
+        return {
+            'contributionsCollection': {
+                'totalCommitContributions': len(commits),
+                'totalPullRequestContributions': len(prs),
+                'totalPullRequestReviewContributions': len(reviews),
+                'commitContributionsByRepository': [
+                    {'repository': self.repository_node(repo), 'contributions': {'totalCount': count}}
+                    for repo, count in commit_repos.items()],
+                'pullRequestContributionsByRepository': [
+                    {'repository': self.repository_node(repo), 'contributions': {'totalCount': count}}
+                    for repo, count in pr_repos.items()]
+            },
+            'pullRequests': self.pull_requests(login, None)
+        }
+
+    def pull_requests(self, login: str, cursor: Optional[str]) -> Dict:
+        """All of a user's pull requests, newest first"""
+        nodes = [self.pr_node(pr) for pr in reversed(self.prs_by_user[login])]
+        return connection(nodes, cursor)
+
+    def daily_contributions(self, login: str, variables: Dict) -> Dict:
+        """contributionsCollection(from, to) as read by DAILY_CONTRIBUTIONS_QUERY"""
+        start, end = parse_time(variables['from']), parse_time(variables['to'])
+        collection = {}
+
+        if variables.get('withCommits'):
+            per_repo: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+            for timestamp, repo in self.window(self.commits_by_user[login], start, end):
+                per_repo[repo][iso(timestamp)[:10]] += 1
+            collection['commitContributionsByRepository'] = [
+                {'contributions': {'nodes': [{'occurredAt': f"{day}T00:00:00Z", 'commitCount': count}
+                                             for day, count in sorted(days.items())][:CONNECTION_PAGE_SIZE]}}
+                for repo, days in list(per_repo.items())[:100]]
+
+        if variables.get('withPRs'):
+            nodes = [{'occurredAt': iso(pr.created),
+                      'pullRequest': {'state': pr.state, 'comments': {'totalCount': pr.comments}}}
+                     for pr in self.prs_in_window(login, start, end)]
+            collection['pullRequestContributions'] = connection(nodes, variables.get('prCursor'))
+
+        if variables.get('withReviews'):
+            nodes = [{'occurredAt': iso(timestamp)}
+                     for timestamp, _ in self.window(self.reviews_by_user[login], start, end)]
+            collection['pullRequestReviewContributions'] = connection(nodes, variables.get('reviewCursor'))
+
+        return {'contributionsCollection': collection}
+
+    def org_teams(self, org: str, cursor: Optional[str]) -> Optional[Dict]:
+        """organization.teams page with each team's first member page"""
+        if org not in self.org_repos and org not in self.teams:
+            return None
+        nodes = [{'slug': team['slug'], 'name': team['name'], 'description': team['description'],
+                  'members': connection([{'login': login} for login in self.team_members[(org, team['slug'])]])}
+                 for team in self.teams.get(org, [])]
+        return {'teams': connection(nodes, cursor)}
+
+    def team_member_page(self, org: str, slug: str, cursor: Optional[str]) -> Optional[Dict]:
+        members = self.team_members.get((org, slug))
+        if members is None:
+            return {'team': None}
+        return {'team': {'members': connection([{'login': login} for login in members], cursor)}}
+
+
+class RateLimitBudget:
+    """Fixed-window request budget for one resource, reported as X-RateLimit-* headers"""
+
+    def __init__(self, resource: str, limit: int, window: int):
+        self.resource = resource
+        self.limit = limit
+        self.window = window
+        self.used = 0
+        self.reset = time.time() + window
+        self.lock = threading.Lock()
+
+    def charge(self, cost: int) -> Tuple[bool, Dict[str, str]]:
+        """Spend ``cost``; returns (allowed, headers)"""
+        with self.lock:
+            now = time.time()
+            if now >= self.reset:
+                self.used = 0
+                self.reset = now + self.window
+            allowed = self.used + cost <= self.limit
+            if allowed:
+                self.used += cost
+            headers = {
+                'X-RateLimit-Limit': str(self.limit),
+                'X-RateLimit-Remaining': str(max(self.limit - self.used, 0)),
+                'X-RateLimit-Used': str(self.used),
+                'X-RateLimit-Reset': str(int(self.reset)),
+                'X-RateLimit-Resource': self.resource
+            }
+            return allowed, headers
+
+    def graphql_info(self, cost: int) -> Dict:
+        with self.lock:
+            return {'cost': cost, 'remaining': max(self.limit - self.used, 0),
+                    'resetAt': iso(self.reset)}
+
+
+class GitHubSimulator(ThreadingHTTPServer):
+    """HTTP/1.1 server answering the trackers' GitHub API calls from SyntheticGitHub"""
+
+    daemon_threads = True
+
+    def __init__(self, config: SimulatorConfig, host: str = '127.0.0.1', port: int = DEFAULT_PORT,
+                 data: SyntheticGitHub = None):
+        super().__init__((host, port), SimulatorHandler)
+        self.config = config
+        self.data = data or SyntheticGitHub(config)
+        self.budgets = {
+            'core': RateLimitBudget('core', config.core_limit, RATE_LIMIT_WINDOWS['core']),
+            'search': RateLimitBudget('search', config.search_limit, RATE_LIMIT_WINDOWS['search']),
+            'graphql': RateLimitBudget('graphql', config.graphql_limit, RATE_LIMIT_WINDOWS['graphql'])
+        }
+        self.rng = random.Random(config.seed + 1)
+        self.lock = threading.Lock()
+        self.stats: Dict[Tuple[str, int], List[int]] = defaultdict(lambda: [0, 0])   # (endpoint, status) -> [count, bytes]
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'GitHubSimulator':
+        """Serve from a background thread (for benchmarks running in-process)"""
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def roll(self) -> float:
+        with self.lock:
+            return self.rng.random()
+
+    def record(self, endpoint: str, status: int, size: int):
+        with self.lock:
+            entry = self.stats[(endpoint, status)]
+            entry[0] += 1
+            entry[1] += size
+
+    def print_stats(self):
+        """Print requests served per endpoint and status"""
+        with self.lock:
+            rows = sorted(self.stats.items(), key=lambda item: item[1][0], reverse=True)
+        print(f"\n{'Endpoint':<36} {'Status':<8} {'Requests':<10} {'Bytes':<12}")
+        print("-" * 70)
+        for (endpoint, status), (count, size) in rows:
+            print(f"{endpoint:<36} {status:<8} {count:<10} {size:<12,}")
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    """Routes REST and GraphQL requests to SyntheticGitHub"""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    server: GitHubSimulator
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.handle_api('GET')
+
+    def do_POST(self):
+        self.handle_api('POST')
+
+    def handle_api(self, method: str):
+        parts = urlsplit(self.path)
+        path = parts.path.strip('/')
+        params = dict(parse_qsl(parts.query))
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0)) if method == 'POST' else b''
+        simulator = self.server
+        config = simulator.config
+
+        if config.latency_ms or config.jitter_ms:
+            time.sleep(max(0.0, random.gauss(config.latency_ms, config.jitter_ms)) / 1000.0)
+
+        if not self.headers.get('Authorization'):
+            return self.reply(path, 401, {'message': 'Requires authentication'})
+        if config.error_rate and simulator.roll() < config.error_rate:
+            return self.reply(path, 502, {'message': 'Server Error'})
+        if config.throttle_rate and simulator.roll() < config.throttle_rate:
+            return self.reply(path, 403, {'message': 'You have exceeded a secondary rate limit.'},
+                              {'Retry-After': '1'})
+
+        if method == 'POST' and path == 'graphql':
+            return self.handle_graphql(json.loads(body or b'{}'))
+        if method == 'GET':
+            return self.handle_rest(path, params)
+        self.reply(path, 404, {'message': 'Not Found'})
+
+    def reply(self, endpoint: str, status: int, payload, headers: Dict[str, str] = None):
+        data = json.dumps(payload).encode() if status != 304 else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+        self.server.record(endpoint_label(endpoint), status, len(data))
+
+    # REST
+
+    def handle_rest(self, path: str, params: Dict[str, str]):
+        parts = path.split('/')
+        data = self.server.data
+        resource = 'search' if parts[0] == 'search' else 'core'
+
+        if parts[:1] == ['orgs'] and len(parts) == 3 and parts[2] == 'repos':
+            if parts[1] not in data.org_repos:
+                return self.charged(path, resource, 404, {'message': 'Not Found'})
+            items = [{'name': name, 'full_name': f"{org}/{name}", 'archived': archived, 'fork': fork,
+                      'private': False, 'owner': {'login': org}}
+                     for org, name, archived, fork in (data.repos[i] for i in data.org_repos[parts[1]])]
+            return self.paginated(path, params, items, resource)
+
+        if parts[:1] == ['orgs'] and len(parts) in (4, 5) and parts[2] == 'teams':
+            org, slug = parts[1], parts[3]
+            members = data.team_members.get((org, slug))
+            if members is None:
+                return self.charged(path, resource, 404, {'message': 'Not Found'})
+            if len(parts) == 5 and parts[4] == 'members':
+                return self.paginated(path, params, [{'login': login, 'type': 'User'} for login in members], resource)
+            team = next(team for team in data.teams[org] if team['slug'] == slug)
+            return self.charged(path, resource, 200, dict(team, members_count=len(members)))
+
+        if parts[:1] == ['repos'] and len(parts) == 4:
+            repo = data.repo_index.get((parts[1], parts[2]))
+            if repo is None:
+                return self.charged(path, resource, 404, {'message': 'Not Found'})
+            if parts[3] == 'commits':
+                return self.paginated(path, params, self.repo_commits(repo, params), resource)
+            if parts[3] == 'pulls':
+                return self.paginated(path, params, self.repo_pulls(repo, params), resource)
+
+        if path == 'search/issues':
+            return self.paginated(path, params, self.search_reviews(params.get('q', '')), resource, search=True)
+
+        if path == 'rate_limit':
+            return self.reply(path, 200, {'resources': {name: budget.graphql_info(0)
+                                                        for name, budget in self.server.budgets.items()}})
+
+        self.charged(path, resource, 404, {'message': 'Not Found'})
+
+    def repo_commits(self, repo: int, params: Dict[str, str]) -> List[Dict]:
+        data = self.server.data
+        since = parse_time(params['since']) if params.get('since') else 0
+        until = parse_time(params['until']) if params.get('until') else float('inf')
+        author = data.find_user(params.get('author')) if params.get('author') else None
+        if params.get('author') and author is None:
+            return []
+        return [{'sha': hashlib.sha1(f"{repo}:{timestamp}:{login}".encode()).hexdigest(),
+                 'commit': {'author': {'name': data.full_names[login], 'date': iso(timestamp)}},
+                 'author': {'login': login}}
+                for timestamp, login in data.commits_by_repo.get(repo, [])
+                if since <= timestamp <= until and (author is None or login == author)]
+
+    def repo_pulls(self, repo: int, params: Dict[str, str]) -> List[Dict]:
+        data = self.server.data
+        state = params.get('state', 'open')
+        # Like GitHub, there is no author filter: callers attribute PRs by user.login
+        prs = [pr for pr in data.prs_by_repo.get(repo, [])
+               if state == 'all' or (pr.state == 'OPEN') == (state == 'open')]
+        if params.get('direction') == 'asc':
+            prs = prs[::-1]
+        org, name, _, _ = data.repos[repo]
+        return [{'number': pr.number, 'title': f"Change {pr.number} in {name}",
+                 'state': 'open' if pr.state == 'OPEN' else 'closed',
+                 'created_at': iso(pr.created),
+                 'merged_at': iso(pr.created + 3600) if pr.state == 'MERGED' else None,
+                 'user': {'login': pr.author}, 'comments': pr.comments}
+                for pr in prs]
+
+    def search_reviews(self, query: str) -> List[Dict]:
+        """``reviewed-by:`` search: distinct pull requests a user reviewed, newest first"""
+        data = self.server.data
+        terms = dict(term.split(':', 1) for term in query.split() if ':' in term)
+        login = data.find_user(terms.get('reviewed-by'))
+        if login is None:
+            return []
+        org = terms.get('org')
+        created = terms.get('created', '')
+        since = parse_time(created[2:]) if created.startswith('>=') else 0
+
+        seen = set()
+        items = []
+        for _, pr in reversed(data.reviews_by_user[login]):
+            repo_org, name, _, _ = data.repos[pr.repo]
+            if (pr.repo, pr.number) in seen or (org and repo_org != org) or pr.created < since:
+                continue
+            seen.add((pr.repo, pr.number))
+            items.append({'title': f"Change {pr.number} in {name}", 'number': pr.number,
+                          'repository_url': f"{self.base_url()}/repos/{repo_org}/{name}",
+                          'created_at': iso(pr.created), 'state': 'open' if pr.state == 'OPEN' else 'closed',
+                          'pull_request': {'url': f"{self.base_url()}/repos/{repo_org}/{name}/pulls/{pr.number}"}})
+        items.sort(key=lambda item: item['created_at'], reverse=True)
+        return items
+
+    def base_url(self) -> str:
+        return f"http://{self.headers.get('Host') or '%s:%s' % self.server.server_address[:2]}"
+
+    def paginated(self, path: str, params: Dict[str, str], items: List, resource: str, search: bool = False):
+        """Reply with one page of ``items`` and GitHub-style Link headers"""
+        per_page = min(int(params.get('per_page', 30)), REST_MAX_PER_PAGE)
+        page = max(int(params.get('page', 1)), 1)
+        last_page = max((len(items) + per_page - 1) // per_page, 1)
+        page_items = items[(page - 1) * per_page:page * per_page]
+
+        links = []
+        def link(number: int, rel: str):
+            links.append(f'<{self.base_url()}/{path}?{urlencode({**params, "page": number})}>; rel="{rel}"')
+        if page < last_page:
+            link(page + 1, 'next')
+            link(last_page, 'last')
+        if page > 1:
+            link(1, 'first')
+            link(page - 1, 'prev')
+
+        payload = {'total_count': len(items), 'incomplete_results': False, 'items': page_items} if search else page_items
+        headers = {'Link': ', '.join(links)} if links else {}
+        self.charged(path, resource, 200, payload, headers)
+
+    def charged(self, path: str, resource: str, status: int, payload, headers: Dict[str, str] = None):
+        """Reply after ETag revalidation and rate-limit accounting (304s are free)"""
+        headers = dict(headers or {})
+        if status == 200:
+            etag = f'"{hashlib.md5(json.dumps(payload, sort_keys=True).encode()).hexdigest()}"'
+            headers['ETag'] = etag
+            if self.headers.get('If-None-Match') == etag:
+                return self.reply(path, 304, None, headers)
+
+        allowed, limit_headers = self.server.budgets[resource].charge(1)
+        headers.update(limit_headers)
+        if not allowed:
+            return self.reply(path, 403, {'message': 'API rate limit exceeded'}, limit_headers)
+        self.reply(path, status, payload, headers)
+
+    # GraphQL
+
+    def handle_graphql(self, request: Dict):
+        query = ' '.join((request.get('query') or '').split())
+        variables = request.get('variables') or {}
+        data = self.server.data
+        budget = self.server.budgets['graphql']
+        result: Dict = {}
+        errors = []
+
+        aliases = re.findall(r'(\w+): user\(login: \$(\w+)\)', query)
+        cost = max(1, len(aliases))
+        allowed, limit_headers = budget.charge(cost)
+        if not allowed:
+            return self.reply('graphql', 200, {'errors': [{'type': 'RATE_LIMITED', 'message': 'API rate limit exceeded'}]},
+                              limit_headers)
+        if 'rateLimit' in query:
+            result['rateLimit'] = budget.graphql_info(cost)
+
+        def user_or_error(alias: str, login_variable: str) -> Optional[str]:
+            login = data.find_user(variables.get(login_variable))
+            if login is None:
+                errors.append({'type': 'NOT_FOUND', 'path': [alias],
+                               'message': f"Could not resolve to a User with the login of '{variables.get(login_variable)}'."})
+            return login
+
+        if 'organization(login: $org)' in query:
+            if 'team(slug: $slug)' in query:
+                result['organization'] = data.team_member_page(variables['org'], variables['slug'], variables.get('cursor'))
+            else:
+                result['organization'] = data.org_teams(variables['org'], variables.get('cursor'))
+        elif 'contributionsCollection(from: $from, to: $to)' in query:
+            login = user_or_error('user', 'username')
+            result['user'] = data.daily_contributions(login, variables) if login else None
+        elif 'after: $cursor' in query and 'pullRequests' in query:
+            login = user_or_error('user', 'username')
+            result['user'] = {'pullRequests': data.pull_requests(login, variables.get('cursor'))} if login else None
+        else:
+            if not aliases and 'user(login: $username)' in query:
+                aliases = [('user', 'username')]
+            start = parse_time(variables['from']) if variables.get('from') else data.now - 365 * 86400
+            for alias, login_variable in aliases:
+                login = user_or_error(alias, login_variable)
+                result[alias] = data.user_contributions(login, start) if login else None
+
+        payload = {'data': result}
+        if errors:
+            payload['errors'] = errors
+        self.reply('graphql', 200, payload, limit_headers)
+
+
+def endpoint_label(path: str) -> str:
+    """Group request paths for the stats table: ``repos/org/name/commits`` -> ``repos/*/*/commits``"""
+    keywords = {'orgs', 'repos', 'teams', 'members', 'commits', 'pulls', 'search', 'issues', 'graphql', 'rate_limit'}
+    return '/'.join(part if part in keywords else '*' for part in path.split('/'))
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Local GitHub API simulator for offline tracker benchmarks')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Interface to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port to listen on (default: {DEFAULT_PORT})')
+    parser.add_argument('--users', type=int, default=200, help='Number of users (default: 200)')
+    parser.add_argument('--repos', type=int, default=100, help='Number of repositories (default: 100)')
+    parser.add_argument('--teams', type=int, default=0, help='Number of teams (default: one per 25 users)')
+    parser.add_argument('--orgs', type=str, default=DEFAULT_ORG, help=f'Comma-separated organization names (default: {DEFAULT_ORG})')
+    parser.add_argument('--history-days', type=int, default=400, help='Days of synthetic history (default: 400)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Mean added latency per request (default: 0)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Standard deviation of the added latency (default: 0)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 502 (default: 0)')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction answered with a secondary rate limit (default: 0)')
+    parser.add_argument('--core-limit', type=int, default=SimulatorConfig.core_limit, help='REST requests per hour (GitHub: 5000)')
+    parser.add_argument('--search-limit', type=int, default=SimulatorConfig.search_limit, help='Search requests per minute (GitHub: 30)')
+    parser.add_argument('--graphql-limit', type=int, default=SimulatorConfig.graphql_limit, help='GraphQL points per hour (GitHub: 5000)')
+    parser.add_argument('--write-config', type=str, metavar='JSON', help='Write a tracker config (users and teams) for TRACKER_CONFIG')
+    args = parser.parse_args()
+
+    config = SimulatorConfig(users=args.users, repos=args.repos, teams=args.teams,
+                             orgs=[org.strip() for org in args.orgs.split(',') if org.strip()],
+                             history_days=args.history_days, seed=args.seed,
+                             latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                             error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                             core_limit=args.core_limit, search_limit=args.search_limit,
+                             graphql_limit=args.graphql_limit)
+
+    print(f"🏗️  Generating {config.users:,} users and {config.repos:,} repositories...")
+    start = time.perf_counter()
+    data = SyntheticGitHub(config)
+    commits = sum(len(events) for events in data.commits_by_user.values())
+    prs = sum(len(events) for events in data.prs_by_user.values())
+    reviews = sum(len(events) for events in data.reviews_by_user.values())
+    print(f"✅ {commits:,} commits, {prs:,} PRs, {reviews:,} reviews, "
+          f"{sum(len(teams) for teams in data.teams.values())} teams in {time.perf_counter() - start:.1f}s")
+
+    if args.write_config:
+        with open(args.write_config, 'w') as f:
+            json.dump(data.users_config(), f, indent=2)
+        print(f"📝 Tracker config written to {args.write_config}")
+
+    server = GitHubSimulator(config, args.host, args.port, data)
+    print(f"\n🚀 Simulated GitHub API on {server.url}")
+    print(f"   export GITHUB_API_URL={server.url} GITHUB_TOKEN=sim GITHUB_ORG={config.orgs[0]}"
+          + (f" GITHUB_ORG_2={config.orgs[1]}" if len(config.orgs) > 1 else ""))
+    if args.write_config:
+        print(f"   export TRACKER_CONFIG={args.write_config}")
+    print("   Press Ctrl-C to stop and print request counts")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.print_stats()
+
+
+if __name__ == "__main__":
+    main()
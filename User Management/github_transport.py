@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP transport for the GitHub contribution trackers.
+
+All REST, GraphQL and search traffic from the trackers goes through a single
+``GitHubTransport`` instance owned by the tracker. It wraps a pooled
+``requests.Session`` so that connections to api.github.com are kept alive and
+reused instead of paying a new TCP+TLS handshake for every call.
+
+Features:
+   - Keep-alive connection pooling with a configurable pool size
+   - gzip/deflate response negotiation
+   - Per-request (connect, read) timeouts
+   - Automatic retries for transient connection errors
+   - Optional rate-limit governor consulted before and after every request
+   - Optional run profiler timing each exchange (excluding rate-limit waits)
+"""
+
+import time
+from typing import Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from rate_limit import RateLimitGovernor
+from run_profile import RunProfiler
+
+# Transport Defaults
+HTTP_POOL_SIZE = 10                   # Keep-alive connections kept per host
+HTTP_TIMEOUT = (5.0, 30.0)            # (connect, read) timeout in seconds
+HTTP_CONNECT_RETRIES = 3              # Retries for dropped/refused connections
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class GitHubTransport:
+    """Pooled keep-alive HTTP session used for every GitHub API call.
+
+    The session is safe to share between worker threads: the underlying
+    urllib3 pool hands out one connection per in-flight request and returns
+    it to the pool afterwards.
+    """
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE, timeout: Timeout = HTTP_TIMEOUT,
+                 governor: Optional[RateLimitGovernor] = None, profiler: Optional[RunProfiler] = None):
+        """Create the pooled session.
+
+        Args:
+            pool_size: Maximum number of keep-alive connections per host
+            timeout: Default timeout applied to every request, either a single
+                value or a (connect, read) tuple
+            governor: Shared rate-limit governor to schedule requests, if any
+            profiler: Run profiler recording network time and bytes, if any
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.governor = governor
+        self.profiler = profiler
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+            'User-Agent': 'ACES-contribution-tracker'
+        })
+
+        # Only connection-level failures are retried here; HTTP status handling
+        # (rate limits, 5xx) stays with the tracker.
+        retry = Retry(total=HTTP_CONNECT_RETRIES, connect=HTTP_CONNECT_RETRIES,
+                      read=0, status=0, backoff_factor=0.5)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                              max_retries=retry, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, url: str, headers: Dict = None, params: Dict = None,
+            timeout: Optional[Timeout] = None, resource: str = 'core') -> requests.Response:
+        """Send a GET request over the pooled session
+
+        ``resource`` names the GitHub rate-limit bucket the call counts
+        against ('core', 'search' or 'graphql').
+        """
+        if self.governor:
+            self.governor.acquire(resource)
+        started = time.perf_counter()
+        response = self.session.get(url, headers=headers, params=params,
+                                    timeout=timeout or self.timeout)
+        if self.profiler:
+            self.profiler.record_exchange(resource, time.perf_counter() - started, response)
+        if self.governor:
+            self.governor.observe_response(resource, response)
+        return response
+
+    def post(self, url: str, headers: Dict = None, json: Dict = None,
+             timeout: Optional[Timeout] = None, resource: str = 'graphql') -> requests.Response:
+        """Send a POST request over the pooled session"""
+        if self.governor:
+            self.governor.acquire(resource)
+        started = time.perf_counter()
+        response = self.session.post(url, headers=headers, json=json,
+                                     timeout=timeout or self.timeout)
+        if self.profiler:
+            self.profiler.record_exchange(resource, time.perf_counter() - started, response)
+        if self.governor:
+            self.governor.observe_response(resource, response)
+        return response
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Record and replay GitHub API traffic for deterministic regression tests.
+
+``RecordingTransport`` is a drop-in ``GitHubTransport`` that appends every
+REST/GraphQL exchange of a run to a gzip JSON-lines archive. A
+``ReplayTransport`` serves those exchanges back without any network access,
+so two versions of the trackers can be compared request for request:
+
+1. **Archive:** one gzip member per line (a header, then one exchange per
+   request), so a recording cut short by Ctrl-C is still readable
+2. **Matching:** method, path, query parameters and JSON body, with dates
+   and timestamps masked, so a replay on a later day still matches
+   ``--days N`` windows; repeated requests are served in recorded order
+3. **Timing:** by default exchanges are answered immediately and recorded
+   rate limits carry ``Retry-After: 0``; with ``preserve_timing`` each
+   response waits as long as it took when recorded
+4. **Misses:** requests that were never recorded get a 404 and are counted,
+   which is how a change that adds requests shows up
+
+Both transports count requests and response bytes per endpoint.
+"""
+
+import gzip
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from http.client import responses as HTTP_REASONS
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from github_transport import HTTP_POOL_SIZE, HTTP_TIMEOUT, GitHubTransport, Timeout
+from rate_limit import RateLimitGovernor
+from request_fingerprint import endpoint_label
+from run_profile import RunProfiler
+
+# Archive Defaults
+ARCHIVE_FORMAT = "aces-http-archive"
+ARCHIVE_VERSION = 1
+
+# Response headers kept in the archive (the trackers read nothing else)
+RECORDED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Link', 'Retry-After',
+                    'X-RateLimit-Limit', 'X-RateLimit-Remaining', 'X-RateLimit-Reset',
+                    'X-RateLimit-Used', 'X-RateLimit-Resource')
+
+# Dates and timestamps in parameters, search queries and GraphQL variables
+TIME_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:\d{2})?)?')
+
+
+def exchange_key(method: str, url: str, params: Optional[Dict] = None, body: Optional[Dict] = None) -> str:
+    """Match key for a request: host dropped, query merged into params, times masked"""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query.update({key: str(value) for key, value in (params or {}).items()})
+    canonical = json.dumps([method, parts.path, query, body or {}], sort_keys=True,
+                           separators=(',', ':'), default=str)
+    return hashlib.sha256(TIME_PATTERN.sub('<time>', canonical).encode()).hexdigest()
+
+
+class TrafficStats:
+    """Thread-safe request and byte counters per endpoint"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts: Dict[str, List[int]] = defaultdict(lambda: [0, 0])   # endpoint -> [requests, bytes]
+
+    def record(self, url: str, size: int):
+        endpoint = endpoint_label(urlsplit(url).path)
+        with self.lock:
+            entry = self.counts[endpoint]
+            entry[0] += 1
+            entry[1] += size
+
+    @property
+    def requests(self) -> int:
+        with self.lock:
+            return sum(count for count, _ in self.counts.values())
+
+    @property
+    def bytes(self) -> int:
+        with self.lock:
+            return sum(size for _, size in self.counts.values())
+
+    def reset(self):
+        with self.lock:
+            self.counts.clear()
+
+
+class RecordingTransport(GitHubTransport):
+    """GitHubTransport that appends every exchange to an archive"""
+
+    def __init__(self, path: str, pool_size: int = HTTP_POOL_SIZE, timeout: Timeout = HTTP_TIMEOUT,
+                 governor: Optional[RateLimitGovernor] = None, profiler: Optional[RunProfiler] = None,
+                 metadata: Dict = None):
+        """Open the pooled session and start a new archive at ``path``
+
+        Args:
+            metadata: Free-form run details stored in the archive header
+                (e.g. users and window, so a benchmark can replay the same calls)
+        """
+        super().__init__(pool_size=pool_size, timeout=timeout, governor=governor, profiler=profiler)
+        self.path = path
+        self.stats = TrafficStats()
+        self.lock = threading.Lock()
+        self.sequence = 0
+        self.file = open(path, 'wb')
+        self._write({'format': ARCHIVE_FORMAT, 'version': ARCHIVE_VERSION,
+                     'recorded_at': time.time(), 'metadata': metadata or {}})
+
+    def _write(self, record: Dict):
+        line = json.dumps(record, separators=(',', ':')).encode() + b'\n'
+        self.file.write(gzip.compress(line))
+        self.file.flush()
+
+    def _record(self, method: str, url: str, params: Optional[Dict], body: Optional[Dict],
+                response: requests.Response):
+        self.stats.record(url, len(response.content))
+        with self.lock:
+            self.sequence += 1
+            self._write({
+                'seq': self.sequence,
+                'method': method,
+                'url': url,
+                'params': params,
+                'body': body,
+                'status': response.status_code,
+                'headers': {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+                'elapsed': response.elapsed.total_seconds(),
+                'content': response.text
+            })
+
+    def get(self, url: str, headers: Dict = None, params: Dict = None,
+            timeout: Optional[Timeout] = None, resource: str = 'core') -> requests.Response:
+        response = super().get(url, headers=headers, params=params, timeout=timeout, resource=resource)
+        self._record('GET', url, params, None, response)
+        return response
+
+    def post(self, url: str, headers: Dict = None, json: Dict = None,
+             timeout: Optional[Timeout] = None, resource: str = 'graphql') -> requests.Response:
+        response = super().post(url, headers=headers, json=json, timeout=timeout, resource=resource)
+        self._record('POST', url, None, json, response)
+        return response
+
+    def close(self):
+        """Close the archive and the pooled connections"""
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+        super().close()
+
+
+def read_archive(path: str) -> Tuple[Dict, List[Dict]]:
+    """Header and exchanges of an archive; a truncated last line is dropped"""
+    header, exchanges = {}, []
+    with gzip.open(path, 'rt') as f:
+        try:
+            for line in f:
+                record = json.loads(line)
+                if 'format' in record:
+                    header = record
+                else:
+                    exchanges.append(record)
+        except (EOFError, json.JSONDecodeError):
+            pass
+    if header.get('format') != ARCHIVE_FORMAT:
+        raise ValueError(f"{path} is not an HTTP archive recorded by the trackers")
+    return header, exchanges
+
+
+class ReplayTransport:
+    """Serves recorded exchanges in place of ``GitHubTransport``; never opens a connection"""
+
+    def __init__(self, path: str, preserve_timing: bool = False, profiler: Optional[RunProfiler] = None):
+        """Load the archive at ``path``
+
+        Args:
+            preserve_timing: Wait as long as each exchange took when recorded
+                (and honour recorded Retry-After values)
+            profiler: Run profiler recording each served exchange, if any
+        """
+        self.path = path
+        self.preserve_timing = preserve_timing
+        self.profiler = profiler
+        self.header, exchanges = read_archive(path)
+        self.metadata = self.header.get('metadata', {})
+        self.exchanges: Dict[str, Deque[Dict]] = defaultdict(deque)
+        for exchange in exchanges:
+            key = exchange_key(exchange['method'], exchange['url'], exchange['params'], exchange['body'])
+            self.exchanges[key].append(exchange)
+        self.recorded = len(exchanges)
+        self.stats = TrafficStats()
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def _serve(self, method: str, url: str, params: Optional[Dict], body: Optional[Dict],
+               resource: str) -> requests.Response:
+        started = time.perf_counter()
+        key = exchange_key(method, url, params, body)
+        with self.lock:
+            queue = self.exchanges.get(key)
+            if queue:
+                # The last exchange for a request keeps answering repeats of it
+                exchange = queue.popleft() if len(queue) > 1 else queue[0]
+            else:
+                exchange = None
+                self.misses += 1
+
+        response = requests.Response()
+        response.url = url
+        response.encoding = 'utf-8'
+        if exchange is None:
+            response.status_code = 404
+            response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+            response._content = json.dumps({'message': 'Not recorded'}).encode()
+        else:
+            response.status_code = exchange['status']
+            response.headers = CaseInsensitiveDict(exchange['headers'])
+            response._content = exchange['content'].encode()
+            if self.preserve_timing:
+                time.sleep(exchange['elapsed'])
+            elif 'Retry-After' in response.headers:
+                response.headers['Retry-After'] = '0'
+        response.reason = HTTP_REASONS.get(response.status_code, '')
+        self.stats.record(url, len(response._content))
+        if self.profiler:
+            self.profiler.record_exchange(resource, time.perf_counter() - started, response)
+        return response
+
+    def get(self, url: str, headers: Dict = None, params: Dict = None,
+            timeout: Optional[Timeout] = None, resource: str = 'core') -> requests.Response:
+        return self._serve('GET', url, params, None, resource)
+
+    def post(self, url: str, headers: Dict = None, json: Dict = None,
+             timeout: Optional[Timeout] = None, resource: str = 'graphql') -> requests.Response:
+        return self._serve('POST', url, None, json, resource)
+
+    def close(self):
+        pass
@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Leaderboard Service: individual and team leaderboards from a long-running process
+
+Runs the team tracker as a daemon instead of one process per leaderboard:
+
+1. **Hot state:** ``ContributionMetrics`` and ``TeamMetrics`` for every
+   window stay in memory together with the tracker, its pooled connections,
+   response cache and per-day store
+2. **Background refresh:** every ``--refresh-interval`` seconds (or on
+   ``POST /refresh``) all windows are rebuilt from one per-day fetch, which
+   only requests days the store has not seen yet; a failed refresh keeps
+   serving the previous data
+3. **Webhooks:** ``POST /webhook`` deliveries (``webhook_ingest.py``) update
+   the per-day store and the affected users' counters right away; only those
+   users are re-scored before ranks and teams are rebuilt, so the scheduled
+   refresh can run nightly as a reconciliation. Deliveries that arrive
+   during a refresh update the served leaderboards at once but reach the
+   store only when the refresh swaps in, so the crawl's rewrite of a day
+   cannot drop them; they are then added to the new leaderboards as well
+   (an event the crawl already saw counts twice until the next refresh)
+4. **Pre-rendered responses:** every JSON and CSV body is rendered once per
+   refresh or webhook and swapped in as a whole, so a request is a dictionary lookup
+   and readers never see a half-updated leaderboard
+
+Endpoints (``?window=30d`` selects a window, default: the first one):
+    GET  /leaderboard              Individual leaderboard (JSON)
+    GET  /leaderboard.csv          Individual leaderboard (CSV, as saved by the tracker)
+    GET  /users/<login>            One user's metrics, rank and teams
+    GET  /teams                    Team leaderboard (JSON)
+    GET  /teams.csv                Team leaderboard (CSV)
+    GET  /teams/members.csv        Members by team (CSV)
+    GET  /teams/<slug>             One team with its members
+    GET  /status                   Windows, data age and refresh state
+    POST /refresh                  Start a refresh now
+    POST /webhook                  GitHub push / pull_request / review / PR comment deliveries
+
+Usage Examples:
+    export GITHUB_TOKEN=your_token_here
+    python leaderboard_service.py                                  # 30-day boards on :8780, hourly refresh
+    python leaderboard_service.py --windows 7d,30d,Q --refresh-interval 900
+    python leaderboard_service.py --refresh-interval 86400 --webhook-secret "$GITHUB_WEBHOOK_SECRET"
+    curl -s 'http://127.0.0.1:8780/leaderboard?window=7d'
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, replace
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from advanced_contribution_tracker import (CACHE_BACKEND, CACHE_REVALIDATE_DAYS, DEFAULT_WORKERS,
+                                           ContributionMetrics, TrackingWindow)
+from cache_backend import CACHE_BACKENDS
+from contribution_store import ContributionFact, DailyCounts
+from github_transport import HTTP_POOL_SIZE, HTTP_TIMEOUT
+from rate_limit import REQUESTS_PER_HOUR
+from team_contribution_tracker import (TEAM_DISCOVERY, TEAM_DISCOVERY_MODES, TeamContributionTracker,
+                                       TeamMetrics, TeamRegistry)
+from webhook_ingest import (DELIVERY_HEADER, EVENT_HEADER, SIGNATURE_HEADER, WEBHOOK_SECRET, WebhookIngestor,
+                            verify_signature)
+
+# Service Defaults
+SERVICE_PORT = 8780
+SERVICE_WINDOWS = "30d"
+REFRESH_INTERVAL = 3600        # Seconds between background refreshes
+
+JSON_TYPE = "application/json"
+CSV_TYPE = "text/csv; charset=utf-8"
+
+Response = Tuple[bytes, str, str]    # (body, content type, ETag)
+
+
+def render_json(payload) -> bytes:
+    return json.dumps(payload, separators=(',', ':')).encode()
+
+
+def render_csv(write_rows) -> bytes:
+    """Run a tracker CSV writer against an in-memory file"""
+    buffer = io.StringIO(newline='')
+    write_rows(buffer)
+    return buffer.getvalue().encode('utf-8')
+
+
+def add_counts(metrics: ContributionMetrics, counts: DailyCounts):
+    """Add per-day counts to a user's unscored totals"""
+    metrics.commits_count += counts.commits
+    metrics.prs_opened += counts.prs_opened
+    metrics.prs_merged += counts.prs_merged
+    metrics.reviews_given += counts.reviews
+    metrics.review_comments += counts.review_comments
+
+
+def team_summary(team: TeamMetrics) -> Dict:
+    """A team without its members' full metrics"""
+    summary = asdict(team)
+    summary['members'] = [member.username for member in team.members]
+    return summary
+
+
+class LeaderboardSnapshot:
+    """One refresh's leaderboards with every response body pre-rendered"""
+
+    def __init__(self, tracker: TeamContributionTracker, windows: List[TrackingWindow],
+                 individual: Dict[str, List[ContributionMetrics]], teams: Dict[str, List[TeamMetrics]],
+                 refresh_seconds: float):
+        self.windows = windows
+        self.individual = individual
+        self.teams = teams
+        self.generated_at = time.time()
+        self.refresh_seconds = refresh_seconds
+        self.responses: Dict[Tuple[str, str], Response] = {}
+
+        for window in windows:
+            self.render_window(tracker, window, individual[window.name], teams[window.name])
+
+    def add(self, window: TrackingWindow, path: str, body: bytes, content_type: str):
+        etag = f'"{hashlib.sha1(body).hexdigest()[:20]}"'
+        self.responses[(window.name.lower(), path.lower())] = (body, content_type, etag)
+
+    def render_window(self, tracker: TeamContributionTracker, window: TrackingWindow,
+                      metrics_list: List[ContributionMetrics], team_metrics: List[TeamMetrics]):
+        """Render every response of one window"""
+        header = {
+            'window': window.name,
+            'period': window.period,
+            'start_date': window.start_date.isoformat(),
+            'end_date': window.end_date.isoformat(),
+            'generated_at': datetime.fromtimestamp(self.generated_at).isoformat(timespec='seconds')
+        }
+        self.add(window, '/leaderboard', render_json(dict(header, users=[asdict(m) for m in metrics_list])),
+                 JSON_TYPE)
+        self.add(window, '/leaderboard.csv', render_csv(lambda f: tracker.write_results_csv(metrics_list, f)),
+                 CSV_TYPE)
+        self.add(window, '/teams', render_json(dict(header, teams=[team_summary(team) for team in team_metrics])),
+                 JSON_TYPE)
+        self.add(window, '/teams.csv', render_csv(lambda f: tracker.write_team_summary_csv(team_metrics, f)),
+                 CSV_TYPE)
+        self.add(window, '/teams/members.csv', render_csv(lambda f: tracker.write_team_members_csv(team_metrics, f)),
+                 CSV_TYPE)
+
+        user_teams: Dict[str, List[Dict]] = {}
+        for team in team_metrics:
+            self.add(window, f'/teams/{team.team_slug}', render_json(dict(header, team=asdict(team))), JSON_TYPE)
+            for member in team.members:
+                user_teams.setdefault(member.username, []).append(
+                    {'team_name': team.team_name, 'team_slug': team.team_slug, 'team_rank': team.team_rank})
+        for metrics in metrics_list:
+            detail = dict(header, user=asdict(metrics), users_ranked=len(metrics_list),
+                          teams=user_teams.get(metrics.username, []))
+            self.add(window, f'/users/{metrics.username}', render_json(detail), JSON_TYPE)
+
+    def lookup(self, path: str, window: Optional[str]) -> Optional[Response]:
+        """Pre-rendered response for ``path`` in ``window`` (default: the first window)"""
+        window = (window or self.windows[0].name).lower()
+        return self.responses.get((window, path.lower()))
+
+
+class LeaderboardService:
+    """Keeps leaderboards in memory and refreshes them in the background"""
+
+    def __init__(self, tracker: TeamContributionTracker, windows_spec: str = SERVICE_WINDOWS,
+                 workers: int = DEFAULT_WORKERS, team_discovery: str = TEAM_DISCOVERY,
+                 refresh_interval: float = REFRESH_INTERVAL, webhook_secret: Optional[str] = None):
+        self.tracker = tracker
+        self.windows_spec = windows_spec
+        self.workers = workers
+        self.team_discovery = team_discovery
+        self.refresh_interval = refresh_interval
+        self.webhook_secret = webhook_secret
+        self.snapshot: Optional[LeaderboardSnapshot] = None
+        self.registry: Optional[TeamRegistry] = None
+        self.user_teams: Dict[str, List[Dict]] = {}
+        self.refreshed_on: Optional[date] = None
+        self.ingestor = WebhookIngestor(tracker.contribution_store, tracker.load_users_config())
+        self.webhook_contributions = 0
+        self.pending_facts: Dict[str, ContributionFact] = {}   # Received during a refresh, by key
+        self.lock = threading.Lock()             # Serializes snapshot swaps
+        self.refreshing = False
+        self.last_error: Optional[str] = None
+        self.last_attempt: Optional[float] = None
+        self.wake = threading.Event()
+        self.stopping = False
+        self.thread: Optional[threading.Thread] = None
+
+        # Fail at startup rather than in the background on a bad spec
+        tracker.get_tracking_windows(windows_spec)
+
+    def refresh(self) -> bool:
+        """Rebuild every window and swap in the new snapshot; keep the old one on failure"""
+        with self.lock:
+            self.refreshing = True
+        self.last_attempt = time.time()
+        started = time.perf_counter()
+        try:
+            # Windows are resolved again on each refresh, so "30d" keeps moving
+            windows = self.tracker.get_tracking_windows(self.windows_spec)
+            individual = self.tracker.track_all_users_windows(windows, self.workers)
+
+            users = self.tracker.load_users_config()
+            # Teams and memberships change too, so each refresh discovers them again
+            registry = self.tracker.discover_teams(self.workers, self.team_discovery, refresh=True)
+            user_teams = self.tracker.map_users_to_teams(users, registry)
+            teams = {window.name: self.tracker.create_team_metrics(registry.teams, user_teams, individual[window.name])
+                     for window in windows}
+
+            snapshot = LeaderboardSnapshot(self.tracker, windows, individual, teams, time.perf_counter() - started)
+            with self.lock:
+                self.registry, self.user_teams = registry, user_teams
+                self.refreshed_on = date.today()
+                facts = self.store_pending_facts()
+                self.snapshot = self.apply_facts(snapshot, facts) if facts else snapshot
+                self.ingestor = WebhookIngestor(self.tracker.contribution_store, users)
+                self.refreshing = False
+            self.last_error = None
+            print(f"🔄 Leaderboards refreshed in {self.snapshot.refresh_seconds:.1f}s "
+                  f"({len(self.snapshot.responses)} responses)")
+            return True
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            print(f"❌ Refresh failed, still serving the previous leaderboards: {self.last_error}")
+            return False
+        finally:
+            with self.lock:
+                if self.refreshing:
+                    # Failed refresh: the old snapshot already has these facts
+                    self.store_pending_facts()
+                    self.refreshing = False
+
+    def store_pending_facts(self) -> List[ContributionFact]:
+        """Count the facts deferred during a refresh in the store (call with the lock held)"""
+        facts = self.tracker.contribution_store.add_facts(self.pending_facts.values())
+        self.pending_facts = {}
+        return facts
+
+    def defer_facts(self, facts: List[ContributionFact]) -> List[ContributionFact]:
+        """Queue the new facts of a delivery that arrived during a refresh (call with the lock held)"""
+        known = self.tracker.contribution_store.known_facts(fact.key for fact in facts)
+        new = []
+        for fact in facts:
+            if fact.key not in known and fact.key not in self.pending_facts:
+                self.pending_facts[fact.key] = fact
+                new.append(fact)
+        return new
+
+    def ingest_webhook(self, event: str, payload: Dict) -> Dict:
+        """Count one webhook delivery and re-score the users it affects
+
+        Raises:
+            ValueError: If the payload of a supported event is malformed
+        """
+        with self.lock:
+            if self.refreshing:
+                # The refresh may be rewriting these days in the store right now
+                facts = self.defer_facts(self.ingestor.parse(event, payload))
+            else:
+                facts = self.ingestor.ingest(event, payload)
+            self.webhook_contributions += len(facts)
+            if facts and self.snapshot is not None:
+                self.snapshot = self.apply_facts(self.snapshot, facts)
+        return {'event': event, 'counted': len(facts), 'users': sorted({fact.username for fact in facts})}
+
+    def apply_facts(self, snapshot: LeaderboardSnapshot, facts: List[ContributionFact]) -> LeaderboardSnapshot:
+        """New snapshot with ``facts`` added to each window they fall into"""
+        started = time.perf_counter()
+        individual, teams = {}, {}
+        for window in snapshot.windows:
+            first_day, last_day = window.start_date.date(), window.end_date.date()
+            # Windows ending at the last refresh keep growing until the next one
+            open_ended = last_day >= self.refreshed_on
+            metrics_list = [replace(metrics) for metrics in snapshot.individual[window.name]]
+            by_username = {metrics.username: metrics for metrics in metrics_list}
+            changed = {}
+            for fact in facts:
+                metrics = by_username.get(fact.username)
+                if metrics is None or fact.day < first_day or (fact.day > last_day and not open_ended):
+                    continue
+                add_counts(metrics, fact.counts)
+                changed[fact.username] = metrics
+            for metrics in changed.values():
+                self.tracker.calculate_gamification_scores(metrics)
+            individual[window.name] = self.tracker.assign_ranks(metrics_list) if changed else metrics_list
+            teams[window.name] = self.tracker.create_team_metrics(self.registry.teams, self.user_teams,
+                                                                  individual[window.name])
+        updated = LeaderboardSnapshot(self.tracker, snapshot.windows, individual, teams, snapshot.refresh_seconds)
+        print(f"📥 {len(facts)} webhook contributions for {', '.join(sorted({fact.username for fact in facts}))} "
+              f"applied in {(time.perf_counter() - started) * 1000:.1f}ms")
+        return updated
+
+    def run(self):
+        """Refresh now, then every ``refresh_interval`` seconds or when woken"""
+        while not self.stopping:
+            self.refresh()
+            self.wake.wait(self.refresh_interval)
+            self.wake.clear()
+
+    def start(self):
+        """Start refreshing in a background thread"""
+        self.thread = threading.Thread(target=self.run, name='leaderboard-refresh', daemon=True)
+        self.thread.start()
+
+    def request_refresh(self) -> bool:
+        """Wake the refresh thread; False if a refresh is already running"""
+        if self.refreshing:
+            return False
+        self.wake.set()
+        return True
+
+    def stop(self):
+        self.stopping = True
+        self.wake.set()
+
+    def status(self) -> Dict:
+        snapshot = self.snapshot
+        status = {
+            'ready': snapshot is not None,
+            'refreshing': self.refreshing,
+            'refresh_interval_seconds': self.refresh_interval,
+            'last_error': self.last_error,
+            'last_attempt': self.last_attempt,
+            'webhook_contributions': self.webhook_contributions
+        }
+        if snapshot is not None:
+            status.update({
+                'generated_at': snapshot.generated_at,
+                'age_seconds': round(time.time() - snapshot.generated_at, 1),
+                'refresh_seconds': round(snapshot.refresh_seconds, 3),
+                'windows': [{'name': window.name, 'period': window.period,
+                             'users': len(snapshot.individual[window.name]),
+                             'teams': len(snapshot.teams[window.name])} for window in snapshot.windows]
+            })
+        return status
+
+
+class LeaderboardServer(ThreadingHTTPServer):
+    """Local HTTP server answering from the service's current snapshot"""
+
+    daemon_threads = True
+
+    def __init__(self, service: LeaderboardService, host: str, port: int):
+        super().__init__((host, port), LeaderboardHandler)
+        self.service = service
+
+
+class LeaderboardHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    server: LeaderboardServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def reply(self, status: int, body: bytes, content_type: str = JSON_TYPE, headers: Dict[str, str] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        path = unquote(parts.path).rstrip('/') or '/'
+        query = dict(parse_qsl(parts.query))
+        service = self.server.service
+
+        if path == '/status':
+            return self.reply(200, render_json(service.status()))
+
+        snapshot = service.snapshot
+        if snapshot is None:
+            return self.reply(503, render_json({'message': 'Leaderboards are still loading'}),
+                              headers={'Retry-After': '30'})
+
+        response = snapshot.lookup(path, query.get('window'))
+        if response is None:
+            return self.reply(404, render_json({'message': 'Not found'}))
+        body, content_type, etag = response
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        if content_type == CSV_TYPE:
+            filename = f"{path.strip('/').replace('/', '_').replace('.csv', '')}_{query.get('window', snapshot.windows[0].name)}.csv"
+            headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+        self.reply(200, body, content_type, headers)
+
+    def do_POST(self):
+        path = urlsplit(self.path).path.rstrip('/')
+        if path == '/webhook':
+            return self.handle_webhook()
+        if path != '/refresh':
+            return self.reply(404, render_json({'message': 'Not found'}))
+        if self.server.service.request_refresh():
+            return self.reply(202, render_json({'message': 'Refresh started'}))
+        self.reply(409, render_json({'message': 'A refresh is already running'}))
+
+    def handle_webhook(self):
+        service = self.server.service
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if service.webhook_secret and not verify_signature(service.webhook_secret, body,
+                                                           self.headers.get(SIGNATURE_HEADER)):
+            return self.reply(401, render_json({'message': 'Invalid signature'}))
+
+        event = self.headers.get(EVENT_HEADER, '')
+        try:
+            # Webhooks can be configured to send JSON or form-encoded payloads
+            if self.headers.get('Content-Type', '').startswith('application/x-www-form-urlencoded'):
+                body = dict(parse_qsl(body.decode())).get('payload', '').encode()
+            payload = json.loads(body)
+        except ValueError:
+            return self.reply(400, render_json({'message': 'Body is not a JSON payload'}))
+        if event == 'ping':
+            return self.reply(200, render_json({'message': 'pong'}))
+
+        try:
+            result = service.ingest_webhook(event, payload)
+        except ValueError as e:
+            print(f"❌ Webhook {self.headers.get(DELIVERY_HEADER, '')}: {e}")
+            return self.reply(400, render_json({'message': str(e)}))
+        self.reply(200, render_json(result))
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description='Serve individual and team leaderboards from memory with background refresh')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Interface to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=SERVICE_PORT, help=f'Port to listen on (default: {SERVICE_PORT})')
+    parser.add_argument('--windows', type=str, default=SERVICE_WINDOWS, metavar='SPEC', help=f'Leaderboard windows, e.g. 7d,30d,Q (default: {SERVICE_WINDOWS})')
+    parser.add_argument('--refresh-interval', type=float, default=REFRESH_INTERVAL, help=f'Seconds between refreshes (default: {REFRESH_INTERVAL})')
+    parser.add_argument('--cache-backend', choices=CACHE_BACKENDS, default=CACHE_BACKEND, help=f'Response cache backend (default: {CACHE_BACKEND})')
+    parser.add_argument('--pool-size', type=int, default=HTTP_POOL_SIZE, help=f'Keep-alive HTTP connections to GitHub (default: {HTTP_POOL_SIZE})')
+    parser.add_argument('--timeout', type=float, default=HTTP_TIMEOUT[1], help=f'Per-request read timeout in seconds (default: {HTTP_TIMEOUT[1]:.0f})')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help=f'Users tracked concurrently (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--requests-per-hour', type=float, default=REQUESTS_PER_HOUR, help=f'Cap on the core REST request rate (default: {REQUESTS_PER_HOUR})')
+    parser.add_argument('--scoring-config', type=str, help='JSON file with scoring settings (default: "scoring" section of config.json)')
+    parser.add_argument('--team-discovery', choices=TEAM_DISCOVERY_MODES, default=TEAM_DISCOVERY, help=f'How teams and members are loaded (default: {TEAM_DISCOVERY})')
+    parser.add_argument('--webhook-secret', type=str, default=WEBHOOK_SECRET, help='Secret POST /webhook deliveries must be signed with (default: GITHUB_WEBHOOK_SECRET)')
+    args = parser.parse_args()
+
+    token = os.getenv('GITHUB_TOKEN')
+    if not token:
+        print("Error: GITHUB_TOKEN environment variable not set")
+        return
+
+    tracker = TeamContributionTracker(token, pool_size=max(args.pool_size, args.workers),
+                                      timeout=(HTTP_TIMEOUT[0], args.timeout),
+                                      requests_per_hour=args.requests_per_hour,
+                                      cache_backend=args.cache_backend)
+    if args.scoring_config:
+        tracker.scoring = tracker.load_scoring_config(args.scoring_config)
+    tracker.cache.purge_expired(keep_validated_for=CACHE_REVALIDATE_DAYS * 86400)
+
+    try:
+        service = LeaderboardService(tracker, args.windows, args.workers, args.team_discovery,
+                                     args.refresh_interval, args.webhook_secret)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    try:
+        server = LeaderboardServer(service, args.host, args.port)
+    except OSError as e:
+        print(f"Error: Could not listen on {args.host}:{args.port}: {e}")
+        return
+
+    print(f"🚀 Leaderboard service on http://{args.host}:{args.port} "
+          f"(windows {args.windows}, refresh every {args.refresh_interval:.0f}s)")
+    print("   Press Ctrl-C to stop")
+    service.start()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        server.server_close()
+        tracker.transport.close()
+        print("\n👋 Leaderboard service stopped")
+
+
+if __name__ == "__main__":
+    main()
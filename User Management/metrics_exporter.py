@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Prometheus / OpenMetrics exporter for scheduled tracker runs.
+
+Renders a tracker's run state in the Prometheus text exposition format,
+either as a file for node_exporter's textfile collector (``--metrics-textfile``,
+written atomically when the run ends) or from a small local HTTP endpoint
+serving ``/metrics`` while the run is in progress (``--metrics-port``):
+
+   - ``aces_tracker_run_duration_seconds``, ``..._run_success`` and
+     ``..._last_run_timestamp_seconds`` (alert when the leaderboard goes stale)
+   - ``aces_tracker_users{state="configured|tracked|failed"}``
+   - ``aces_tracker_api_requests{endpoint,status}`` and bytes per resource
+   - ``aces_tracker_cache_lookups{endpoint,outcome}`` and ``..._cache_hit_ratio``
+   - ``aces_tracker_rate_limit_remaining{resource}``, reset time and wait seconds
+   - ``aces_tracker_phase_seconds{phase}`` histograms (network, cache,
+     scoring, ``track_all_users``, team pipeline, CSV)
+
+Every sample carries a ``job`` label ("advanced" or "team"). Values describe
+a single run, so they are exported as gauges rather than counters. No
+client library is needed.
+"""
+
+import atexit
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from run_profile import LATENCY_BUCKETS_MS
+
+# Exporter Defaults
+METRIC_PREFIX = "aces_tracker"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def escape_label(value) -> str:
+    """Escape a label value for the text exposition format"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_value(value) -> str:
+    """Sample value: integers as such, floats at full precision (timestamps need it)"""
+    if isinstance(value, int):
+        return str(value)
+    return repr(round(float(value), 6))
+
+
+class MetricFamilies:
+    """Collects samples grouped by metric name, with HELP and TYPE lines"""
+
+    def __init__(self, job: str):
+        self.job = job
+        self.families: Dict[str, Dict] = {}
+
+    def add(self, name: str, metric_type: str, help_text: str, value: float,
+            labels: Dict[str, str] = None, suffix: str = ''):
+        family = self.families.setdefault(name, {'type': metric_type, 'help': help_text, 'samples': []})
+        labels = dict({'job': self.job}, **(labels or {}))
+        rendered = ','.join(f'{key}="{escape_label(label)}"' for key, label in labels.items())
+        family['samples'].append(f"{METRIC_PREFIX}_{name}{suffix}{{{rendered}}} {format_value(value)}")
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for name, family in self.families.items():
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {family['help']}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} {family['type']}")
+            lines.extend(family['samples'])
+        return '\n'.join(lines) + '\n'
+
+
+class RunMetrics:
+    """Prometheus view of one tracker run"""
+
+    def __init__(self, tracker, job: str):
+        """Start timing a run of ``tracker``; ``job`` labels every sample"""
+        self.tracker = tracker
+        self.job = job
+        self.started = time.time()
+        self.finished: Optional[float] = None
+        self.success: Optional[bool] = None
+        self.textfile: Optional[str] = None
+        self.server: Optional[MetricsServer] = None
+        # Request, phase and cache detail come from the run profiler
+        tracker.profiler.enable()
+
+    def render(self) -> str:
+        """Current metrics in the text exposition format"""
+        tracker = self.tracker
+        metrics = MetricFamilies(self.job)
+        end = self.finished or time.time()
+
+        metrics.add('run_duration_seconds', 'gauge', 'Wall time of the run so far, or of the finished run',
+                    end - self.started)
+        metrics.add('run_start_timestamp_seconds', 'gauge', 'Unix time the run started', self.started)
+        if self.finished is not None:
+            metrics.add('run_success', 'gauge', '1 if the run produced results, 0 otherwise', 1 if self.success else 0)
+            if self.success:
+                metrics.add('last_run_timestamp_seconds', 'gauge', 'Unix time the last successful run finished',
+                            self.finished)
+
+        summary = tracker.run_summary
+        for state in ('configured', 'tracked', 'failed'):
+            metrics.add('users', 'gauge', 'Users configured, tracked and failed in this run',
+                        summary.get(f'users_{state}', 0), {'state': state})
+
+        profile = tracker.profiler.report(tracker.governor)
+        for endpoint, statuses in profile['requests'].items():
+            for status, count in statuses.items():
+                metrics.add('api_requests', 'gauge', 'API requests sent in this run by endpoint and status',
+                            count, {'endpoint': endpoint, 'status': status})
+        for resource, traffic in profile['traffic'].items():
+            metrics.add('api_bytes_received', 'gauge', 'Response bytes received in this run', traffic['bytes_in'],
+                        {'resource': resource})
+            metrics.add('api_bytes_sent', 'gauge', 'Request bytes sent in this run', traffic['bytes_out'],
+                        {'resource': resource})
+
+        lookups = served = 0
+        for endpoint, hits, revalidated, misses, hit_rate in tracker.cache_stats.report():
+            for outcome, count in (('hit', hits), ('revalidated', revalidated), ('miss', misses)):
+                metrics.add('cache_lookups', 'gauge', 'Response cache lookups in this run by endpoint and outcome',
+                            count, {'endpoint': endpoint, 'outcome': outcome})
+            metrics.add('cache_hit_ratio', 'gauge', 'Share of lookups served without a transfer (hits and 304s)',
+                        hit_rate, {'endpoint': endpoint})
+            lookups += hits + revalidated + misses
+            served += hits + revalidated
+        if lookups:
+            metrics.add('cache_hit_ratio', 'gauge', 'Share of lookups served without a transfer (hits and 304s)',
+                        served / lookups, {'endpoint': 'all'})
+
+        for resource, bucket in tracker.governor.buckets.items():
+            if bucket.remaining is not None:
+                metrics.add('rate_limit_remaining', 'gauge', 'Quota left as last reported by GitHub',
+                            bucket.remaining, {'resource': resource})
+                metrics.add('rate_limit_reset_timestamp_seconds', 'gauge', 'Unix time the quota window resets',
+                            bucket.reset_at, {'resource': resource})
+            metrics.add('rate_limit_wait_seconds', 'gauge', 'Seconds spent waiting for quota in this run',
+                        bucket.waited, {'resource': resource})
+
+        for phase, stats in profile['phases'].items():
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS_MS, stats['histogram_ms'].values()):
+                cumulative += count
+                metrics.add('phase_seconds', 'histogram', 'Duration of instrumented calls by phase',
+                            cumulative, {'phase': phase, 'le': f"{bound / 1000:g}"}, '_bucket')
+            metrics.add('phase_seconds', 'histogram', 'Duration of instrumented calls by phase',
+                        stats['count'], {'phase': phase, 'le': '+Inf'}, '_bucket')
+            metrics.add('phase_seconds', 'histogram', 'Duration of instrumented calls by phase',
+                        stats['total_seconds'], {'phase': phase}, '_sum')
+            metrics.add('phase_seconds', 'histogram', 'Duration of instrumented calls by phase',
+                        stats['count'], {'phase': phase}, '_count')
+
+        return metrics.render()
+
+    def write_textfile(self, path: str):
+        """Write the metrics to ``path`` atomically (the textfile collector never sees a partial file)"""
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'w') as f:
+            f.write(self.render())
+        os.replace(temporary, path)
+
+    def serve(self, port: int, host: str = '127.0.0.1'):
+        """Serve /metrics from a background thread until the process exits"""
+        self.server = MetricsServer(self, host, port)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def finish(self, success: bool):
+        """Mark the run finished and write the textfile, once"""
+        if self.finished is not None:
+            return
+        self.finished = time.time()
+        self.success = success
+        if self.textfile:
+            try:
+                self.write_textfile(self.textfile)
+            except OSError as e:
+                print(f"Warning: Could not write metrics to {self.textfile}: {e}")
+
+
+class MetricsServer(ThreadingHTTPServer):
+    """Local HTTP server answering GET /metrics"""
+
+    daemon_threads = True
+
+    def __init__(self, run_metrics: RunMetrics, host: str, port: int):
+        super().__init__((host, port), MetricsHandler)
+        self.run_metrics = run_metrics
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    server: MetricsServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = self.server.run_metrics.render().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def add_metrics_arguments(parser):
+    """Add --metrics-textfile and --metrics-port to a tracker's argument parser"""
+    parser.add_argument('--metrics-textfile', type=str, metavar='PATH', help='Write Prometheus metrics for this run to PATH (node_exporter textfile collector, e.g. /var/lib/node_exporter/aces.prom)')
+    parser.add_argument('--metrics-port', type=int, metavar='PORT', help='Serve live Prometheus metrics on http://127.0.0.1:PORT/metrics during the run')
+
+
+def start_metrics_export(tracker, args, job: str) -> Optional[RunMetrics]:
+    """Set up the metrics requested on the command line, or return None
+
+    A run that ends without calling ``finish(True)`` (no results, an error
+    or Ctrl-C) is exported with ``run_success 0`` when the process exits.
+    """
+    if not args.metrics_textfile and not args.metrics_port:
+        return None
+    run_metrics = RunMetrics(tracker, job)
+    run_metrics.textfile = args.metrics_textfile
+    if args.metrics_port:
+        try:
+            run_metrics.serve(args.metrics_port)
+            print(f"📈 Serving metrics on http://127.0.0.1:{args.metrics_port}/metrics")
+        except OSError as e:
+            print(f"Warning: Could not serve metrics on port {args.metrics_port}: {e}")
+    atexit.register(run_metrics.finish, False)
+    return run_metrics
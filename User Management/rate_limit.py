@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Rate-limit governor for the GitHub contribution trackers.
+
+Every outgoing API call draws from a token bucket for its GitHub resource:
+
+1. **core:** REST API, 5000 requests/hour
+2. **search:** Search API, 30 requests/minute
+3. **graphql:** GraphQL API, 5000 points/hour
+
+Buckets start from these documented limits and then follow what GitHub
+reports: ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` headers, the GraphQL
+``rateLimit { cost remaining resetAt }`` block and ``Retry-After`` on
+secondary limits. The remaining quota is spread evenly over the time left
+until reset, so worker threads run at the fastest rate that will not hit a
+403, and block together when a limit is exhausted. Asyncio callers use
+``reserve`` instead, which books the request and returns the delay to sleep.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+# Budget Defaults
+REQUESTS_PER_HOUR = 5000       # GitHub primary rate limit for authenticated users
+BURST_SIZE = 100               # Requests allowed back-to-back before throttling
+SEARCH_REQUESTS_PER_MINUTE = 30
+GRAPHQL_POINTS_PER_HOUR = 5000
+UNMETERED_PER_HOUR = 1e9       # Client-side cap for resources only the server meters
+RATE_LIMIT_MAX_RETRIES = 5     # Attempts after a rate-limited response before giving up
+SECONDARY_LIMIT_WAIT = 60      # Seconds to back off from a secondary limit without Retry-After
+RESET_MARGIN = 1.0             # Extra seconds to wait past a reported reset time
+
+RESOURCES = ('core', 'search', 'graphql')
+
+
+class RateLimitBudget:
+    """Thread-safe token bucket for one GitHub resource"""
+
+    def __init__(self, requests_per_hour: float = REQUESTS_PER_HOUR, burst: int = BURST_SIZE):
+        """Create a budget that refills continuously.
+
+        Args:
+            requests_per_hour: Maximum sustained request rate
+            burst: Bucket capacity (requests allowed without waiting)
+        """
+        self.max_rate = requests_per_hour / 3600.0
+        self.rate = self.max_rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0   # wall-clock time before which nothing may be sent
+        self.waited = 0.0
+        self.remaining: Optional[int] = None     # Last quota the server reported
+        self.reset_at: Optional[float] = None
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens: float = 1.0):
+        """Block until ``tokens`` are available, then consume them"""
+        while True:
+            with self.lock:
+                pause = self.blocked_until - time.time()
+                if pause <= 0:
+                    self._refill()
+                    if self.tokens >= tokens:
+                        self.tokens -= tokens
+                        return
+                    pause = (tokens - self.tokens) / self.rate
+                self.waited += pause
+            time.sleep(pause)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Consume ``tokens`` now and return the seconds to wait before sending
+
+        Never blocks: the bucket may go into debt, which later callers wait
+        off in turn, so the caller can sleep without holding a thread.
+        """
+        with self.lock:
+            self._refill()
+            self.tokens -= tokens
+            delay = max(-self.tokens / self.rate, self.blocked_until - time.time(), 0.0)
+            self.waited += delay
+            return delay
+
+    def observe(self, remaining: int, reset_at: float):
+        """Align the bucket with the quota GitHub reports
+
+        Args:
+            remaining: Requests (or points) left in the current window
+            reset_at: Epoch seconds when the window resets
+        """
+        with self.lock:
+            self._refill()
+            now = time.time()
+            window = max(reset_at - now, 1.0)
+            # Never assume more quota than the server reports, and spread
+            # what is left evenly until the reset
+            self.remaining = remaining
+            self.reset_at = reset_at
+            self.tokens = min(self.tokens, float(remaining))
+            self.rate = max(min(self.max_rate, remaining / window), 1.0 / window)
+            if remaining <= 0:
+                self.blocked_until = max(self.blocked_until, reset_at + RESET_MARGIN)
+
+    def pause(self, seconds: float):
+        """Block every caller of this bucket for ``seconds``"""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.time() + seconds)
+
+
+class RateLimitGovernor:
+    """Per-resource rate-limit buckets shared by every request path"""
+
+    def __init__(self, requests_per_hour: float = REQUESTS_PER_HOUR, documented_limits: bool = True):
+        """Create buckets for core, search and graphql.
+
+        Args:
+            requests_per_hour: Cap for the core REST bucket
+            documented_limits: Start search and graphql from github.com's
+                documented limits. Off for other API hosts (GitHub Enterprise
+                Server, github_simulator.py), where only the limits the server
+                reports in its headers apply
+        """
+        search_per_hour = SEARCH_REQUESTS_PER_MINUTE * 60 if documented_limits else UNMETERED_PER_HOUR
+        graphql_per_hour = GRAPHQL_POINTS_PER_HOUR if documented_limits else UNMETERED_PER_HOUR
+        self.buckets: Dict[str, RateLimitBudget] = {
+            'core': RateLimitBudget(requests_per_hour, BURST_SIZE),
+            'search': RateLimitBudget(search_per_hour, SEARCH_REQUESTS_PER_MINUTE),
+            'graphql': RateLimitBudget(graphql_per_hour, BURST_SIZE),
+        }
+
+    @property
+    def waited(self) -> float:
+        """Total seconds callers spent waiting on any bucket"""
+        return sum(bucket.waited for bucket in self.buckets.values())
+
+    def acquire(self, resource: str, cost: float = 1.0):
+        """Block until ``resource`` can afford a request of ``cost``"""
+        self.buckets.get(resource, self.buckets['core']).acquire(cost)
+
+    def reserve(self, resource: str, cost: float = 1.0) -> float:
+        """Book a request of ``cost`` on ``resource``; returns seconds to wait before sending it"""
+        return self.buckets.get(resource, self.buckets['core']).reserve(cost)
+
+    def observe_response(self, resource: str, response):
+        """Update a bucket from a response's rate-limit headers"""
+        headers = response.headers
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        resource = headers.get('X-RateLimit-Resource', resource)
+        if remaining is not None and reset is not None and resource in self.buckets:
+            try:
+                self.buckets[resource].observe(int(remaining), float(reset))
+            except ValueError:
+                pass
+
+    def observe_graphql(self, rate_limit: Optional[Dict]):
+        """Update the graphql bucket from a ``rateLimit`` result block"""
+        if not rate_limit or rate_limit.get('remaining') is None:
+            return
+        reset_at = time.time() + 3600
+        if rate_limit.get('resetAt'):
+            reset_at = datetime.fromisoformat(rate_limit['resetAt'].replace('Z', '+00:00')).timestamp()
+        bucket = self.buckets['graphql']
+        bucket.observe(int(rate_limit['remaining']), reset_at)
+        # Each query was admitted at one point; charge the rest of its real cost
+        with bucket.lock:
+            bucket.tokens -= max(float(rate_limit.get('cost') or 1) - 1.0, 0.0)
+
+    def retry_delay(self, resource: str, response) -> Optional[float]:
+        """Return how long to wait before retrying a rate-limited response
+
+        Returns None when the response was not rate limited (including
+        403s caused by missing permissions), so the caller should not retry.
+        """
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                return SECONDARY_LIMIT_WAIT
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            try:
+                return max(float(response.headers['X-RateLimit-Reset']) - time.time(), 0.0) + RESET_MARGIN
+            except (KeyError, ValueError):
+                return SECONDARY_LIMIT_WAIT
+        if response.status_code == 429 or 'rate limit' in response.text.lower():
+            return SECONDARY_LIMIT_WAIT
+        return None
+
+    def graphql_reset_delay(self) -> float:
+        """Seconds until the graphql bucket's reported reset (RATE_LIMITED errors)"""
+        bucket = self.buckets['graphql']
+        with bucket.lock:
+            delay = bucket.blocked_until - time.time()
+        return delay if delay > 0 else SECONDARY_LIMIT_WAIT
+
+    def pause(self, resource: str, seconds: float):
+        """Hold back every request to ``resource`` for ``seconds``"""
+        self.buckets.get(resource, self.buckets['core']).pause(seconds)
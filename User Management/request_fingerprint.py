@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Canonical request fingerprints for the response cache.
+
+Equivalent requests must map to the same cache key, otherwise the 24-hour
+cache never hits. A fingerprint is built from:
+
+1. **Query text:** GraphQL queries with whitespace collapsed, so
+   re-indenting a query does not change its key
+2. **Parameters:** JSON with sorted keys instead of ``str(dict)``
+3. **Time bounds:** start bounds (``from``, ``since``) floored to a
+   configurable granularity (default: 1 hour). ``--days 30`` computes its
+   start from ``datetime.now()``, so without this every run had a new key.
+   The quantized values are also the ones sent, so a cached response always
+   matches its request (the window grows by less than one granularity step)
+
+``CacheStats`` counts hits, revalidations and misses per endpoint for the
+cache report printed at the end of a run.
+"""
+
+import hashlib
+import json
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+# Fingerprint Defaults
+CACHE_TIME_GRANULARITY = 3600          # Seconds; start bounds are floored to this step
+TIME_BOUND_PARAMS = ('from', 'since')  # Parameters holding a window start
+
+# REST path segments kept as-is in endpoint labels; the rest are names
+ENDPOINT_KEYWORDS = {'orgs', 'users', 'repos', 'teams', 'members', 'commits', 'pulls',
+                     'reviews', 'comments', 'issues', 'search'}
+
+
+def normalize_query(query: str) -> str:
+    """Collapse all whitespace runs in a GraphQL query to single spaces"""
+    return ' '.join(query.split())
+
+
+def quantize_time(value: str, granularity: int = CACHE_TIME_GRANULARITY) -> str:
+    """Floor an ISO 8601 timestamp to ``granularity`` seconds (at most one day)
+
+    Date-only strings and values that are not timestamps are returned
+    unchanged; a trailing ``Z`` is kept.
+    """
+    if granularity <= 1 or not isinstance(value, str) or 'T' not in value:
+        return value
+    suffix = 'Z' if value.endswith('Z') else ''
+    try:
+        moment = datetime.fromisoformat(value[:-1] if suffix else value)
+    except ValueError:
+        return value
+
+    midnight = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    seconds = (moment - midnight).total_seconds()
+    floored = midnight + timedelta(seconds=seconds - seconds % min(granularity, 86400))
+    return floored.isoformat() + suffix
+
+
+def canonical_params(params: Optional[Dict], granularity: int = CACHE_TIME_GRANULARITY) -> Optional[Dict]:
+    """Copy of ``params`` with window start bounds quantized"""
+    if not params:
+        return params
+    return {key: quantize_time(value, granularity) if key in TIME_BOUND_PARAMS else value
+            for key, value in params.items()}
+
+
+def request_fingerprint(kind: str, target: str, params: Optional[Dict] = None) -> str:
+    """Cache key for a request: ``kind`` ("graphql", "rest", ...), endpoint or query, and params"""
+    if kind == 'graphql':
+        target = normalize_query(target)
+    canonical = json.dumps([kind, target, params or {}], sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def endpoint_label(endpoint: str) -> str:
+    """Group REST endpoints for reporting: ``repos/org/name/commits`` -> ``repos/*/*/commits``"""
+    return '/'.join(part if part in ENDPOINT_KEYWORDS else '*' for part in endpoint.strip('/').split('/'))
+
+
+class CacheStats:
+    """Thread-safe cache hit/revalidation/miss counters per endpoint"""
+
+    OUTCOMES = ('hit', 'revalidated', 'miss')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts: Dict[str, Dict[str, int]] = {}
+
+    def record(self, endpoint: str, outcome: str):
+        """Count one cache lookup; ``outcome`` is one of OUTCOMES"""
+        with self.lock:
+            counts = self.counts.setdefault(endpoint, dict.fromkeys(self.OUTCOMES, 0))
+            counts[outcome] += 1
+
+    def report(self) -> List[Tuple[str, int, int, int, float]]:
+        """Rows of (endpoint, hits, revalidated, misses, hit rate), busiest endpoint first
+
+        Revalidated (304) lookups count as hits for the rate: no data was transferred.
+        """
+        with self.lock:
+            rows = []
+            for endpoint, counts in self.counts.items():
+                total = sum(counts.values())
+                served = counts['hit'] + counts['revalidated']
+                rows.append((endpoint, counts['hit'], counts['revalidated'], counts['miss'],
+                             served / total if total else 0.0))
+        rows.sort(key=lambda row: row[1] + row[2] + row[3], reverse=True)
+        return rows
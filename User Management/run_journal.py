@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Run journal for resumable tracking runs.
+
+Every ``track_all_users`` run gets a run id and a row per finished user in
+a small SQLite journal next to the response cache:
+
+1. **Runs:** id, creation time, status and the resolved parameters (window,
+   output suffix, incremental mode) needed to continue the same run later
+2. **Users:** completion state, attempts and last error per user, plus the
+   finished user's metrics
+
+``--resume <run-id>`` then tracks only users that are not done yet (failed
+users are retried until ``MAX_USER_ATTEMPTS``) and merges them with the
+metrics already recorded, so a run that died at user 400 of 600 only
+fetches the last 200.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Journal Defaults
+RUN_JOURNAL_FILE = "runs.sqlite3"      # File name inside the cache directory
+MAX_USER_ATTEMPTS = 3                  # Failed attempts before a user is given up on
+
+# Run and user states
+RUN_RUNNING = 'running'
+RUN_COMPLETED = 'completed'
+RUN_INCOMPLETE = 'incomplete'          # Finished with failed users
+RUN_INTERRUPTED = 'interrupted'
+USER_DONE = 'done'
+USER_FAILED = 'failed'
+
+
+class RunJournal:
+    """SQLite journal of tracking runs and per-user progress"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id TEXT PRIMARY KEY,
+            created_at REAL NOT NULL,
+            status TEXT NOT NULL,
+            parameters TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS run_users (
+            run_id TEXT NOT NULL,
+            username TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            metrics TEXT,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (run_id, username)
+        );
+    """
+
+    def __init__(self, path: str):
+        """Open (or create) the journal at ``path``"""
+        self.path = path
+        self.local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection().executescript(self.SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.local.conn = conn
+        return conn
+
+    def start_run(self, parameters: Dict) -> str:
+        """Record a new run and return its id (e.g. 20250131-142501-3fa2)"""
+        run_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:4]}"
+        self._connection().execute(
+            'INSERT INTO runs (run_id, created_at, status, parameters) VALUES (?, ?, ?, ?)',
+            (run_id, time.time(), RUN_RUNNING, json.dumps(parameters))
+        )
+        return run_id
+
+    def get_parameters(self, run_id: str) -> Optional[Dict]:
+        """Parameters a run was started with, or None for an unknown run id"""
+        row = self._connection().execute('SELECT parameters FROM runs WHERE run_id = ?', (run_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_status(self, run_id: str, status: str):
+        """Update a run's overall status"""
+        self._connection().execute('UPDATE runs SET status = ? WHERE run_id = ?', (status, run_id))
+
+    def list_runs(self, limit: int = 20) -> List[Dict]:
+        """Most recent runs with their per-user progress counts"""
+        rows = self._connection().execute(
+            'SELECT r.run_id, r.created_at, r.status, '
+            "SUM(u.status = 'done'), SUM(u.status = 'failed') "
+            'FROM runs r LEFT JOIN run_users u ON u.run_id = r.run_id '
+            'GROUP BY r.run_id ORDER BY r.created_at DESC LIMIT ?',
+            (limit,)
+        ).fetchall()
+        return [{'run_id': run_id, 'created_at': created_at, 'status': status,
+                 'done': done or 0, 'failed': failed or 0}
+                for run_id, created_at, status, done, failed in rows]
+
+    def record_success(self, run_id: str, username: str, metrics: Dict):
+        """Mark a user done and keep their metrics"""
+        self._connection().execute(
+            'INSERT INTO run_users (run_id, username, status, attempts, metrics, updated_at) '
+            'VALUES (?, ?, ?, 1, ?, ?) '
+            'ON CONFLICT (run_id, username) DO UPDATE SET status = excluded.status, '
+            'attempts = attempts + 1, last_error = NULL, metrics = excluded.metrics, '
+            'updated_at = excluded.updated_at',
+            (run_id, username, USER_DONE, json.dumps(metrics), time.time())
+        )
+
+    def record_failure(self, run_id: str, username: str, error: str):
+        """Mark a user failed and count the attempt"""
+        self._connection().execute(
+            'INSERT INTO run_users (run_id, username, status, attempts, last_error, updated_at) '
+            'VALUES (?, ?, ?, 1, ?, ?) '
+            'ON CONFLICT (run_id, username) DO UPDATE SET status = excluded.status, '
+            'attempts = attempts + 1, last_error = excluded.last_error, updated_at = excluded.updated_at',
+            (run_id, username, USER_FAILED, error, time.time())
+        )
+
+    def completed_metrics(self, run_id: str) -> Dict[str, Dict]:
+        """Metrics of every user already done in a run, keyed by username"""
+        rows = self._connection().execute(
+            'SELECT username, metrics FROM run_users WHERE run_id = ? AND status = ?',
+            (run_id, USER_DONE)
+        ).fetchall()
+        return {username: json.loads(metrics) for username, metrics in rows}
+
+    def exhausted_users(self, run_id: str, max_attempts: int = MAX_USER_ATTEMPTS) -> Dict[str, str]:
+        """Failed users that reached ``max_attempts``, with their last error"""
+        rows = self._connection().execute(
+            'SELECT username, last_error FROM run_users WHERE run_id = ? AND status = ? AND attempts >= ?',
+            (run_id, USER_FAILED, max_attempts)
+        ).fetchall()
+        return dict(rows)
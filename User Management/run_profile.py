@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Per-phase run profile for the contribution trackers (``--profile``).
+
+A ``RunProfiler`` owned by the tracker collects, for one run:
+
+1. **Phases:** count, total time and a latency histogram for network
+   exchanges (``rest``, ``search``, ``graphql``), cache loads and saves,
+   scoring, team discovery/mapping/aggregation and CSV writing
+2. **Cache:** hit / revalidated / expired / miss counts per endpoint class
+3. **Traffic:** bytes sent and received and response status codes per
+   rate-limit resource, and request counts per endpoint and status
+4. **Throttling:** seconds spent waiting on each rate-limit bucket
+
+At the end of the run the profile is written as JSON and summarized in a
+table, so a slow run can be attributed to the network, throttling or cache
+churn at a glance. Network and cache time is summed over worker threads and
+can exceed the wall time. A disabled profiler costs one attribute check per
+call.
+"""
+
+import functools
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from request_fingerprint import endpoint_label
+
+# Histogram bucket upper bounds in milliseconds (a final bucket catches the rest)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Phase names
+PHASE_CACHE_LOAD = 'cache_load'
+PHASE_CACHE_SAVE = 'cache_save'
+PHASE_SCORING = 'scoring'
+PHASE_TEAM_DISCOVERY = 'team_discovery'
+PHASE_TEAM_MAPPING = 'team_mapping'
+PHASE_TEAM_METRICS = 'team_metrics'
+PHASE_CSV = 'csv'
+PHASE_TRACK_ALL_USERS = 'track_all_users'
+NETWORK_PHASES = {'core': 'rest', 'search': 'search', 'graphql': 'graphql'}
+
+CACHE_OUTCOMES = ('hit', 'revalidated', 'expired', 'miss')
+
+_DISABLED = nullcontext()
+
+
+class PhaseStats:
+    """Count, total, maximum and histogram of one phase's durations"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        milliseconds = seconds * 1000
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if milliseconds <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound (ms) of the histogram bucket holding the given fraction of samples"""
+        target = fraction * self.count
+        seen = 0
+        for i, count in enumerate(self.buckets[:-1]):
+            seen += count
+            if count and seen >= target:
+                return min(float(LATENCY_BUCKETS_MS[i]), self.max * 1000)
+        return self.max * 1000
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'total_seconds': round(self.total, 6),
+            'mean_ms': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'max_ms': round(self.max * 1000, 3),
+            'histogram_ms': {**{f"<={bound}": count for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)},
+                             f">{LATENCY_BUCKETS_MS[-1]}": self.buckets[-1]}
+        }
+
+
+class RunProfiler:
+    """Thread-safe collector of phase timings, cache outcomes and traffic"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.phases: Dict[str, PhaseStats] = defaultdict(PhaseStats)
+        self.cache: Dict[str, Dict[str, int]] = {}
+        self.traffic: Dict[str, Dict] = {}
+        self.requests: Dict[str, Dict[str, int]] = {}   # endpoint -> status -> count
+
+    def enable(self):
+        """Start profiling, counting wall time from now"""
+        self.enabled = True
+        self.started = time.time()
+
+    def phase(self, name: str):
+        """Context manager timing one call of phase ``name``"""
+        return self._timed(name) if self.enabled else _DISABLED
+
+    @contextmanager
+    def _timed(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float):
+        """Add one duration to phase ``name``"""
+        with self.lock:
+            self.phases[name].add(seconds)
+
+    def record_cache(self, endpoint_class: str, outcome: str):
+        """Count one cache lookup; ``outcome`` is one of CACHE_OUTCOMES"""
+        if not self.enabled:
+            return
+        with self.lock:
+            counts = self.cache.setdefault(endpoint_class, dict.fromkeys(CACHE_OUTCOMES, 0))
+            counts[outcome] += 1
+
+    def record_exchange(self, resource: str, seconds: float, response):
+        """Record one HTTP exchange: network time, bytes each way and status"""
+        if not self.enabled:
+            return
+        request = getattr(response, 'request', None)
+        sent = len(request.url or '') + len(request.body or b'') if request is not None else 0
+        received = len(response.content or b'')
+        endpoint = 'graphql' if resource == 'graphql' else endpoint_label(urlsplit(response.url or '').path)
+        status = str(response.status_code)
+        with self.lock:
+            self.phases[NETWORK_PHASES.get(resource, resource)].add(seconds)
+            traffic = self.traffic.setdefault(resource, {'requests': 0, 'bytes_out': 0, 'bytes_in': 0,
+                                                         'status': defaultdict(int)})
+            traffic['requests'] += 1
+            traffic['bytes_out'] += sent
+            traffic['bytes_in'] += received
+            traffic['status'][status] += 1
+            statuses = self.requests.setdefault(endpoint, {})
+            statuses[status] = statuses.get(status, 0) + 1
+
+    def report(self, governor=None) -> Dict:
+        """The profile as a JSON-serializable dict; ``governor`` adds rate-limit waits"""
+        with self.lock:
+            profile = {
+                'started_at': self.started,
+                'wall_seconds': round(time.time() - self.started, 3),
+                'phases': {name: stats.to_dict() for name, stats in sorted(self.phases.items())},
+                'cache': {name: dict(counts) for name, counts in sorted(self.cache.items())},
+                'traffic': {resource: dict(traffic, status=dict(traffic['status']))
+                            for resource, traffic in sorted(self.traffic.items())},
+                'requests': {endpoint: dict(statuses) for endpoint, statuses in sorted(self.requests.items())}
+            }
+        if governor is not None:
+            profile['rate_limit_wait_seconds'] = {resource: round(bucket.waited, 3)
+                                                  for resource, bucket in governor.buckets.items()}
+        return profile
+
+    def save(self, path: str, governor=None) -> Dict:
+        """Write the profile to ``path`` as JSON and return it"""
+        profile = self.report(governor)
+        with open(path, 'w') as f:
+            json.dump(profile, f, indent=2)
+        return profile
+
+
+def print_profile(profile: Dict):
+    """Print the summary tables of a profile produced by ``RunProfiler.report``"""
+    print(f"\n⏱️  Run profile ({profile['wall_seconds']:.1f}s wall time; phase totals are summed over threads):")
+    print(f"{'Phase':<16} {'Count':<9} {'Total s':<10} {'Mean ms':<10} {'p50 ms':<9} {'p95 ms':<9} {'Max ms':<10}")
+    print("-" * 76)
+    phases = sorted(profile['phases'].items(), key=lambda item: item[1]['total_seconds'], reverse=True)
+    for name, stats in phases:
+        print(f"{name:<16} {stats['count']:<9} {stats['total_seconds']:<10.2f} {stats['mean_ms']:<10.1f} "
+              f"{stats['p50_ms']:<9.1f} {stats['p95_ms']:<9.1f} {stats['max_ms']:<10.1f}")
+
+    if profile['cache']:
+        print(f"\n{'Cache class':<16} {'Hits':<8} {'304s':<8} {'Expired':<9} {'Misses':<8}")
+        print("-" * 52)
+        for name, counts in profile['cache'].items():
+            print(f"{name:<16} {counts['hit']:<8} {counts['revalidated']:<8} {counts['expired']:<9} {counts['miss']:<8}")
+
+    if profile['traffic']:
+        print(f"\n{'Resource':<16} {'Requests':<10} {'KB out':<10} {'KB in':<10} Status codes")
+        print("-" * 66)
+        for resource, traffic in profile['traffic'].items():
+            statuses = ', '.join(f"{status}×{count}" for status, count in sorted(traffic['status'].items()))
+            print(f"{resource:<16} {traffic['requests']:<10} {traffic['bytes_out'] / 1024:<10.1f} "
+                  f"{traffic['bytes_in'] / 1024:<10.1f} {statuses}")
+
+    waits = profile.get('rate_limit_wait_seconds', {})
+    network = sum(stats['total_seconds'] for name, stats in profile['phases'].items()
+                  if name in NETWORK_PHASES.values())
+    cache = sum(profile['phases'].get(name, {}).get('total_seconds', 0.0)
+                for name in (PHASE_CACHE_LOAD, PHASE_CACHE_SAVE))
+    print(f"\n📊 Network {network:.1f}s, rate-limit waits {sum(waits.values()):.1f}s "
+          f"({', '.join(f'{resource} {seconds:.1f}s' for resource, seconds in waits.items())}), "
+          f"cache {cache:.1f}s")
+
+
+def profiled(phase: str):
+    """Decorator timing a tracker method as ``phase`` when the tracker's profiler is enabled"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler: Optional[RunProfiler] = getattr(self, 'profiler', None)
+            if profiler is None or not profiler.enabled:
+                return method(self, *args, **kwargs)
+            with profiler.phase(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -32,16 +32,93 @@ Usage Examples:
 import os
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 import csv
 from dataclasses import dataclass, asdict
-import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from advanced_contribution_tracker import AdvancedContributionTracker, ContributionMetrics
+from advanced_contribution_tracker import (AdvancedContributionTracker, ContributionMetrics,
+                                           CACHE_BACKEND, CACHE_DIR, CACHE_REVALIDATE_DAYS, DEFAULT_WORKERS,
+                                           GRAPHQL_BATCH_SIZE, FetchError, RATE_LIMIT_FRAGMENT,
+                                           add_http_archive_arguments, print_runs, setup_http_archive,
+                                           start_or_resume_run)
+from cache_backend import CACHE_BACKENDS
+from contribution_store import MUTABLE_DAYS
+from github_transport import HTTP_POOL_SIZE, HTTP_TIMEOUT
+from metrics_exporter import add_metrics_arguments, start_metrics_export
+from rate_limit import REQUESTS_PER_HOUR
+from request_fingerprint import CACHE_TIME_GRANULARITY
+from run_journal import RUN_JOURNAL_FILE, RunJournal
+from run_profile import PHASE_CSV, PHASE_TEAM_DISCOVERY, PHASE_TEAM_MAPPING, PHASE_TEAM_METRICS, profiled
 
 # Configuration Constants
 ORG_NAME = os.getenv('GITHUB_ORG', 'statisticsnorway')
 ORG_NAME_2 = os.getenv('GITHUB_ORG_2')  # Optional second organization
+TEAM_DISCOVERY = "rest"         # Team discovery: "rest" (per team) or "graphql" (per organization)
+TEAM_DISCOVERY_MODES = ('rest', 'graphql')
+
+# Team CSV columns
+TEAM_RESULT_FIELDS = ['team_rank', 'team_name', 'team_slug', 'team_description', 'member_count',
+                      'total_team_score', 'average_team_score', 'total_commits', 'total_prs_opened',
+                      'total_prs_merged', 'total_reviews_given', 'total_review_comments']
+TEAM_MEMBER_FIELDS = ['team_name', 'team_rank', 'username', 'full_name', 'individual_rank',
+                      'total_score', 'commits_count', 'commits_score', 'prs_opened', 'prs_merged',
+                      'pr_merge_rate', 'pr_score', 'reviews_given', 'review_comments', 'reviews_score',
+                      'collaboration_score', 'consistency_score']
+
+# Every team of an organization with its first page of members; only the
+# configured slugs are kept, so whole topologies load in a few requests
+TEAM_DISCOVERY_QUERY = """
+        query($org: String!, $cursor: String) {
+          rateLimit {
+            ...RateLimitInfo
+          }
+          organization(login: $org) {
+            teams(first: 100, after: $cursor) {
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
+              nodes {
+                slug
+                name
+                description
+                members(first: 100, membership: ALL) {
+                  pageInfo {
+                    hasNextPage
+                    endCursor
+                  }
+                  nodes {
+                    login
+                  }
+                }
+              }
+            }
+          }
+        }
+        """ + RATE_LIMIT_FRAGMENT
+
+# Further member pages for teams with more than 100 members
+TEAM_MEMBERS_QUERY = """
+        query($org: String!, $slug: String!, $cursor: String!) {
+          rateLimit {
+            ...RateLimitInfo
+          }
+          organization(login: $org) {
+            team(slug: $slug) {
+              members(first: 100, after: $cursor, membership: ALL) {
+                pageInfo {
+                  hasNextPage
+                  endCursor
+                }
+                nodes {
+                  login
+                }
+              }
+            }
+          }
+        }
+        """ + RATE_LIMIT_FRAGMENT
 
 @dataclass
 class TeamMetrics:
@@ -72,13 +149,37 @@ class TeamMetrics:
         if self.members is None:
             self.members = []
 
+@dataclass
+class TeamRegistry:
+    """Configured teams and their memberships, resolved once per run and
+    shared by the mapping, aggregation and output stages."""
+    teams: List[Dict]                          # Found teams with display_name and org_name
+    members: Dict[Tuple[str, str], List[str]]  # (org_name, team_slug) -> member logins
+    
+    def user_teams(self, users: Dict[str, str]) -> Dict[str, List[Dict]]:
+        """Map each configured user to the registry teams they belong to"""
+        user_teams = {}
+        for team in self.teams:
+            for username in self.members.get((team['org_name'], team['slug']), []):
+                if username in users:  # Only track configured users
+                    user_teams.setdefault(username, []).append({
+                        'name': team.get('display_name', team['name']),
+                        'slug': team['slug'],
+                        'description': team.get('description', ''),
+                        'org_name': team['org_name']
+                    })
+        return user_teams
+
 class TeamContributionTracker(AdvancedContributionTracker):
     """Extension of AdvancedContributionTracker with team-based functionality."""
     
-    def __init__(self, token: str):
-        super().__init__(token)
+    def __init__(self, token: str, pool_size: int = HTTP_POOL_SIZE, timeout=HTTP_TIMEOUT,
+                 requests_per_hour: float = REQUESTS_PER_HOUR, cache_backend: str = CACHE_BACKEND):
+        super().__init__(token, pool_size=pool_size, timeout=timeout,
+                         requests_per_hour=requests_per_hour, cache_backend=cache_backend)
         self.teams_cache = {}
         self.user_teams_cache = {}
+        self.team_registry: Optional[TeamRegistry] = None
         self.organizations = [ORG_NAME]
         if ORG_NAME_2:
             self.organizations.append(ORG_NAME_2)
@@ -86,9 +187,7 @@ class TeamContributionTracker(AdvancedContributionTracker):
     def load_teams_config(self) -> Dict[str, str]:
         """Load team configuration from config.json"""
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            root_dir = os.path.dirname(script_dir)
-            config_path = os.path.join(root_dir, 'config.json')
+            config_path = self.get_config_path()
             
             with open(config_path, 'r') as f:
                 config = json.load(f)
@@ -100,134 +199,300 @@ class TeamContributionTracker(AdvancedContributionTracker):
             print("Warning: No 'teams' section in config.json. No team filter will be applied.")
             return {}
     
-    def get_configured_teams(self) -> List[Dict]:
-        """Get teams specified in config.json from all configured organizations"""
+    def get_configured_teams(self, workers: int = DEFAULT_WORKERS) -> List[Dict]:
+        """Get teams specified in config.json from all configured organizations
+        
+        Every org × team pair is looked up concurrently; results keep the
+        config order (organizations first, then teams).
+        """
+        lookups = self.get_team_lookups()
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            teams = list(executor.map(lambda lookup: self.get_team(*lookup), lookups))
+        
+        return [team for team in teams if team]
+    
+    def get_team_lookups(self) -> List[Tuple[str, str, str]]:
+        """(org_name, team_slug, display_name) for every configured team in every organization"""
         configured_teams = self.load_teams_config()
         
         if not configured_teams:
             print("No teams configured in config.json. Please add a 'teams' section.")
             return []
         
-        found_teams = []
+        print(f"Searching for {len(configured_teams)} teams in organizations: {', '.join(self.organizations)}")
+        return [(org_name, team_slug, display_name)
+                for org_name in self.organizations
+                for team_slug, display_name in configured_teams.items()]
+    
+    def get_team(self, org_name: str, team_slug: str, display_name: str) -> Dict:
+        """Look up one configured team in an organization ({} when it is not there)"""
+        cache_key = self.get_cache_key("team_info", org_name, team_slug)
+        cached_team = self.load_from_cache(cache_key, 'team_info')
         
-        for org_name in self.organizations:
-            print(f"Searching for teams in organization: {org_name}")
-            
-            for team_slug, display_name in configured_teams.items():
-                cache_key = self.get_cache_key("team_info", org_name, team_slug)
-                cached_team = self.load_from_cache(cache_key)
-                
-                if cached_team is not None:
-                    if cached_team:  # Not None and not empty dict
-                        cached_team['display_name'] = display_name
-                        cached_team['org_name'] = org_name
-                        found_teams.append(cached_team)
-                    continue
-                
-                # Try to get team info from this organization
-                team_response = self.make_rest_request(f'orgs/{org_name}/teams/{team_slug}')
-                
-                if team_response and 'slug' in team_response:
-                    team_response['display_name'] = display_name
-                    team_response['org_name'] = org_name
-                    found_teams.append(team_response)
-                    self.save_to_cache(cache_key, team_response)
-                    print(f"  ✅ Found team '{display_name}' ({team_slug}) in {org_name}")
-                else:
-                    # Cache empty result to avoid repeated API calls
-                    self.save_to_cache(cache_key, {})
-                    print(f"  ❌ Team '{team_slug}' not found in {org_name}")
-        
-        return found_teams
+        if cached_team is not None:
+            return self.label_team(cached_team, org_name, display_name)
+        
+        # Try to get team info from this organization
+        try:
+            team_response = self.make_rest_request(f'orgs/{org_name}/teams/{team_slug}')
+        except FetchError as e:
+            # Not cached: the team may well exist, so the next run asks again
+            print(f"  ⚠️  Warning: Could not look up team '{team_slug}' in {org_name}: {e}")
+            return {}
+        
+        # Empty results are cached too, to avoid repeated API calls
+        team = self.read_team_response(org_name, team_slug, display_name, team_response)
+        self.save_to_cache(cache_key, team, 'team_info')
+        return team
+    
+    def label_team(self, team: Dict, org_name: str, display_name: str) -> Dict:
+        """Attach the configured display name and organization to a found team"""
+        if team:  # Not None and not empty dict
+            team['display_name'] = display_name
+            team['org_name'] = org_name
+        return team
+    
+    def read_team_response(self, org_name: str, team_slug: str, display_name: str, team_response: Dict) -> Dict:
+        """The team from a team lookup response, or {} when it is not in the organization"""
+        if team_response and 'slug' in team_response:
+            print(f"  ✅ Found team '{display_name}' ({team_slug}) in {org_name}")
+            return self.label_team(team_response, org_name, display_name)
+        
+        print(f"  ❌ Team '{team_slug}' not found in {org_name}")
+        return {}
     
     def get_team_members(self, org_name: str, team_slug: str) -> List[str]:
         """Get members of a specific team in a specific organization"""
         cache_key = self.get_cache_key("team_members", org_name, team_slug)
-        cached_members = self.load_from_cache(cache_key)
+        cached_members = self.load_from_cache(cache_key, 'team_members')
         
         if cached_members is not None:
             return cached_members
         
-        members = []
-        page = 1
-        per_page = 100
-        
-        while True:
-            response = self.make_rest_request(
-                f'orgs/{org_name}/teams/{team_slug}/members',
-                {'page': page, 'per_page': per_page}
-            )
-            
-            if not response or len(response) == 0:
-                break
-            
-            # Extract usernames
-            for member in response:
-                members.append(member['login'])
-            
-            if len(response) < per_page:
-                break
-                
-            page += 1
+        # Extract usernames from every page of the member listing
+        members = [member['login'] for member in
+                   self.paginate_rest_request(f'orgs/{org_name}/teams/{team_slug}/members')]
         
         # Save to cache
-        self.save_to_cache(cache_key, members)
+        self.save_to_cache(cache_key, members, 'team_members')
         return members
     
-    def map_users_to_teams(self, users: Dict[str, str]) -> Dict[str, List[Dict]]:
-        """Map each user to their configured team memberships"""
-        print(f"\n🔍 Discovering team memberships for {len(users)} users...")
+    @profiled(PHASE_TEAM_DISCOVERY)
+    def discover_teams(self, workers: int = DEFAULT_WORKERS, mode: str = TEAM_DISCOVERY,
+                       refresh: bool = False) -> TeamRegistry:
+        """Resolve configured teams and their members once per run
         
-        user_teams = {}
-        teams = self.get_configured_teams()
+        Team lookups and member listings run concurrently. The registry is
+        kept on the tracker, so later stages reuse it instead of repeating
+        the config load, cache lookups and REST calls; ``refresh`` discovers
+        the teams again (long-running processes). ``mode`` 'graphql' loads
+        each organization's teams and members in bulk instead.
+        """
+        if self.team_registry is not None and not refresh:
+            return self.team_registry
         
-        if not teams:
-            print("❌ No configured teams found!")
-            return {}
+        if mode == 'graphql':
+            self.team_registry = self.discover_teams_graphql(workers)
+            return self.team_registry
         
-        print(f"Found {len(teams)} configured teams across {len(self.organizations)} organizations")
+        teams = self.get_configured_teams(workers)
         
-        # Build reverse mapping: user -> teams
-        for i, team in enumerate(teams):
-            team_slug = team['slug']
-            team_name = team.get('display_name', team['name'])
-            org_name = team['org_name']
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = [executor.submit(self.get_team_members, team['org_name'], team['slug']) for team in teams]
+            memberships = [future.exception() or future.result() for future in futures]
+        
+        members = {(team['org_name'], team['slug']): logins
+                   for team, logins in self.pair_team_members(teams, memberships)}
+        self.team_registry = TeamRegistry(teams=teams, members=members)
+        return self.team_registry
+    
+    def pair_team_members(self, teams: List[Dict], memberships: List) -> List[Tuple[Dict, List[str]]]:
+        """Pair teams with their member logins, warning about listings that failed
+        
+        Args:
+            memberships: Member logins per team, in ``teams`` order, or the
+                exception the listing failed with
+        """
+        pairs = []
+        for team, logins in zip(teams, memberships):
+            if isinstance(logins, BaseException):
+                team_name = team.get('display_name', team['name'])
+                print(f"⚠️  Warning: Could not get members for team {team_name}: {logins}")
+                continue
+            pairs.append((team, logins))
+        return pairs
+    
+    def discover_teams_graphql(self, workers: int = DEFAULT_WORKERS) -> TeamRegistry:
+        """Build the team registry from one paginated GraphQL listing per organization
+        
+        Organizations the query cannot read (e.g. missing read:org scope)
+        fall back to the per-team REST lookups.
+        """
+        configured_teams = self.load_teams_config()
+        if not configured_teams:
+            print("No teams configured in config.json. Please add a 'teams' section.")
+            return TeamRegistry(teams=[], members={})
+        
+        print(f"Loading teams via GraphQL from organizations: {', '.join(self.organizations)}")
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            org_results = list(executor.map(lambda org_name: self.get_org_teams_graphql(org_name, configured_teams),
+                                            self.organizations))
+        
+        registry = TeamRegistry(teams=[], members={})
+        for org_name, org_teams in zip(self.organizations, org_results):
+            if org_teams is None:
+                print(f"  ↪️  GraphQL team listing unavailable for {org_name}, using REST lookups")
+                found = [team for team in (self.get_team(org_name, team_slug, display_name)
+                                           for team_slug, display_name in configured_teams.items()) if team]
+                memberships = []
+                for team in found:
+                    try:
+                        memberships.append(self.get_team_members(org_name, team['slug']))
+                    except FetchError as e:
+                        memberships.append(e)
+                org_teams = {team['slug']: (team, logins) for team, logins in self.pair_team_members(found, memberships)}
+            else:
+                self.report_org_teams(org_name, org_teams, configured_teams)
+            self.add_org_teams(registry, org_name, org_teams, configured_teams)
+        
+        return registry
+    
+    def report_org_teams(self, org_name: str, org_teams: Dict[str, Tuple[Dict, List[str]]],
+                         configured_teams: Dict[str, str]):
+        """Say which configured teams a GraphQL listing found in an organization"""
+        for team_slug, display_name in configured_teams.items():
+            if team_slug in org_teams:
+                print(f"  ✅ Found team '{display_name}' ({team_slug}) in {org_name}")
+            else:
+                print(f"  ❌ Team '{team_slug}' not found in {org_name}")
+    
+    def add_org_teams(self, registry: TeamRegistry, org_name: str,
+                      org_teams: Dict[str, Tuple[Dict, List[str]]], configured_teams: Dict[str, str]):
+        """Add an organization's found teams to the registry, in config order as the REST discovery does"""
+        for team_slug in configured_teams:
+            if team_slug in org_teams:
+                team, logins = org_teams[team_slug]
+                registry.teams.append(team)
+                registry.members[(org_name, team_slug)] = logins
+    
+    def get_org_teams_graphql(self, org_name: str,
+                              configured_teams: Dict[str, str]) -> Optional[Dict[str, Tuple[Dict, List[str]]]]:
+        """List an organization's configured teams with their members via GraphQL
+        
+        Returns:
+            Mapping of team slug to (team, member logins) for configured teams
+            found in the organization, or None when the query failed
+        """
+        found = {}
+        cursor = None
+        while True:
+            try:
+                response = self.make_graphql_request(TEAM_DISCOVERY_QUERY, {'org': org_name, 'cursor': cursor})
+            except FetchError:
+                return None
+            connection = ((response.get('data') or {}).get('organization') or {}).get('teams')
+            if connection is None:
+                return None
             
-            # Progress indicator
-            sys.stdout.write(f'\rAnalyzing team {i+1}/{len(teams)}: {team_name} ({org_name})')
-            sys.stdout.flush()
+            for team, logins, members_cursor in self.read_team_discovery_page(org_name, connection, configured_teams):
+                while members_cursor:
+                    try:
+                        page = self.make_graphql_request(TEAM_MEMBERS_QUERY, {'org': org_name, 'slug': team['slug'],
+                                                                              'cursor': members_cursor})
+                    except FetchError:
+                        return None
+                    more_logins, members_cursor = self.read_team_members_page(page)
+                    logins.extend(more_logins)
+                found[team['slug']] = (team, logins)
             
-            try:
-                members = self.get_team_members(org_name, team_slug)
-                
-                for username in members:
-                    if username in users:  # Only track configured users
-                        if username not in user_teams:
-                            user_teams[username] = []
-                        
-                        user_teams[username].append({
-                            'name': team_name,
-                            'slug': team_slug,
-                            'description': team.get('description', ''),
-                            'org_name': org_name
-                        })
-            except Exception as e:
-                print(f"\n⚠️  Warning: Could not get members for team {team_name}: {e}")
+            # Stop early once every configured slug has been seen
+            page_info = connection.get('pageInfo') or {}
+            if len(found) == len(configured_teams) or not page_info.get('hasNextPage'):
+                return found
+            cursor = page_info.get('endCursor')
+    
+    def read_team_discovery_page(self, org_name: str, connection: Dict,
+                                 configured_teams: Dict[str, str]) -> List[Tuple[Dict, List[str], Optional[str]]]:
+        """Configured teams on one TEAM_DISCOVERY_QUERY page
+        
+        Returns:
+            List of (team, member logins, cursor for more members or None)
+        """
+        page_teams = []
+        for node in connection.get('nodes') or []:
+            team_slug = node.get('slug')
+            if team_slug not in configured_teams:
                 continue
+            team = {
+                'slug': team_slug,
+                'name': node.get('name') or team_slug,
+                'description': node.get('description') or '',
+                'display_name': configured_teams[team_slug],
+                'org_name': org_name
+            }
+            member_connection = node.get('members') or {}
+            logins = [member['login'] for member in member_connection.get('nodes') or []]
+            page_info = member_connection.get('pageInfo') or {}
+            members_cursor = page_info.get('endCursor') if page_info.get('hasNextPage') else None
+            page_teams.append((team, logins, members_cursor))
+        return page_teams
+    
+    def read_team_members_page(self, response: Dict) -> Tuple[List[str], Optional[str]]:
+        """Member logins and next cursor from a TEAM_MEMBERS_QUERY response"""
+        team = ((response.get('data') or {}).get('organization') or {}).get('team') or {}
+        member_connection = team.get('members') or {}
+        page_info = member_connection.get('pageInfo') or {}
+        logins = [member['login'] for member in member_connection.get('nodes') or []]
+        return logins, page_info.get('endCursor') if page_info.get('hasNextPage') else None
+    
+    @profiled(PHASE_TEAM_MAPPING)
+    def map_users_to_teams(self, users: Dict[str, str], registry: TeamRegistry = None) -> Dict[str, List[Dict]]:
+        """Map each user to their configured team memberships"""
+        print(f"\n🔍 Discovering team memberships for {len(users)} users...")
         
-        # Clear progress line
-        sys.stdout.write('\r' + ' ' * 100 + '\r')
-        sys.stdout.flush()
+        if registry is None:
+            registry = self.discover_teams()
+        return self.read_user_teams(users, registry)
+    
+    def read_user_teams(self, users: Dict[str, str], registry: TeamRegistry) -> Dict[str, List[Dict]]:
+        """Map users to the teams of a discovered registry"""
+        if not registry.teams:
+            print("❌ No configured teams found!")
+            return {}
+        
+        print(f"Found {len(registry.teams)} configured teams across {len(self.organizations)} organizations")
+        user_teams = registry.user_teams(users)
         
         print(f"✅ Team mapping complete")
         return user_teams
     
+    def build_team_index(self, user_teams: Dict[str, List[Dict]]) -> Dict[Tuple[str, str], List[str]]:
+        """Invert user -> teams into (org_name, team_slug) -> member usernames
+        
+        Members keep the order of ``user_teams``; a user listed twice for the
+        same team is counted once, and users in several teams appear in each.
+        """
+        team_index: Dict[Tuple[str, str], List[str]] = {}
+        for username, user_team_list in user_teams.items():
+            for user_team in user_team_list:
+                members = team_index.setdefault((user_team.get('org_name'), user_team['slug']), [])
+                if not members or members[-1] != username:
+                    members.append(username)
+        return team_index
+    
+    @profiled(PHASE_TEAM_METRICS)
     def create_team_metrics(self, teams: List[Dict], user_teams: Dict[str, List[Dict]], 
                            user_metrics: List[ContributionMetrics]) -> List[TeamMetrics]:
-        """Create team metrics by aggregating individual contributions"""
+        """Create team metrics by aggregating individual contributions
+        
+        Membership is looked up in an index built once, so the cost is
+        linear in teams plus memberships rather than teams × users.
+        """
         
         # Create mapping from username to metrics
         metrics_by_user = {m.username: m for m in user_metrics}
+        team_index = self.build_team_index(user_teams)
         
         team_metrics_list = []
         
@@ -236,15 +501,9 @@ class TeamContributionTracker(AdvancedContributionTracker):
             team_name = team.get('display_name', team['name'])  # Use display name from config
             org_name = team['org_name']
             
-            # Find all users in this team
-            team_members = []
-            for username, user_team_list in user_teams.items():
-                for user_team in user_team_list:
-                    if (user_team['slug'] == team_slug and 
-                        user_team.get('org_name') == org_name and 
-                        username in metrics_by_user):
-                        team_members.append(metrics_by_user[username])
-                        break
+            # Configured users of this team that have metrics
+            team_members = [metrics_by_user[username] for username in team_index.get((org_name, team_slug), [])
+                            if username in metrics_by_user]
             
             if not team_members:
                 continue  # Skip teams with no configured members
@@ -312,6 +571,7 @@ class TeamContributionTracker(AdvancedContributionTracker):
                 print(f"   {member.full_name:<30} {member.total_score:<8.1f} "
                       f"(C:{member.commits_count} P:{member.prs_opened} R:{member.reviews_given})")
     
+    @profiled(PHASE_CSV)
     def save_team_results(self, team_metrics: List[TeamMetrics], filename: str = None):
         """Save team results to CSV file"""
         if not filename:
@@ -319,64 +579,58 @@ class TeamContributionTracker(AdvancedContributionTracker):
             filename = f"team_contributions_{timestamp}.csv"
         
         # Team summary CSV
-        team_fieldnames = [
-            'team_rank', 'team_name', 'team_slug', 'team_description', 'member_count',
-            'total_team_score', 'average_team_score', 'total_commits', 'total_prs_opened',
-            'total_prs_merged', 'total_reviews_given', 'total_review_comments'
-        ]
-        
         team_filename = filename.replace('.csv', '_teams.csv')
-        
         with open(team_filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=team_fieldnames)
-            writer.writeheader()
-            
-            for team in team_metrics:
-                row = asdict(team)
-                # Remove the members list for the team summary
-                row.pop('members', None)
-                writer.writerow(row)
+            self.write_team_summary_csv(team_metrics, f)
         
         # Individual members by team CSV
         member_filename = filename.replace('.csv', '_members_by_team.csv')
-        member_fieldnames = [
-            'team_name', 'team_rank', 'username', 'full_name', 'individual_rank',
-            'total_score', 'commits_count', 'commits_score', 'prs_opened', 'prs_merged',
-            'pr_merge_rate', 'pr_score', 'reviews_given', 'review_comments', 'reviews_score',
-            'collaboration_score', 'consistency_score'
-        ]
-        
         with open(member_filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=member_fieldnames)
-            writer.writeheader()
-            
-            for team in team_metrics:
-                for member in team.members:
-                    row = {
-                        'team_name': team.team_name,
-                        'team_rank': team.team_rank,
-                        'username': member.username,
-                        'full_name': member.full_name,
-                        'individual_rank': member.rank,
-                        'total_score': member.total_score,
-                        'commits_count': member.commits_count,
-                        'commits_score': member.commits_score,
-                        'prs_opened': member.prs_opened,
-                        'prs_merged': member.prs_merged,
-                        'pr_merge_rate': member.pr_merge_rate,
-                        'pr_score': member.pr_score,
-                        'reviews_given': member.reviews_given,
-                        'review_comments': member.review_comments,
-                        'reviews_score': member.reviews_score,
-                        'collaboration_score': member.collaboration_score,
-                        'consistency_score': member.consistency_score
-                    }
-                    writer.writerow(row)
+            self.write_team_members_csv(team_metrics, f)
         
         print(f"\nResults saved to:")
         print(f"  Teams: {team_filename}")
         print(f"  Members: {member_filename}")
         return team_filename, member_filename
+    
+    def write_team_summary_csv(self, team_metrics: List[TeamMetrics], f):
+        """Write the team summary CSV rows to an open text file"""
+        writer = csv.DictWriter(f, fieldnames=TEAM_RESULT_FIELDS)
+        writer.writeheader()
+        
+        for team in team_metrics:
+            row = asdict(team)
+            # Remove the members list for the team summary
+            row.pop('members', None)
+            writer.writerow(row)
+    
+    def write_team_members_csv(self, team_metrics: List[TeamMetrics], f):
+        """Write the members-by-team CSV rows to an open text file"""
+        writer = csv.DictWriter(f, fieldnames=TEAM_MEMBER_FIELDS)
+        writer.writeheader()
+        
+        for team in team_metrics:
+            for member in team.members:
+                row = {
+                    'team_name': team.team_name,
+                    'team_rank': team.team_rank,
+                    'username': member.username,
+                    'full_name': member.full_name,
+                    'individual_rank': member.rank,
+                    'total_score': member.total_score,
+                    'commits_count': member.commits_count,
+                    'commits_score': member.commits_score,
+                    'prs_opened': member.prs_opened,
+                    'prs_merged': member.prs_merged,
+                    'pr_merge_rate': member.pr_merge_rate,
+                    'pr_score': member.pr_score,
+                    'reviews_given': member.reviews_given,
+                    'review_comments': member.review_comments,
+                    'reviews_score': member.reviews_score,
+                    'collaboration_score': member.collaboration_score,
+                    'consistency_score': member.consistency_score
+                }
+                writer.writerow(row)
 
 def main():
     """Main execution function"""
@@ -387,73 +641,88 @@ def main():
     parser.add_argument('--quarter', type=str, help='Track by quarter (format: Q1-2025, Q2-2024, etc.)')
     parser.add_argument('--year', type=int, help='Year for quarter tracking (default: current year)')
     parser.add_argument('--clear-cache', action='store_true', help='Clear cache before running')
+    parser.add_argument('--cache-backend', choices=CACHE_BACKENDS, default=CACHE_BACKEND, help=f'Response cache backend (default: {CACHE_BACKEND})')
     parser.add_argument('--top-teams', type=int, default=5, help='Number of top teams to show details (default: 5)')
+    parser.add_argument('--pool-size', type=int, default=HTTP_POOL_SIZE, help=f'Keep-alive HTTP connections to GitHub (default: {HTTP_POOL_SIZE})')
+    parser.add_argument('--timeout', type=float, default=HTTP_TIMEOUT[1], help=f'Per-request read timeout in seconds (default: {HTTP_TIMEOUT[1]:.0f})')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help=f'Users tracked concurrently (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--requests-per-hour', type=float, default=REQUESTS_PER_HOUR, help=f'Cap on the core REST request rate (default: {REQUESTS_PER_HOUR})')
+    parser.add_argument('--graphql-batch-size', type=int, default=GRAPHQL_BATCH_SIZE, help=f'Users per aliased GraphQL query, 1 disables batching (default: {GRAPHQL_BATCH_SIZE})')
+    parser.add_argument('--incremental', action='store_true', help='Build results from the per-day store, fetching only new days')
+    parser.add_argument('--mutable-days', type=int, default=MUTABLE_DAYS, help=f'Recent days refetched on every incremental run (default: {MUTABLE_DAYS})')
+    parser.add_argument('--cache-granularity', type=int, default=CACHE_TIME_GRANULARITY, help=f'Seconds window starts are rounded down to, so repeated runs share cache entries (default: {CACHE_TIME_GRANULARITY})')
+    parser.add_argument('--scoring-config', type=str, help='JSON file with scoring settings (default: "scoring" section of config.json)')
+    parser.add_argument('--team-discovery', choices=TEAM_DISCOVERY_MODES, default=TEAM_DISCOVERY, help=f'How teams and members are loaded (default: {TEAM_DISCOVERY})')
+    parser.add_argument('--resume', type=str, metavar='RUN_ID', help='Finish an interrupted run, tracking only users it has not completed')
+    parser.add_argument('--list-runs', action='store_true', help='List recent runs from the run journal and exit')
+    parser.add_argument('--profile', action='store_true', help='Time each phase (network, cache, scoring, teams, CSV) and write a run_profile_[timestamp].json summary')
+    add_http_archive_arguments(parser)
+    add_metrics_arguments(parser)
     
     args = parser.parse_args()
     
+    if args.list_runs:
+        print_runs(RunJournal(os.path.join(CACHE_DIR, RUN_JOURNAL_FILE)))
+        return
+    
     token = os.getenv('GITHUB_TOKEN')
-    if not token:
+    if not token and not args.replay:
         print("Error: GITHUB_TOKEN environment variable not set")
         return
     
-    tracker = TeamContributionTracker(token)
+    tracker = TeamContributionTracker(token or '', pool_size=max(args.pool_size, args.workers),
+                                      timeout=(HTTP_TIMEOUT[0], args.timeout),
+                                      requests_per_hour=args.requests_per_hour,
+                                      cache_backend=args.cache_backend)
+    tracker.contribution_store.mutable_days = args.mutable_days
+    tracker.cache_granularity = args.cache_granularity
+    if args.profile:
+        tracker.profiler.enable()
+    run_metrics = start_metrics_export(tracker, args, 'team')
+    if args.scoring_config:
+        tracker.scoring = tracker.load_scoring_config(args.scoring_config)
+    if not setup_http_archive(tracker, args):
+        return
     
-    # Clear cache if requested
+    # Clear cache if requested, otherwise drop expired entries
     if args.clear_cache:
-        import shutil
-        if os.path.exists("CACHE"):
-            shutil.rmtree("CACHE")
-            print("🗑️ Cache cleared")
-        os.makedirs("CACHE", exist_ok=True)
+        tracker.cache.clear()
+        print("🗑️ Cache cleared")
+    else:
+        tracker.cache.purge_expired(keep_validated_for=CACHE_REVALIDATE_DAYS * 86400)
     
     print("🚀 Starting Team-Based GitHub Contribution Tracking...")
     organizations_str = ', '.join(tracker.organizations)
     print(f"Organizations: {organizations_str}")
     
     # Handle time range (same as individual tracker)
-    start_date = None
-    end_date = None
-    
-    if args.quarter:
-        try:
-            if '-' in args.quarter:
-                quarter_str, year_str = args.quarter.split('-')
-                quarter = int(quarter_str[1])
-                year = int(year_str)
-            else:
-                quarter = int(args.quarter[1])
-                year = args.year if args.year else datetime.now().year
-            
-            start_date, end_date = tracker.get_quarter_dates(year, quarter)
-            period_desc = f"Q{quarter} {year}"
-            filename_suffix = f"Q{quarter}_{year}"
-            
-        except (ValueError, IndexError):
-            print("Error: Invalid quarter format. Use Q1-2025, Q2-2024, etc.")
-            return
-    else:
-        period_desc = f"Last {args.days} days"
-        filename_suffix = f"{args.days}days"
-    
-    print(f"Tracking period: {period_desc}\n")
+    run = start_or_resume_run(tracker, args)
+    if run is None:
+        return
+    filename_suffix = run['filename_suffix']
     
     # Step 1: Get individual user contributions (reuse existing tracker)
     print("📊 Getting individual contribution data...")
-    individual_metrics = tracker.track_all_users(start_date=start_date, end_date=end_date, 
-                                               days_back=args.days)
+    try:
+        individual_metrics = tracker.track_all_users(start_date=run['start_date'], end_date=run['end_date'],
+                                                     days_back=run['days_back'], workers=args.workers,
+                                                     batch_size=args.graphql_batch_size,
+                                                     incremental=run['incremental'], run_id=run['run_id'])
+    except KeyboardInterrupt:
+        return
     
     if not individual_metrics:
         print("❌ No individual contribution data found. Check configuration and token permissions.")
         return
     
-    # Step 2: Discover team memberships
+    # Step 2: Discover teams and memberships once, shared by the later steps
     users = tracker.load_users_config()
-    user_teams = tracker.map_users_to_teams(users)
+    registry = tracker.discover_teams(args.workers, args.team_discovery)
+    user_teams = tracker.map_users_to_teams(users, registry)
     
     # Step 3: Create team metrics
     print(f"\n📈 Aggregating team contributions...")
-    teams = tracker.get_configured_teams()
-    team_metrics = tracker.create_team_metrics(teams, user_teams, individual_metrics)
+    team_metrics = tracker.create_team_metrics(registry.teams, user_teams, individual_metrics)
     
     if not team_metrics:
         print("❌ No team data found. Users may not be in any teams or teams may be private.")
@@ -471,8 +740,14 @@ def main():
     print(f"\n✅ Team tracking complete!")
     
     # Show cache info
-    cache_files = len([f for f in os.listdir("CACHE") if f.endswith('.pkl')]) if os.path.exists("CACHE") else 0
-    print(f"🗄 Cache: {cache_files} files")
+    cache_entries = tracker.cache.count()
+    print(f"🗄 Cache: {sum(cache_entries.values())} entries")
+    tracker.print_cache_report()
+    tracker.print_http_archive_report()
+    if run_metrics:
+        run_metrics.finish(success=True)
+    if args.profile:
+        tracker.save_profile(f"run_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Webhook Ingest: incremental contribution updates from GitHub webhook deliveries
+
+Turns ``push``, ``pull_request``, ``pull_request_review`` and
+``issue_comment`` payloads into per-day counts in the
+contribution store, so live leaderboards change within seconds of an event
+and only the users it affects are re-scored. The crawl stays the source of
+truth: it replaces every day it refetches, and a nightly run reconciles
+anything webhooks missed (pushes with more than 20 commits, lost deliveries).
+
+Events are counted the same way as the crawl counts them:
+   - push to the default branch: one commit per distinct commit, for the
+     commit author's login on the commit day
+   - pull_request opened / closed as merged: one PR opened / merged for the
+     PR author, on the day the PR was opened
+   - pull_request_review submitted: one review for the reviewer, on the day
+     it was submitted
+   - issue_comment created on a pull request: one comment received by the PR
+     author, on the day the PR was opened (the crawl's ``review_comments`` is
+     the PR's conversation comment count; inline review comments, which
+     arrive as ``pull_request_review_comment``, are not part of it)
+
+Deleted comments and closed-then-reopened PRs are not subtracted; the next
+crawl of those days corrects them.
+
+Every counted contribution has a key (commit sha, PR id, review id, comment
+id), so redelivered or overlapping events are counted once. Only users in
+config.json are counted. With a secret, deliveries must carry a valid
+``X-Hub-Signature-256``.
+
+Offline use with recorded payloads (no GitHub access needed):
+    TRACKER_CONFIG=webhook_fixtures/config.json \\
+        python webhook_ingest.py webhook_fixtures --store /tmp/webhook_test.sqlite3
+
+Fixture files are JSON objects with ``event``, the ``payload`` object or the
+raw delivered ``body`` string (needed to check signatures), and optionally
+``delivery`` and ``headers``; other JSON files in a directory are skipped.
+The leaderboard service accepts live deliveries on ``POST /webhook``.
+"""
+
+import argparse
+import glob
+import hashlib
+import hmac
+import json
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional
+
+from contribution_store import ContributionFact, ContributionStore, DailyCounts
+
+# Webhook Defaults
+SIGNATURE_HEADER = "X-Hub-Signature-256"
+EVENT_HEADER = "X-GitHub-Event"
+DELIVERY_HEADER = "X-GitHub-Delivery"
+WEBHOOK_SECRET = os.getenv('GITHUB_WEBHOOK_SECRET')   # Optional shared secret
+SUPPORTED_EVENTS = ('push', 'pull_request', 'pull_request_review', 'issue_comment')
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check an ``X-Hub-Signature-256`` header against the raw request body"""
+    if not signature:
+        return False
+    expected = 'sha256=' + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def utc_day(timestamp: str) -> date:
+    """UTC day of an ISO 8601 timestamp (GitHub sends both Z and offsets)"""
+    moment = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    if moment.utcoffset():
+        moment = moment - moment.utcoffset()
+    return moment.date()
+
+
+def login_of(account: Optional[Dict]) -> Optional[str]:
+    return (account or {}).get('login')
+
+
+def push_facts(payload: Dict) -> Iterator[ContributionFact]:
+    repository = payload.get('repository') or {}
+    default_branch = repository.get('default_branch') or repository.get('master_branch')
+    # Like the contribution graph, only commits on the default branch count
+    if default_branch and payload.get('ref') != f"refs/heads/{default_branch}":
+        return
+    for commit in payload.get('commits') or []:
+        username = (commit.get('author') or {}).get('username')
+        if not username or not commit.get('distinct', True):
+            continue
+        yield ContributionFact(f"commit:{commit['id']}", username, utc_day(commit['timestamp']),
+                               DailyCounts(commits=1))
+
+
+def pull_request_facts(payload: Dict) -> Iterator[ContributionFact]:
+    pull_request = payload.get('pull_request') or {}
+    username = login_of(pull_request.get('user'))
+    if not username:
+        return
+    day = utc_day(pull_request['created_at'])
+    if payload.get('action') == 'opened':
+        yield ContributionFact(f"pr_opened:{pull_request['id']}", username, day, DailyCounts(prs_opened=1))
+    elif payload.get('action') == 'closed' and pull_request.get('merged'):
+        yield ContributionFact(f"pr_merged:{pull_request['id']}", username, day, DailyCounts(prs_merged=1))
+
+
+def review_facts(payload: Dict) -> Iterator[ContributionFact]:
+    review = payload.get('review') or {}
+    username = login_of(review.get('user'))
+    if payload.get('action') != 'submitted' or not username:
+        return
+    yield ContributionFact(f"review:{review['id']}", username, utc_day(review['submitted_at']),
+                           DailyCounts(reviews=1))
+
+
+def pr_comment_facts(payload: Dict) -> Iterator[ContributionFact]:
+    comment = payload.get('comment') or {}
+    issue = payload.get('issue') or {}
+    username = login_of(issue.get('user'))
+    # Issue comments on plain issues carry no pull_request link and are not counted
+    if payload.get('action') != 'created' or not issue.get('pull_request') or not username:
+        return
+    yield ContributionFact(f"pr_comment:{comment['id']}", username, utc_day(issue['created_at']),
+                           DailyCounts(review_comments=1))
+
+
+EVENT_PARSERS = {
+    'push': push_facts,
+    'pull_request': pull_request_facts,
+    'pull_request_review': review_facts,
+    'issue_comment': pr_comment_facts,
+}
+
+
+def parse_event(event: str, payload: Dict) -> List[ContributionFact]:
+    """Contributions in one webhook payload (unsupported events and actions give none)
+
+    Raises:
+        ValueError: If a supported event is missing required fields
+    """
+    parser = EVENT_PARSERS.get(event)
+    if parser is None:
+        return []
+    try:
+        return list(parser(payload))
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Malformed {event} payload: {e}") from e
+
+
+class WebhookIngestor:
+    """Counts webhook deliveries for configured users into a contribution store"""
+
+    def __init__(self, store: ContributionStore, users: Dict[str, str]):
+        self.store = store
+        self.logins = {username.lower(): username for username in users}
+
+    def parse(self, event: str, payload: Dict) -> List[ContributionFact]:
+        """Contributions of configured users in one delivery, without counting them"""
+        facts = []
+        for fact in parse_event(event, payload):
+            username = self.logins.get(fact.username.lower())
+            if username is not None:
+                fact.username = username
+                facts.append(fact)
+        return facts
+
+    def ingest(self, event: str, payload: Dict) -> List[ContributionFact]:
+        """Count one delivery and return the contributions that were new"""
+        return self.store.add_facts(self.parse(event, payload))
+
+
+def affected_users(facts: List[ContributionFact]) -> Dict[str, List[ContributionFact]]:
+    """Group counted contributions by user"""
+    by_user: Dict[str, List[ContributionFact]] = {}
+    for fact in facts:
+        by_user.setdefault(fact.username, []).append(fact)
+    return by_user
+
+
+def load_fixtures(paths: List[str]) -> List[Dict]:
+    """Recorded deliveries from files and directories, in file name order"""
+    files = []
+    for path in paths:
+        files.extend(sorted(glob.glob(os.path.join(path, '*.json'))) if os.path.isdir(path) else [path])
+    fixtures = []
+    for file in files:
+        with open(file) as f:
+            fixture = json.load(f)
+        if not isinstance(fixture, dict) or 'event' not in fixture:
+            continue
+        if 'body' in fixture:
+            fixture['payload'] = json.loads(fixture['body'])
+        elif 'payload' in fixture:
+            fixture['body'] = json.dumps(fixture['payload'])
+        else:
+            continue
+        fixtures.append(dict(fixture, file=file))
+    return fixtures
+
+
+def main():
+    """Main execution function"""
+    # Imported here so parsing and signature checks stay free of the tracker's dependencies
+    from advanced_contribution_tracker import AdvancedContributionTracker
+
+    parser = argparse.ArgumentParser(description='Ingest recorded GitHub webhook payloads into the contribution store')
+    parser.add_argument('fixtures', nargs='+', help='Fixture files or directories of them')
+    parser.add_argument('--store', type=str, metavar='PATH', help='Contribution store to update (default: the trackers\' store in CACHE/)')
+    parser.add_argument('--days', type=int, help='Re-score affected users over the last N days (default: since the earliest ingested day)')
+    parser.add_argument('--secret', type=str, default=WEBHOOK_SECRET, help='Require valid X-Hub-Signature-256 headers (default: GITHUB_WEBHOOK_SECRET)')
+    args = parser.parse_args()
+
+    tracker = AdvancedContributionTracker('')
+    store = ContributionStore(args.store) if args.store else tracker.contribution_store
+    ingestor = WebhookIngestor(store, tracker.load_users_config())
+
+    counted: List[ContributionFact] = []
+    for fixture in load_fixtures(args.fixtures):
+        name = f"{fixture['event']} ({fixture.get('delivery') or os.path.basename(fixture['file'])})"
+        if args.secret:
+            signature = (fixture.get('headers') or {}).get(SIGNATURE_HEADER)
+            if not verify_signature(args.secret, fixture['body'].encode(), signature):
+                print(f"❌ {name}: invalid or missing signature, skipped")
+                continue
+        try:
+            facts = ingestor.ingest(fixture['event'], fixture['payload'])
+        except ValueError as e:
+            print(f"❌ {name}: {e}")
+            continue
+        found = len(parse_event(fixture['event'], fixture['payload']))
+        print(f"📥 {name}: {len(facts)} counted, {found - len(facts)} ignored (duplicate or unconfigured user)")
+        counted.extend(facts)
+
+    by_user = affected_users(counted)
+    if not by_user:
+        print("No contributions counted.")
+        return
+
+    # Only the users these deliveries touched are re-scored
+    last_day = datetime.now(timezone.utc).date()  # Facts are bucketed by UTC day
+    first_day = last_day - timedelta(days=args.days) if args.days else min(fact.day for fact in counted)
+    users = tracker.load_users_config()
+    print(f"\n🔄 Re-scored {len(by_user)} affected users ({first_day} to {last_day}):")
+    print(f"{'Username':<20} {'Commits':<8} {'PRs':<5} {'Merged':<7} {'Reviews':<8} {'Comments':<9} {'Score':<7}")
+    print("-" * 70)
+    for username in sorted(by_user):
+        metrics = tracker.metrics_from_daily_counts(username, users[username],
+                                                    store.sum_range(username, first_day, last_day))
+        metrics = tracker.calculate_gamification_scores(metrics)
+        print(f"{username:<20} {metrics.commits_count:<8} {metrics.prs_opened:<5} {metrics.prs_merged:<7} "
+              f"{metrics.reviews_given:<8} {metrics.review_comments:<9} {metrics.total_score:<7.1f}")
+
+
+if __name__ == "__main__":
+    main()